@@ -0,0 +1,125 @@
+"""
+ASV benchmarks for irradiance.py
+"""
+
+import numpy as np
+import pandas as pd
+
+from pvlib import irradiance
+
+
+class Dirint(object):
+
+    def setup(self):
+        # a year of 1-minute data
+        self.times = pd.date_range(start='20160101', freq='1min',
+                                   periods=525600, tz='UTC')
+        rng = np.random.RandomState(0)
+        self.ghi = pd.Series(rng.uniform(0, 1000, 525600), index=self.times)
+        self.zenith = pd.Series(rng.uniform(0, 90, 525600),
+                                index=self.times)
+        self.temp_dew = pd.Series(rng.uniform(-10, 30, 525600),
+                                  index=self.times)
+
+    def time_dirint(self):
+        irradiance.dirint(self.ghi, self.zenith, self.times)
+
+    def time_dirint_temp_dew(self):
+        irradiance.dirint(self.ghi, self.zenith, self.times,
+                          temp_dew=self.temp_dew)
+
+    def time_disc(self):
+        irradiance.disc(self.ghi, self.zenith, self.times)
+
+
+class Perez(object):
+
+    def setup(self):
+        self.times = pd.date_range(start='20160101', freq='1h',
+                                   periods=8760, tz='UTC')
+        rng = np.random.RandomState(0)
+        self.dhi = pd.Series(rng.uniform(0, 400, 8760), index=self.times)
+        self.dni = pd.Series(rng.uniform(0, 1000, 8760), index=self.times)
+        self.solar_zenith = pd.Series(rng.uniform(0, 90, 8760),
+                                      index=self.times)
+        self.solar_azimuth = pd.Series(rng.uniform(0, 360, 8760),
+                                       index=self.times)
+        self.airmass = pd.Series(rng.uniform(1, 10, 8760), index=self.times)
+
+    def time_perez(self):
+        irradiance.perez(30, 180, self.dhi, self.dni, 1367.,
+                         self.solar_zenith, self.solar_azimuth,
+                         self.airmass)
+
+    def time_perez_arrays(self):
+        irradiance.perez(30, 180, self.dhi.values, self.dni.values, 1367.,
+                         self.solar_zenith.values, self.solar_azimuth.values,
+                         self.airmass.values)
+
+
+class TotalIrradGrid(object):
+
+    params = ['isotropic', 'haydavies', 'perez']
+    param_names = ['model']
+
+    def setup(self, model):
+        self.times = pd.date_range(start='20160101', freq='1h',
+                                   periods=8760, tz='UTC')
+        rng = np.random.RandomState(0)
+        self.apparent_zenith = pd.Series(rng.uniform(0, 90, 8760),
+                                         index=self.times)
+        self.azimuth = pd.Series(rng.uniform(0, 360, 8760), index=self.times)
+        self.dni = pd.Series(rng.uniform(0, 1000, 8760), index=self.times)
+        self.dhi = pd.Series(rng.uniform(0, 300, 8760), index=self.times)
+        self.ghi = self.dhi + self.dni * np.cos(
+            np.radians(self.apparent_zenith))
+        self.dni_extra = pd.Series(irradiance.extraradiation(self.times),
+                                   index=self.times)
+        self.airmass = 1 / np.cos(np.radians(self.apparent_zenith))
+        # 19 tilts by 19 azimuths
+        tilts, azimuths = np.meshgrid(np.arange(0, 91, 5.),
+                                      np.arange(90, 271, 10.))
+        self.surface_tilts = tilts.ravel()
+        self.surface_azimuths = azimuths.ravel()
+
+    def time_total_irrad_loop(self, model):
+        for tilt, azimuth in zip(self.surface_tilts, self.surface_azimuths):
+            irradiance.total_irrad(tilt, azimuth, self.apparent_zenith,
+                                   self.azimuth, self.dni, self.ghi,
+                                   self.dhi, self.dni_extra, self.airmass,
+                                   model=model)
+
+    def time_total_irrad_grid(self, model):
+        irradiance.total_irrad_grid(self.surface_tilts,
+                                    self.surface_azimuths,
+                                    self.apparent_zenith, self.azimuth,
+                                    self.dni, self.ghi, self.dhi,
+                                    self.dni_extra, self.airmass,
+                                    model=model)
+
+    def time_total_irrad_grid_energy(self, model):
+        irradiance.total_irrad_grid(self.surface_tilts,
+                                    self.surface_azimuths,
+                                    self.apparent_zenith, self.azimuth,
+                                    self.dni, self.ghi, self.dhi,
+                                    self.dni_extra, self.airmass,
+                                    model=model, energy=True)
+
+
+class Extraradiation(object):
+
+    params = ['spencer', 'nrel']
+    param_names = ['method']
+
+    def setup(self, method):
+        # a year of 1-minute data
+        self.times = pd.date_range(start='20160101', freq='1min',
+                                   periods=525600, tz='US/Arizona')
+        irradiance.extraradiation(self.times, method=method)
+
+    def time_extraradiation(self, method):
+        irradiance._extraradiation_cache.clear()
+        irradiance.extraradiation(self.times, method=method)
+
+    def time_extraradiation_cached(self, method):
+        irradiance.extraradiation(self.times, method=method)
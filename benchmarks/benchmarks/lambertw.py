@@ -0,0 +1,28 @@
+"""
+ASV benchmarks for lambertw.py
+"""
+
+import numpy as np
+
+from pvlib import lambertw
+
+
+class LambertW(object):
+
+    def setup(self):
+        rng = np.random.RandomState(0)
+        self.z_negative = rng.uniform(-10, 10, 100000)
+        self.z_real = rng.uniform(-np.exp(-1), 50, 100000)
+
+    def time_lambertw_negative(self):
+        lambertw.lambertw(self.z_negative)
+
+    def time_lambertw_real(self):
+        lambertw.lambertw_real(self.z_real)
+
+    def time_scipy_lambertw_negative(self):
+        try:
+            from scipy.special import lambertw as scipy_lambertw
+        except ImportError:
+            raise NotImplementedError('scipy not installed')
+        scipy_lambertw(self.z_negative)
@@ -0,0 +1,31 @@
+"""
+ASV benchmarks for modelchain.py
+"""
+
+import pandas as pd
+
+from pvlib import modelchain
+from pvlib.location import Location
+
+
+class OptimizeOrientation(object):
+
+    params = ['isotropic', 'haydavies', 'perez']
+    param_names = ['model']
+
+    def setup(self, model):
+        self.location = Location(32.2, -111, altitude=700, tz='US/Arizona')
+        times = pd.date_range(start='20160101', end='20170101', freq='1h',
+                              closed='left', tz=self.location.tz)
+        self.solar_position = self.location.get_solarposition(times)
+        self.weather = self.location.get_clearsky(
+            times, solar_position=self.solar_position, linke_turbidity=3)
+
+    def time_optimize_orientation(self, model):
+        modelchain.optimize_orientation(self.location, self.weather,
+                                        model=model)
+
+    def time_optimize_orientation_solar_position(self, model):
+        modelchain.optimize_orientation(self.location, self.weather,
+                                        model=model,
+                                        solar_position=self.solar_position)
@@ -0,0 +1,218 @@
+"""
+ASV benchmarks for pvsystem.py
+"""
+
+import numpy as np
+import pandas as pd
+
+from pvlib import pvsystem
+
+
+class SingleDiode(object):
+
+    params = [1, 10]
+    param_names = ['n_modules']
+
+    def setup(self, n_modules):
+        module = pvsystem.retrieve_sam('cecmod')['Canadian_Solar_CS5P_220M']
+        times = pd.date_range(start='20160101', freq='1h', periods=8760)
+        # a year of hourly conditions for each module, one after another
+        rng = np.random.RandomState(0)
+        n = len(times) * n_modules
+        poa = np.clip(rng.uniform(-200, 1100, n), 0, None)
+        temp_cell = rng.uniform(-10, 70, n)
+        self.sd_params = [np.asarray(p) for p in pvsystem.calcparams_desoto(
+            poa, temp_cell, module['alpha_sc'], module, 1.121, -0.0002677)]
+
+    def time_singlediode_golden(self, n_modules):
+        pvsystem.singlediode(*self.sd_params)
+
+    def time_singlediode_newton(self, n_modules):
+        pvsystem.singlediode(*self.sd_params, method='newton')
+
+
+
+def _year_of_sd_params():
+    module = pvsystem.retrieve_sam('cecmod')['Canadian_Solar_CS5P_220M']
+    rng = np.random.RandomState(0)
+    poa = rng.uniform(0, 1100, 8760)
+    temp_cell = rng.uniform(-10, 70, 8760)
+    return [np.asarray(p) for p in pvsystem.calcparams_desoto(
+        poa, temp_cell, module['alpha_sc'], module, 1.121, -0.0002677)]
+
+
+class IVCurvePoints(object):
+
+    def setup(self):
+        self.sd_params = _year_of_sd_params()
+
+    def time_singlediode_ivcurve_pnts(self):
+        pvsystem.singlediode(*self.sd_params, ivcurve_pnts=100)
+
+    def peakmem_singlediode_ivcurve_pnts(self):
+        pvsystem.singlediode(*self.sd_params, ivcurve_pnts=100)
+
+
+class IVCurves(object):
+
+    params = ['linear', 'knee']
+    param_names = ['spacing']
+
+    def setup(self, spacing):
+        self.sd_params = _year_of_sd_params()
+
+    def time_singlediode_ivcurves(self, spacing):
+        for v, i in pvsystem.singlediode_ivcurves(*self.sd_params,
+                                                  ivcurve_pnts=100,
+                                                  spacing=spacing):
+            pass
+
+    def peakmem_singlediode_ivcurves(self, spacing):
+        for v, i in pvsystem.singlediode_ivcurves(*self.sd_params,
+                                                  ivcurve_pnts=100,
+                                                  spacing=spacing):
+            pass
+
+
+class SingleDiodeTable(object):
+
+    def setup(self):
+        module = pvsystem.retrieve_sam('cecmod')['Canadian_Solar_CS5P_220M']
+        self.module = module.copy()
+        self.module['EgRef'] = 1.121
+        self.module['dEgdT'] = -0.0002677
+        rng = np.random.RandomState(0)
+        self.poa = np.clip(rng.uniform(-200, 1100, 8760), 0, None)
+        self.temp_cell = rng.uniform(-10, 70, 8760)
+        self.table = pvsystem.singlediode_table(self.module)
+
+    def time_singlediode_table_build(self):
+        pvsystem._SINGLEDIODE_TABLES.clear()
+        pvsystem.singlediode_table(self.module)
+
+    def time_singlediode_from_table(self):
+        pvsystem.singlediode_from_table(self.table, self.poa,
+                                        self.temp_cell)
+
+    def time_singlediode_exact(self):
+        pvsystem.singlediode(*pvsystem.calcparams_desoto(
+            self.poa, self.temp_cell, self.module['alpha_sc'], self.module,
+            1.121, -0.0002677), method='newton')
+
+
+class SingleDiodeDesoto(object):
+
+    params = ['numpy', 'numba']
+    param_names = ['how']
+
+    def setup(self, how):
+        if how == 'numba':
+            try:
+                import numba
+            except ImportError:
+                raise NotImplementedError
+        module = pvsystem.retrieve_sam('cecmod')['Canadian_Solar_CS5P_220M']
+        self.module = module
+        rng = np.random.RandomState(0)
+        self.poa = np.clip(rng.uniform(-200, 1100, 8760), 0, None)
+        self.temp_cell = rng.uniform(-10, 70, 8760)
+        # compile outside of the timing
+        pvsystem.singlediode_desoto(800, 25, module['alpha_sc'], module,
+                                    1.121, -0.0002677, how=how)
+
+    def time_singlediode_desoto(self, how):
+        pvsystem.singlediode_desoto(self.poa, self.temp_cell,
+                                    self.module['alpha_sc'], self.module,
+                                    1.121, -0.0002677, how=how)
+
+    def peakmem_singlediode_desoto(self, how):
+        pvsystem.singlediode_desoto(self.poa, self.temp_cell,
+                                    self.module['alpha_sc'], self.module,
+                                    1.121, -0.0002677, how=how)
+
+
+class SingleDiodeChunked(object):
+
+    params = [None, 10000]
+    param_names = ['chunksize']
+
+    def setup(self, chunksize):
+        self.sd_params = _year_of_sd_params()
+        # a year of 1-minute data, built from the hourly parameters
+        self.sd_params = [np.tile(np.broadcast_to(p, (8760,)), 60)
+                          for p in self.sd_params]
+
+    def time_singlediode(self, chunksize):
+        pvsystem.singlediode(*self.sd_params, method='newton',
+                             chunksize=chunksize)
+
+    def peakmem_singlediode(self, chunksize):
+        pvsystem.singlediode(*self.sd_params, method='newton',
+                             chunksize=chunksize)
+
+
+class InverterBatch(object):
+
+    def setup(self):
+        inverters = pvsystem.retrieve_sam('cecinverter')
+        self.inverters = inverters[inverters.columns[:200]].T
+        rng = np.random.RandomState(0)
+        shape = (8760, len(self.inverters))
+        self.p_dc = (rng.uniform(0, 1, (8760, 1)) *
+                     self.inverters['Pdco'].values)
+        self.v_dc = (rng.uniform(0.9, 1.1, (8760, 1)) *
+                     self.inverters['Vdco'].values)
+        self.out = np.empty(shape)
+
+    def time_snlinverter(self):
+        pvsystem.snlinverter(self.v_dc, self.p_dc, self.inverters)
+
+    def time_snlinverter_out(self):
+        pvsystem.snlinverter(self.v_dc, self.p_dc, self.inverters,
+                             out=self.out)
+
+    def time_pvwatts_ac(self):
+        pvsystem.pvwatts_ac(self.p_dc, self.inverters['Pdco'].values)
+
+    def time_pvwatts_ac_out(self):
+        pvsystem.pvwatts_ac(self.p_dc, self.inverters['Pdco'].values,
+                            out=self.out)
+
+
+class InverterLibrary(object):
+
+    def setup(self):
+        self.inverters = pvsystem.retrieve_sam('cecinverter')
+        times = pd.date_range(start='20160101', freq='1h', periods=8760)
+        rng = np.random.RandomState(0)
+        self.p_dc = pd.Series(rng.uniform(0, 5000, 8760), index=times)
+        self.v_dc = pd.Series(rng.uniform(200, 400, 8760), index=times)
+
+    def time_snlinverter_loop(self):
+        for k in range(self.inverters.shape[1]):
+            pvsystem.snlinverter(self.v_dc, self.p_dc,
+                                 self.inverters.iloc[:, k]).sum()
+
+    def time_snlinverter_batch_energy(self):
+        pvsystem.snlinverter_batch(self.v_dc, self.p_dc, self.inverters,
+                                   energy=True)
+
+    def peakmem_snlinverter_batch_energy(self):
+        pvsystem.snlinverter_batch(self.v_dc, self.p_dc, self.inverters,
+                                   energy=True)
+
+
+class RetrieveSAM(object):
+
+    def setup(self):
+        pvsystem.retrieve_sam('cecmod')
+
+    def time_parse_raw_sam_df(self):
+        pvsystem._SAM_TABLES.clear()
+        pvsystem.retrieve_sam('cecmod')
+
+    def time_retrieve_sam_cached(self):
+        pvsystem.retrieve_sam('cecmod')
+
+    def time_retrieve_sam_entry(self):
+        pvsystem.retrieve_sam_entry('Example_Module', 'cecmod')
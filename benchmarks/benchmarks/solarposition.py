@@ -0,0 +1,74 @@
+"""
+ASV benchmarks for solarposition.py
+"""
+
+import numpy as np
+import pandas as pd
+
+from pvlib import solarposition
+
+
+class SolarPosition(object):
+
+    def setup(self):
+        self.times = pd.date_range(start='20180601', freq='1min',
+                                   periods=14400, tz='UTC')
+        self.lat = 35.1
+        self.lon = -106.6
+
+    def time_spa_python(self):
+        solarposition.spa_python(self.times, self.lat, self.lon)
+
+    def time_spa_python_interp(self):
+        solarposition.spa_python(self.times, self.lat, self.lon,
+                                 anchor_freq='5min')
+
+
+class SunRiseSetTransit(object):
+
+    def setup(self):
+        self.times = pd.date_range(start='20000101', end='20091231',
+                                   freq='D', tz='UTC')
+        self.lats = np.linspace(-60, 60, 1000)
+        self.lons = np.linspace(-180, 180, 1000)
+
+    def time_get_sun_rise_set_transit_multi(self):
+        solarposition.get_sun_rise_set_transit_multi(self.times, self.lats,
+                                                     self.lons)
+
+    def time_get_sun_rise_set_transit_single_site(self):
+        solarposition.get_sun_rise_set_transit(self.times, self.lats[0],
+                                               self.lons[0])
+
+
+class CalcTimes(object):
+
+    def setup(self):
+        self.days = pd.date_range(start='20160101', end='20161231',
+                                  freq='D', tz='Etc/GMT+7')
+        self.noon = self.days + pd.Timedelta('12h')
+        self.lat = 32.2
+        self.lon = -111
+
+    def time_calc_times_elevation(self):
+        solarposition.calc_times(self.days, self.noon, self.lat, self.lon,
+                                 'apparent_elevation', 10)
+
+
+class PyEphem(object):
+
+    def setup(self):
+        try:
+            import ephem
+        except ImportError:
+            raise NotImplementedError('PyEphem not installed')
+        self.times = pd.date_range(start='20180601', freq='1min',
+                                   periods=10080, tz='UTC')
+        self.lat = 35.1
+        self.lon = -106.6
+
+    def time_pyephem(self):
+        solarposition.pyephem(self.times, self.lat, self.lon)
+
+    def time_pyephem_earthsun_distance(self):
+        solarposition.pyephem_earthsun_distance(self.times)
@@ -0,0 +1,47 @@
+"""
+ASV benchmarks for spa.py
+"""
+
+import numpy as np
+import pandas as pd
+
+from pvlib import solarposition
+
+
+class PeriodicTerms(object):
+    """Row by row and matrix evaluation of the SPA periodic terms for a
+    year of 1-minute data."""
+
+    def setup(self):
+        self.spa = solarposition._spa_python_import('numpy')
+        times = pd.date_range(start='20180601', freq='1min',
+                              periods=525600, tz='UTC')
+        unixtime = np.asarray(times.astype(np.int64)/10**9)
+        jd = self.spa.julian_day(unixtime)
+        jde = self.spa.julian_ephemeris_day(jd, 67.0)
+        self.jce = self.spa.julian_ephemeris_century(jde)
+        self.jme = self.spa.julian_ephemeris_millennium(self.jce)
+        self.x = (self.spa.mean_elongation(self.jce),
+                  self.spa.mean_anomaly_sun(self.jce),
+                  self.spa.mean_anomaly_moon(self.jce),
+                  self.spa.moon_argument_latitude(self.jce),
+                  self.spa.moon_ascending_longitude(self.jce))
+
+    def time_heliocentric_longitude(self):
+        self.spa.heliocentric_longitude(self.jme)
+
+    def time_heliocentric_longitude_matrix(self):
+        self.spa.heliocentric_longitude_matrix(self.jme)
+
+    def time_heliocentric_radius_vector(self):
+        self.spa.heliocentric_radius_vector(self.jme)
+
+    def time_heliocentric_radius_vector_matrix(self):
+        self.spa.heliocentric_radius_vector_matrix(self.jme)
+
+    def time_nutation(self):
+        self.spa.longitude_nutation(self.jce, *self.x)
+        self.spa.obliquity_nutation(self.jce, *self.x)
+
+    def time_nutation_matrix(self):
+        self.spa.nutation_matrix(self.jce, *self.x)
@@ -6,6 +6,8 @@ to calculate clear sky GHI, DNI, and DHI.
 from __future__ import division
 
 import os
+import hashlib
+import warnings
 from collections import OrderedDict
 
 import numpy as np
@@ -155,6 +157,9 @@ def lookup_linke_turbidity(time, latitude, longitude, filepath=None,
     Look up the Linke Turibidity from the ``LinkeTurbidities.mat``
     data file supplied with pvlib.
 
+    The table is loaded only once per process. See
+    :py:func:`load_linke_turbidity_table` for details.
+
     Parameters
     ----------
     time : pandas.DatetimeIndex
@@ -164,7 +169,7 @@ def lookup_linke_turbidity(time, latitude, longitude, filepath=None,
     longitude : float
 
     filepath : string
-        The path to the ``.mat`` file.
+        The path to the ``.mat`` or ``.npy`` file.
 
     interp_turbidity : bool
         If ``True``, interpolates the monthly Linke turbidity values
@@ -173,6 +178,10 @@ def lookup_linke_turbidity(time, latitude, longitude, filepath=None,
     Returns
     -------
     turbidity : Series
+
+    See also
+    --------
+    lookup_linke_turbidities
     """
 
     # The .mat file 'LinkeTurbidities.mat' contains a single 2160 x 4320 x 12
@@ -186,19 +195,197 @@ def lookup_linke_turbidity(time, latitude, longitude, filepath=None,
     # so divide the number from the file by 20 to get the
     # turbidity.
 
-    try:
-        import scipy.io
-    except ImportError:
-        raise ImportError('The Linke turbidity lookup table requires scipy. ' +
-                          'You can still use clearsky.ineichen if you ' +
-                          'supply your own turbidities.')
+    linke_turbidity_table = load_linke_turbidity_table(filepath)
+
+    latitude_index, longitude_index = _linke_turbidity_index(latitude,
+                                                             longitude)
+
+    g = linke_turbidity_table[latitude_index, longitude_index]
+
+    if interp_turbidity:
+        linke_turbidity = _interpolate_turbidity(g, time)
+    else:
+        # apply monthly data
+        linke_turbidity = g[time.month - 1]
+
+    linke_turbidity = pd.Series(linke_turbidity / 20., index=time)
+
+    return linke_turbidity
+
+
+def lookup_linke_turbidities(times, latitudes, longitudes, filepath=None,
+                             interp_turbidity=True):
+    """
+    Look up the Linke Turibidity for many sites at once.
+
+    The pixels of all sites are fetched from the table in a single
+    indexing operation and the monthly values are interpolated for
+    all sites in one pass. The results are identical to calling
+    :py:func:`lookup_linke_turbidity` for each site.
+
+    Parameters
+    ----------
+    times : pandas.DatetimeIndex
+
+    latitudes : array-like
+        Site latitudes in decimal degrees.
+
+    longitudes : array-like
+        Site longitudes in decimal degrees. Must be the same length
+        as ``latitudes``.
+
+    filepath : string
+        The path to the ``.mat`` or ``.npy`` file.
+
+    interp_turbidity : bool
+        If ``True``, interpolates the monthly Linke turbidity values
+        found in ``LinkeTurbidities.mat`` to daily values.
+
+    Returns
+    -------
+    turbidity : DataFrame
+        Linke turbidity with index ``times`` and one column per site.
+        Columns are numbered in the order of ``latitudes``.
+
+    See also
+    --------
+    lookup_linke_turbidity
+    """
+
+    latitudes = np.atleast_1d(np.asarray(latitudes, dtype=np.float64))
+    longitudes = np.atleast_1d(np.asarray(longitudes, dtype=np.float64))
+    if latitudes.shape != longitudes.shape:
+        raise ValueError('latitudes and longitudes must have the same shape')
+
+    linke_turbidity_table = load_linke_turbidity_table(filepath)
+
+    latitude_index, longitude_index = _linke_turbidity_index(latitudes,
+                                                             longitudes)
+
+    # shape (number of sites, 12)
+    g = linke_turbidity_table[latitude_index, longitude_index]
+
+    if interp_turbidity:
+        linke_turbidity = _interpolate_turbidity(g, times)
+    else:
+        linke_turbidity = g[:, times.month - 1].T
+
+    linke_turbidity = pd.DataFrame(linke_turbidity / 20., index=times)
+
+    return linke_turbidity
+
+
+_LINKE_TURBIDITY_TABLES = {}
+
+
+def load_linke_turbidity_table(filepath=None, mmap=True):
+    """
+    Load the Linke turbidity table, caching it for the life of the
+    process.
+
+    If the ``PVLIB_LINKE_TURBIDITY_CACHE`` environment variable names a
+    directory, the first time a ``LinkeTurbidities.mat`` file is read an
+    uncompressed copy of its ``LinkeTurbidity`` matrix is written to that
+    directory as a ``.npy`` file. Subsequent loads, including those in
+    new processes, memory map the ``.npy`` file so that only the pixels
+    that are looked up are read from disk. If the directory cannot be
+    written, the table is only kept in memory.
+
+    Parameters
+    ----------
+    filepath : None or string
+        The path to the ``.mat`` or ``.npy`` file. If None, the
+        ``LinkeTurbidities.mat`` file supplied with pvlib is used.
+
+    mmap : bool
+        If ``True``, memory map the ``.npy`` file instead of reading it
+        into memory.
+
+    Returns
+    -------
+    table : uint8 array of shape (2160, 4320, 12)
+        20 times the monthly Linke turbidity. See
+        :py:func:`lookup_linke_turbidity`.
+    """
 
     if filepath is None:
         pvlib_path = os.path.dirname(os.path.abspath(__file__))
         filepath = os.path.join(pvlib_path, 'data', 'LinkeTurbidities.mat')
+    filepath = os.path.abspath(filepath)
+
+    key = (filepath, mmap)
+    try:
+        return _LINKE_TURBIDITY_TABLES[key]
+    except KeyError:
+        pass
+
+    mmap_mode = 'r' if mmap else None
+
+    if os.path.splitext(filepath)[1] == '.npy':
+        table = np.load(filepath, mmap_mode=mmap_mode)
+    else:
+        table = None
+        cache_dir = os.getenv('PVLIB_LINKE_TURBIDITY_CACHE')
+        if cache_dir:
+            # one cache file per source file, so that tables from
+            # different .mat files never replace each other
+            name = hashlib.sha1(filepath.encode('utf-8')).hexdigest()[:16]
+            npy_filepath = os.path.join(
+                cache_dir, 'LinkeTurbidities-{}.npy'.format(name))
+            if (os.path.exists(npy_filepath) and
+                    os.path.getmtime(npy_filepath) >=
+                    os.path.getmtime(filepath)):
+                try:
+                    table = np.load(npy_filepath, mmap_mode=mmap_mode)
+                except (ValueError, IOError, OSError):
+                    # unreadable cache file, read the .mat file again and
+                    # replace it
+                    table = None
+
+        if table is None:
+            table = _read_linke_turbidity_mat(filepath)
+            if cache_dir:
+                _write_linke_turbidity_npy(table, npy_filepath)
+                if mmap:
+                    try:
+                        table = np.load(npy_filepath, mmap_mode=mmap_mode)
+                    except (ValueError, IOError, OSError):
+                        pass
+
+    _LINKE_TURBIDITY_TABLES[key] = table
+
+    return table
+
+
+def _read_linke_turbidity_mat(filepath):
+    """Read the LinkeTurbidity matrix from a .mat file."""
+    try:
+        import scipy.io
+    except ImportError:
+        raise ImportError('The Linke turbidity lookup table requires ' +
+                          'scipy. You can still use clearsky.ineichen ' +
+                          'if you supply your own turbidities.')
 
     mat = scipy.io.loadmat(filepath)
-    linke_turbidity_table = mat['LinkeTurbidity']
+    return mat['LinkeTurbidity']
+
+
+def _write_linke_turbidity_npy(table, npy_filepath):
+    """
+    Write table to npy_filepath. Failures only raise a warning.
+    """
+    try:
+        cache_dir = os.path.dirname(npy_filepath)
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        tools._atomic_write(npy_filepath, lambda path: np.save(path, table))
+    except (IOError, OSError) as e:
+        warnings.warn('could not write Linke turbidity cache {}: {}'
+                      .format(npy_filepath, e))
+
+
+def _linke_turbidity_index(latitude, longitude):
+    """ used by linke turbidity lookup functions """
 
     latitude_index = (
         np.around(_linearly_scale(latitude, 90, -90, 1, 2160))
@@ -207,29 +394,39 @@ def lookup_linke_turbidity(time, latitude, longitude, filepath=None,
         np.around(_linearly_scale(longitude, -180, 180, 1, 4320))
         .astype(np.int64))
 
-    g = linke_turbidity_table[latitude_index][longitude_index]
+    return latitude_index, longitude_index
 
-    if interp_turbidity:
-        # Data covers 1 year.
-        # Assume that data corresponds to the value at
-        # the middle of each month.
-        # This means that we need to add previous Dec and next Jan
-        # to the array so that the interpolation will work for
-        # Jan 1 - Jan 15 and Dec 16 - Dec 31.
-        # Then we map the month value to the day of year value.
-        # This is approximate and could be made more accurate.
-        g2 = np.concatenate([[g[-1]], g, [g[0]]])
-        days = np.linspace(-15, 380, num=14)
-        linke_turbidity = pd.Series(np.interp(time.dayofyear, days, g2),
-                                    index=time)
-    else:
-        linke_turbidity = pd.DataFrame(time.month, index=time)
-        # apply monthly data
-        linke_turbidity = linke_turbidity.apply(lambda x: g[x[0]-1], axis=1)
 
-    linke_turbidity /= 20.
+def _interpolate_turbidity(g, time):
+    """
+    Interpolate monthly turbidity values ``g`` to the day of year of
+    ``time``. ``g`` may have shape (12, ) or (number of sites, 12). The
+    output has shape (len(time), ) or (len(time), number of sites).
+    """
 
-    return linke_turbidity
+    # Data covers 1 year.
+    # Assume that data corresponds to the value at
+    # the middle of each month.
+    # This means that we need to add previous Dec and next Jan
+    # to the array so that the interpolation will work for
+    # Jan 1 - Jan 15 and Dec 16 - Dec 31.
+    # Then we map the month value to the day of year value.
+    # This is approximate and could be made more accurate.
+    g = np.asarray(g, dtype=np.float64)
+    g2 = np.concatenate([g[..., -1:], g, g[..., :1]], axis=-1)
+    days = np.linspace(-15, 380, num=14)
+
+    # the nodes are evenly spaced, so the bracketing node and the
+    # interpolation weight follow directly from the day of year.
+    # equivalent to np.interp(time.dayofyear, days, g2) for each site.
+    position = (np.asarray(time.dayofyear) - days[0]) / (days[1] - days[0])
+    lower = np.clip(np.floor(position).astype(np.int64), 0, len(days) - 2)
+    weight = position - lower
+
+    interpolated = (g2[..., lower] * (1 - weight) +
+                    g2[..., lower + 1] * weight)
+
+    return interpolated.T
 
 
 def haurwitz(apparent_zenith):
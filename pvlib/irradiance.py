@@ -70,6 +70,13 @@ def extraradiation(datetime_or_doy, solar_constant=1366.1, method='spencer',
         DatetimeIndex inputs will yield a Pandas TimeSeries. All other
         inputs will yield a float or an array of floats.
 
+    Notes
+    -----
+    Results for DatetimeIndex inputs are cached, so repeated calls with
+    the same times, as made by :py:class:`pvlib.modelchain.ModelChain`,
+    :py:func:`disc`, :py:func:`dirint` and :py:func:`erbs`, compute
+    them only once.
+
     References
     ----------
     [1] M. Reno, C. Hansen, and J. Stein, "Global Horizontal Irradiance
@@ -86,6 +93,16 @@ def extraradiation(datetime_or_doy, solar_constant=1366.1, method='spencer',
     Thermal Processes, 2nd edn. J. Wiley and Sons, New York.
     """
 
+    # results for DatetimeIndexes are cached, so that the many functions
+    # that need dni_extra for the same times compute it once
+    key = None
+    if isinstance(datetime_or_doy, pd.DatetimeIndex):
+        key = tools._hash_key((datetime_or_doy, solar_constant,
+                               method.lower(), kwargs))
+        Ea = _extraradiation_cache.get(key)
+        if Ea is not None:
+            return pd.Series(Ea.copy(), index=datetime_or_doy)
+
     # This block will set the functions that can be used to convert the
     # inputs to either day of year or pandas DatetimeIndex, and the
     # functions that will yield the appropriate output type. It's
@@ -138,11 +155,19 @@ def extraradiation(datetime_or_doy, solar_constant=1366.1, method='spencer',
 
     Ea = solar_constant * RoverR0sqrd
 
+    if key is not None:
+        values = np.array(Ea, dtype=np.float64)
+        _extraradiation_cache.set(key, values, values.nbytes)
+
     Ea = to_output(Ea)
 
     return Ea
 
 
+# dni_extra of recently used DatetimeIndexes, see extraradiation
+_extraradiation_cache = tools.LRUCache(16 * 2**20)
+
+
 def aoi_projection(surface_tilt, surface_azimuth, solar_zenith, solar_azimuth):
     """
     Calculates the dot product of the solar vector and the surface
@@ -386,6 +411,261 @@ def total_irrad(surface_tilt, surface_azimuth,
     return all_irrad
 
 
+def total_irrad_grid(surface_tilts, surface_azimuths,
+                     apparent_zenith, azimuth,
+                     dni, ghi, dhi, dni_extra=None, airmass=None,
+                     albedo=.25, surface_type=None,
+                     model='isotropic',
+                     model_perez='allsitescomposite1990', energy=False):
+    r"""
+    Determine the plane of array irradiance for many surface
+    orientations at once.
+
+    Equivalent to calling :py:func:`total_irrad` for each pair of
+    ``surface_tilts`` and ``surface_azimuths``, but the terms of the sky
+    diffuse models that do not depend on the orientation, such as the
+    Perez F1 and F2 coefficients or the Hay-Davies anisotropy index, are
+    computed only once. The angle of incidence projection of all
+    orientations is computed as a single matrix product.
+
+    Parameters
+    ----------
+    surface_tilts : numeric
+        Panel tilts from horizontal. Broadcast against surface_azimuths
+        to give the orientations.
+    surface_azimuths : numeric
+        Panel azimuths from north.
+    apparent_zenith : numeric
+        Solar zenith angle.
+    azimuth : numeric
+        Solar azimuth angle.
+    dni : numeric
+        Direct Normal Irradiance
+    ghi : numeric
+        Global horizontal irradiance
+    dhi : numeric
+        Diffuse horizontal irradiance
+    dni_extra : numeric
+        Extraterrestrial direct normal irradiance
+    airmass : numeric
+        Airmass
+    albedo : numeric
+        Surface albedo
+    surface_type : String
+        Surface type. See grounddiffuse.
+    model : String
+        Irradiance model.
+    model_perez : String
+        See perez.
+    energy : bool, default False
+        If True, return the irradiation of each orientation instead of
+        the irradiance at each time. Orientations are evaluated in
+        blocks, so the (time, orientation) matrices are never held in
+        memory.
+
+    Returns
+    -------
+    irradiance : OrderedDict or DataFrame
+        If energy is False, an OrderedDict with keys ``'poa_global',
+        'poa_direct', 'poa_diffuse', 'poa_sky_diffuse',
+        'poa_ground_diffuse'``. Each value is a DataFrame with one row
+        per time and one column per orientation. The index is the index
+        of the Series inputs, if any, and the columns are a MultiIndex
+        of ``(surface_tilt, surface_azimuth)``. If energy is True, a
+        DataFrame with the same columns as :py:func:`total_irrad` and
+        one row per orientation, holding the sum over time of each
+        component times the time step in hours, in Wh/m^2. The time step
+        is the median spacing of the DatetimeIndex of the inputs, or 1
+        hour otherwise. NaN values are left out of the sums.
+
+    See also
+    --------
+    total_irrad
+    """
+
+    index = None
+    for arg in (apparent_zenith, azimuth, dni, ghi, dhi):
+        if isinstance(arg, pd.Series):
+            index = arg.index
+            break
+
+    if surface_type is not None:
+        albedo = SURFACE_ALBEDOS[surface_type]
+
+    surface_tilts, surface_azimuths = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(surface_tilts, dtype=np.float64)),
+        np.atleast_1d(np.asarray(surface_azimuths, dtype=np.float64)))
+    columns = pd.MultiIndex.from_arrays(
+        [surface_tilts, surface_azimuths],
+        names=['surface_tilt', 'surface_azimuth'])
+
+    model, sun, dni, terms = _total_irrad_grid_terms(
+        apparent_zenith, azimuth, dni, ghi, dhi, dni_extra, airmass,
+        albedo, model, model_perez)
+
+    if energy:
+        if isinstance(index, pd.DatetimeIndex) and len(index) > 1:
+            hours = np.median(np.diff(index.asi8)) / 3.6e12
+        else:
+            hours = 1.
+        totals = _total_irrad_grid_energy(surface_tilts, surface_azimuths,
+                                          sun, dni, terms, model) * hours
+        return pd.DataFrame(totals, index=columns,
+                            columns=['poa_global', 'poa_direct',
+                                     'poa_diffuse', 'poa_sky_diffuse',
+                                     'poa_ground_diffuse'])
+
+    total, beam, diffuse, sky, ground = _total_irrad_grid_block(
+        surface_tilts, surface_azimuths, sun, dni, terms, model)
+
+    all_irrad = OrderedDict()
+    all_irrad['poa_global'] = total
+    all_irrad['poa_direct'] = beam
+    all_irrad['poa_diffuse'] = diffuse
+    all_irrad['poa_sky_diffuse'] = sky
+    all_irrad['poa_ground_diffuse'] = ground
+
+    for key, irrad in all_irrad.items():
+        all_irrad[key] = pd.DataFrame(irrad, index=index, columns=columns)
+
+    return all_irrad
+
+
+def _total_irrad_grid_terms(apparent_zenith, azimuth, dni, ghi, dhi,
+                            dni_extra, airmass, albedo, model, model_perez):
+    """
+    The orientation independent inputs of _total_irrad_grid_block.
+    Returns the normalized model name, the (time, 3) sun vectors, dni
+    as an array and a dict of the terms of the sky diffuse model.
+    """
+    model = model.lower()
+    if model == 'klutcher':
+        model = 'klucher'
+    if model not in ('isotropic', 'klucher', 'haydavies', 'reindl', 'king',
+                     'perez'):
+        raise ValueError('invalid model selection {}'.format(model))
+
+    solar_zenith, solar_azimuth, dni, ghi, dhi = np.broadcast_arrays(
+        *[np.atleast_1d(np.asarray(arg, dtype=np.float64)) for arg in
+          (apparent_zenith, azimuth, dni, ghi, dhi)])
+    albedo = np.asarray(albedo, dtype=np.float64)
+    if dni_extra is not None:
+        dni_extra = np.asarray(dni_extra, dtype=np.float64)
+
+    cos_solar_zenith = tools.cosd(solar_zenith)
+    sin_solar_zenith = tools.sind(solar_zenith)
+
+    # the angle of incidence projection is sun @ surface, with one row
+    # of sun per time and one column of surface per orientation
+    sun = np.column_stack((cos_solar_zenith,
+                           sin_solar_zenith * tools.cosd(solar_azimuth),
+                           sin_solar_zenith * tools.sind(solar_azimuth)))
+
+    # orientation independent terms of the sky diffuse models, as
+    # columns that broadcast against the orientations
+    terms = {'ground': (ghi * albedo * 0.5)[:, np.newaxis]}
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if model in ('isotropic', 'klucher', 'king'):
+            terms['dhi'] = dhi[:, np.newaxis]
+        if model == 'klucher':
+            F = 1 - ((ghi / ghi) ** 2)
+            F[np.isnan(F)] = 0
+            terms['F'] = F[:, np.newaxis]
+            terms['F_sin3'] = (F * sin_solar_zenith ** 3)[:, np.newaxis]
+        elif model in ('haydavies', 'reindl'):
+            AI = dni / dni_extra
+            terms['beam'] = (dhi * AI / cos_solar_zenith)[:, np.newaxis]
+            terms['dome'] = (dhi * (1 - AI))[:, np.newaxis]
+            if model == 'reindl':
+                HB = np.maximum(dni * cos_solar_zenith, 0)
+                terms['horizon'] = np.sqrt(HB / ghi)[:, np.newaxis]
+        elif model == 'king':
+            terms['ghi'] = (ghi * (0.012 * solar_zenith - 0.04))[
+                :, np.newaxis]
+        elif model == 'perez':
+            airmass = np.asarray(airmass, dtype=np.float64)
+            F1, F2 = _perez_f1_f2(dhi, dni, dni_extra, solar_zenith,
+                                  airmass, model_perez)
+            B = np.maximum(cos_solar_zenith, tools.cosd(85))
+            terms['beam'] = (dhi * F1 / B)[:, np.newaxis]
+            terms['dome'] = (dhi * (1 - F1))[:, np.newaxis]
+            terms['horizon'] = (dhi * F2)[:, np.newaxis]
+            # the sky diffuse is 0 where the airmass is nan
+            terms['invalid'] = np.broadcast_arrays(
+                np.isnan(airmass), dhi)[0][:, np.newaxis]
+
+    return model, sun, dni, terms
+
+
+def _total_irrad_grid_energy(surface_tilts, surface_azimuths, sun, dni,
+                             terms, model):
+    """
+    The sums over time of the total_irrad components, with one row per
+    orientation and one column per component.
+    """
+    totals = np.empty((len(surface_tilts), 5))
+    # evaluate blocks of about 2**18 elements, which bounds the size
+    # of the temporary arrays
+    cols = max(2**18 // len(sun), 1)
+    for start in range(0, len(surface_tilts), cols):
+        block = slice(start, start + cols)
+        irrads = _total_irrad_grid_block(
+            surface_tilts[block], surface_azimuths[block], sun, dni,
+            terms, model)
+        for k, irrad in enumerate(irrads):
+            totals[block, k] = np.nansum(irrad, axis=0)
+    return totals
+
+
+def _total_irrad_grid_block(surface_tilts, surface_azimuths, sun, dni,
+                            terms, model):
+    """
+    The (time, orientation) plane of array irradiance components of
+    total_irrad_grid for one block of orientations.
+    """
+    cos_tilt = tools.cosd(surface_tilts)
+    sin_tilt = tools.sind(surface_tilts)
+    surface = np.vstack((cos_tilt,
+                         sin_tilt * tools.cosd(surface_azimuths),
+                         sin_tilt * tools.sind(surface_azimuths)))
+    projection = np.dot(sun, surface)
+
+    beam = np.maximum(dni[:, np.newaxis] * projection, 0)
+
+    sky_dome = 0.5 * (1 + cos_tilt)
+    with np.errstate(invalid='ignore'):
+        if model == 'isotropic':
+            sky = terms['dhi'] * sky_dome
+        elif model == 'klucher':
+            sky = (terms['dhi'] * sky_dome *
+                   (1 + terms['F'] * tools.sind(0.5 * surface_tilts) ** 3) *
+                   (1 + terms['F_sin3'] * projection ** 2))
+        elif model == 'haydavies':
+            sky = np.maximum(terms['beam'] * projection +
+                             terms['dome'] * sky_dome, 0)
+        elif model == 'reindl':
+            sky = np.maximum(
+                terms['beam'] * projection +
+                terms['dome'] * sky_dome *
+                (1 + terms['horizon'] * tools.sind(0.5 * surface_tilts) ** 3),
+                0)
+        elif model == 'king':
+            sky = np.maximum(terms['dhi'] * sky_dome +
+                             terms['ghi'] * (1 - cos_tilt) * 0.5, 0)
+        elif model == 'perez':
+            sky = np.maximum(terms['beam'] * np.maximum(projection, 0) +
+                             terms['dome'] * sky_dome +
+                             terms['horizon'] * sin_tilt, 0)
+            sky = np.where(terms['invalid'], 0, sky)
+
+    ground = terms['ground'] * (1 - cos_tilt)
+
+    diffuse = sky + ground
+    total = beam + diffuse
+
+    return total, beam, diffuse, sky, ground
+
+
 def globalinplane(aoi, dni, poa_sky_diffuse, poa_ground_diffuse):
     r'''
     Determine the three components on in-plane irradiance
@@ -978,73 +1258,107 @@ def perez(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
     Perez Diffuse Radiation Model". SAND88-7030
     '''
 
+    # the output is a Series if any input other than dni is a Series
+    index = None
+    for arg in (dhi, airmass, dni_extra, solar_zenith, solar_azimuth,
+                surface_tilt, surface_azimuth):
+        if isinstance(arg, pd.Series):
+            index = arg.index
+            break
+
+    dhi = np.asarray(dhi, dtype=np.float64)
+    dni = np.asarray(dni, dtype=np.float64)
+    airmass = np.asarray(airmass, dtype=np.float64)
+    solar_zenith = np.asarray(solar_zenith, dtype=np.float64)
+
+    F1, F2 = _perez_f1_f2(dhi, dni, dni_extra, solar_zenith, airmass, model)
+
+    A = aoi_projection(np.asarray(surface_tilt, dtype=np.float64),
+                       np.asarray(surface_azimuth, dtype=np.float64),
+                       solar_zenith,
+                       np.asarray(solar_azimuth, dtype=np.float64))
+    A = np.maximum(A, 0)
+
+    B = np.maximum(tools.cosd(solar_zenith), tools.cosd(85))
+
+    # Calculate Diffuse POA from sky dome. This is
+    # dhi * (term1 + term2 + term3) with
+    # term1 = 0.5 * (1 - F1) * (1 + cosd(surface_tilt)),
+    # term2 = F1 * A / B and term3 = F2 * sind(surface_tilt)
+    # rearranged to evaluate term1 with a single product.
+    sky_dome = 0.5 * (1 + tools.cosd(surface_tilt))
+    sky_diffuse = np.maximum(
+        dhi * (sky_dome + F1 * (A / B - sky_dome) +
+               F2 * tools.sind(surface_tilt)), 0)
+
+    sky_diffuse = np.where(np.isnan(airmass), 0, sky_diffuse)
+
+    # we've preserved the input type until now, so don't ruin it!
+    if index is not None:
+        sky_diffuse = pd.Series(sky_diffuse, index=index)
+
+    return sky_diffuse
+
+
+def _perez_f1_f2(dhi, dni, dni_extra, solar_zenith, airmass, model):
+    """
+    The circumsolar and horizon brightening coefficients F1 and F2 of
+    the Perez model. They do not depend on the surface orientation.
+    dhi, dni, solar_zenith and airmass must be float arrays.
+    """
     kappa = 1.041  # for solar_zenith in radians
     z = np.radians(solar_zenith)  # convert to radians
 
-    # delta is the sky's "brightness"
-    delta = dhi * airmass / dni_extra
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # delta is the sky's "brightness"
+        delta = dhi * airmass / dni_extra
 
-    # epsilon is the sky's "clearness"
-    eps = ((dhi + dni) / dhi + kappa * (z ** 3)) / (1 + kappa * (z ** 3))
-
-    # numpy indexing below will not work with a Series
-    if isinstance(eps, pd.Series):
-        eps = eps.values
+        # epsilon is the sky's "clearness"
+        kappa_z3 = kappa * z * z * z
+        eps = ((dhi + dni) / dhi + kappa_z3) / (1 + kappa_z3)
 
     # Perez et al define clearness bins according to the following
     # rules. 1 = overcast ... 8 = clear (these names really only make
-    # sense for small zenith angles, but...) these values will
-    # eventually be used as indicies for coeffecient look ups
-    ebin = np.zeros_like(eps, dtype=np.int8)
-    ebin[eps < 1.065] = 1
-    ebin[(eps >= 1.065) & (eps < 1.23)] = 2
-    ebin[(eps >= 1.23) & (eps < 1.5)] = 3
-    ebin[(eps >= 1.5) & (eps < 1.95)] = 4
-    ebin[(eps >= 1.95) & (eps < 2.8)] = 5
-    ebin[(eps >= 2.8) & (eps < 4.5)] = 6
-    ebin[(eps >= 4.5) & (eps < 6.2)] = 7
-    ebin[eps >= 6.2] = 8
-
-    # correct for 0 indexing in coeffecient lookup
-    # later, ebin = -1 will yield nan coefficients
-    ebin -= 1
-
-    # The various possible sets of Perez coefficients are contained
-    # in a subfunction to clean up the code.
-    F1c, F2c = _get_perez_coefficients(model)
-
-    # results in invalid eps (ebin = -1) being mapped to nans
-    nans = np.array([np.nan, np.nan, np.nan])
-    F1c = np.vstack((F1c, nans))
-    F2c = np.vstack((F2c, nans))
-
-    F1 = (F1c[ebin, 0] + F1c[ebin, 1] * delta + F1c[ebin, 2] * z)
-    F1 = np.maximum(F1, 0)
-
-    F2 = (F2c[ebin, 0] + F2c[ebin, 1] * delta + F2c[ebin, 2] * z)
-    F2 = np.maximum(F2, 0)
-
-    A = aoi_projection(surface_tilt, surface_azimuth,
-                       solar_zenith, solar_azimuth)
-    A = np.maximum(A, 0)
+    # sense for small zenith angles, but...) these values are used,
+    # 0-indexed, to look up the coefficients. Invalid eps are mapped to
+    # the last row of the coefficient table, which is nan.
+    ebin = np.where(np.isnan(eps), len(_PEREZ_EPS_EDGES) + 1,
+                    np.searchsorted(_PEREZ_EPS_EDGES, eps, side='right'))
 
-    B = tools.cosd(solar_zenith)
-    B = np.maximum(B, tools.cosd(85))
+    coeffs = _get_perez_coefficients_padded(model)[:, ebin]
 
-    # Calculate Diffuse POA from sky dome
-    term1 = 0.5 * (1 - F1) * (1 + tools.cosd(surface_tilt))
-    term2 = F1 * A / B
-    term3 = F2 * tools.sind(surface_tilt)
+    F1 = np.maximum(coeffs[0] + coeffs[1] * delta + coeffs[2] * z, 0)
+    F2 = np.maximum(coeffs[3] + coeffs[4] * delta + coeffs[5] * z, 0)
 
-    sky_diffuse = np.maximum(dhi * (term1 + term2 + term3), 0)
+    return F1, F2
 
-    # we've preserved the input type until now, so don't ruin it!
-    if isinstance(sky_diffuse, pd.Series):
-        sky_diffuse[np.isnan(airmass)] = 0
-    else:
-        sky_diffuse = np.where(np.isnan(airmass), 0, sky_diffuse)
 
-    return sky_diffuse
+# Lower edges of the Perez clearness bins 2 to 8. Bin 1 holds all
+# clearness values below 1.065.
+_PEREZ_EPS_EDGES = np.array([1.065, 1.23, 1.5, 1.95, 2.8, 4.5, 6.2])
+
+_PEREZ_COEFFICIENTS_PADDED = {}
+
+
+def _get_perez_coefficients_padded(perezmodel):
+    """
+    The Perez coefficients of perezmodel as a read only array with shape
+    ``(6, 9)``. Rows 0 to 2 hold the F1 coefficients and rows 3 to 5 the
+    F2 coefficients of each clearness bin. The last column is nan. The
+    arrays are built once per model.
+    """
+    try:
+        return _PEREZ_COEFFICIENTS_PADDED[perezmodel]
+    except KeyError:
+        pass
+
+    F1c, F2c = _get_perez_coefficients(perezmodel)
+    nans = np.array([[np.nan, np.nan, np.nan]])
+    coeffs = np.ascontiguousarray(
+        np.hstack((np.vstack((F1c, nans)), np.vstack((F2c, nans)))).T)
+    coeffs.flags.writeable = False
+    _PEREZ_COEFFICIENTS_PADDED[perezmodel] = coeffs
+    return coeffs
 
 
 def disc(ghi, zenith, datetime_or_doy, pressure=101325):
@@ -1240,63 +1554,71 @@ def dirint(ghi, zenith, times, pressure=101325., use_delta_kt_prime=True,
         w = pd.Series(-1, index=times)
 
     # @wholmgren: the following bin assignments use MATLAB's 1-indexing.
-    # Later, we'll subtract 1 to conform to Python's 0-indexing.
-
-    # Create kt_prime bins
-    kt_prime_bin = pd.Series(0, index=times, dtype=np.int64)
-    kt_prime_bin[(kt_prime >= 0) & (kt_prime < 0.24)] = 1
-    kt_prime_bin[(kt_prime >= 0.24) & (kt_prime < 0.4)] = 2
-    kt_prime_bin[(kt_prime >= 0.4) & (kt_prime < 0.56)] = 3
-    kt_prime_bin[(kt_prime >= 0.56) & (kt_prime < 0.7)] = 4
-    kt_prime_bin[(kt_prime >= 0.7) & (kt_prime < 0.8)] = 5
-    kt_prime_bin[(kt_prime >= 0.8) & (kt_prime <= 1)] = 6
-
-    # Create zenith angle bins
-    zenith_bin = pd.Series(0, index=times, dtype=np.int64)
-    zenith_bin[(zenith >= 0) & (zenith < 25)] = 1
-    zenith_bin[(zenith >= 25) & (zenith < 40)] = 2
-    zenith_bin[(zenith >= 40) & (zenith < 55)] = 3
-    zenith_bin[(zenith >= 55) & (zenith < 70)] = 4
-    zenith_bin[(zenith >= 70) & (zenith < 80)] = 5
-    zenith_bin[(zenith >= 80)] = 6
-
-    # Create the bins for w based on dew point temperature
-    w_bin = pd.Series(0, index=times, dtype=np.int64)
-    w_bin[(w >= 0) & (w < 1)] = 1
-    w_bin[(w >= 1) & (w < 2)] = 2
-    w_bin[(w >= 2) & (w < 3)] = 3
-    w_bin[(w >= 3)] = 4
-    w_bin[(w == -1)] = 5
-
-    # Create delta_kt_prime binning.
-    delta_kt_prime_bin = pd.Series(0, index=times, dtype=np.int64)
-    delta_kt_prime_bin[(delta_kt_prime >= 0) & (delta_kt_prime < 0.015)] = 1
-    delta_kt_prime_bin[(delta_kt_prime >= 0.015) &
-                       (delta_kt_prime < 0.035)] = 2
-    delta_kt_prime_bin[(delta_kt_prime >= 0.035) & (delta_kt_prime < 0.07)] = 3
-    delta_kt_prime_bin[(delta_kt_prime >= 0.07) & (delta_kt_prime < 0.15)] = 4
-    delta_kt_prime_bin[(delta_kt_prime >= 0.15) & (delta_kt_prime < 0.3)] = 5
-    delta_kt_prime_bin[(delta_kt_prime >= 0.3) & (delta_kt_prime <= 1)] = 6
-    delta_kt_prime_bin[delta_kt_prime == -1] = 7
-
-    # get the coefficients
-    coeffs = _get_dirint_coeffs()
-
-    # subtract 1 to account for difference between MATLAB-style bin
-    # assignment and Python-style array lookup.
-    dirint_coeffs = coeffs[kt_prime_bin-1, zenith_bin-1,
-                           delta_kt_prime_bin-1, w_bin-1]
-
-    # convert unassigned bins to nan
-    dirint_coeffs = np.where((kt_prime_bin == 0) | (zenith_bin == 0) |
-                             (w_bin == 0) | (delta_kt_prime_bin == 0),
-                             np.nan, dirint_coeffs)
+    # Bin 0 holds values outside of all bins, including nan, and maps to
+    # the nan padding of the coefficient table.
+    kt_prime_bin = _dirint_bins(kt_prime, _DIRINT_KT_PRIME_EDGES, 1)
+    zenith_bin = _dirint_bins(zenith, _DIRINT_ZENITH_EDGES, np.inf)
+    delta_kt_prime_bin = _dirint_bins(delta_kt_prime,
+                                      _DIRINT_DELTA_KT_PRIME_EDGES, 1)
+    w = np.asarray(w)
+    w_bin = _dirint_bins(w, _DIRINT_W_EDGES, np.inf)
+
+    # no dew point or delta kt prime information
+    w_bin[w == -1] = 5
+    delta_kt_prime_bin[np.asarray(delta_kt_prime) == -1] = 7
+
+    dirint_coeffs = _get_dirint_coeffs_padded()[
+        kt_prime_bin, zenith_bin, delta_kt_prime_bin, w_bin]
 
     dni *= dirint_coeffs
 
     return dni
 
 
+# Lower bin edges of the dirint model. The last bin of each variable
+# extends to the upper bound passed to _dirint_bins.
+_DIRINT_KT_PRIME_EDGES = np.array([0, 0.24, 0.4, 0.56, 0.7, 0.8])
+_DIRINT_ZENITH_EDGES = np.array([0, 25, 40, 55, 70, 80])
+_DIRINT_DELTA_KT_PRIME_EDGES = np.array([0, 0.015, 0.035, 0.07, 0.15, 0.3])
+_DIRINT_W_EDGES = np.array([0, 1, 2, 3])
+
+
+def _dirint_bins(x, edges, upper):
+    """
+    Assign 1-indexed dirint bins to x.
+
+    Values in ``[edges[i], edges[i+1])`` are assigned bin ``i + 1`` and
+    values in ``[edges[-1], upper]`` are assigned ``len(edges)``. Values
+    below ``edges[0]``, above ``upper`` or nan are assigned bin 0.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    bins = np.searchsorted(edges, x, side='right')
+    with np.errstate(invalid='ignore'):
+        bins[~(x <= upper)] = 0
+    return bins
+
+
+_DIRINT_COEFFS_PADDED = []
+
+
+def _get_dirint_coeffs_padded():
+    """
+    The dirint coefficients with a leading nan entry on every axis, so
+    that they can be indexed directly with the 1-indexed bins of
+    _dirint_bins. The array is built once and is read only.
+
+    Returns
+    -------
+    np.array with shape ``(7, 7, 8, 6)``.
+    """
+    if not _DIRINT_COEFFS_PADDED:
+        coeffs = np.full((7, 7, 8, 6), np.nan)
+        coeffs[1:, 1:, 1:, 1:] = _get_dirint_coeffs()
+        coeffs.flags.writeable = False
+        _DIRINT_COEFFS_PADDED.append(coeffs)
+    return _DIRINT_COEFFS_PADDED[0]
+
+
 def erbs(ghi, zenith, doy):
     r"""
     Estimate DNI and DHI from GHI using the Erbs model.
@@ -1,3 +1,19 @@
+"""
+The Lambert W function.
+
+:py:func:`lambertw_real` and :py:func:`lambertw_log` evaluate the real
+principal branch on arrays with numpy. If the ``PVLIB_USE_NUMBA``
+environment variable is set and numba is installed, they are instead
+compiled to numba ufuncs the first time they are called. Set
+``PVLIB_NUMBA_CACHE`` as well to cache the compiled code on disk.
+"""
+
+from __future__ import division
+
+import math
+import os
+import threading
+
 import numpy as np
 
 
@@ -44,56 +60,276 @@ def lambertw(z):
     """
 
     if any(z < 0):
-        f = []
-        for i in z:
-            if np.isnan(i) or np.isinf(i):
-                f.append(float("NaN"))
-                continue
-
-            # Use a series expansion when close to the branch point -1/e
-            k = (np.abs(i + 0.3678794411714423216) <= 1.5)
-            # [2], Eq. 4.22 and text
-            tmp = np.sqrt(complex(5.43656365691809047 * i + 2.)) - 1
-            if k:
-                w = tmp
-            else:
-                # Use asymptotic expansion w = log(z) - log(log(z)) for most z
-                tmp = np.log(complex(i + (i == 0)))
-                w = tmp - np.log(complex(tmp + (tmp == 0)))
-
-            for j in range(100):
-                # Converge with Halley's method ([2], Eq. 5.9), about 5
-                # iterations satisfies the tolerance for most z
-                c1 = np.exp(w)
-                c2 = w * c1 - i
-                w1 = w + (w != -1)
-                dw = c2 / (c1 * w1 - ((w + 2) * c2 / (2 * w1)))
-                w -= dw
-
-                if np.abs(dw) < 0.7e-16 * (2 + np.abs(w)):
-                    f.append(w)
-                    break
-        w = np.array(f)
+        w = _lambertw_complex(z)
     else:
-        # Use asymptotic expansion w = log(z) - log(log(z)) for most z
-        tmp = np.log(z + (z == 0))
-        w = tmp - np.log(tmp + (tmp == 0))
-
-        # Use a series expansion when close to the branch point -1/e
-        k = (np.abs(z + 0.3678794411714423216) <= 1.5)
-        # [2], Eq. 4.22 and text
-        tmp = np.sqrt(5.43656365691809047 * z + 2.) - 1
-        w[k] = tmp[k]
-
-        for i in range(100):
-            # Converge with Halley's method ([2], Eq. 5.9), about 5 iterations
-            # satisfies the tolerance for most z
-            c1 = np.exp(w)
-            c2 = w * c1 - z
-            w1 = w + (w != -1)
-            dw = c2 / (c1 * w1 - ((w + 2) * c2 / (2 * w1)))
+        w = lambertw_real(z)
+    return w
+
+
+def _lambertw_complex(z):
+    """
+    Principal branch of W(z) for real z, in complex arithmetic, with
+    Halley's method applied only to elements that have not converged.
+    """
+    z = np.asarray(z, dtype=np.float64)
+    finite = np.isfinite(z)
+    zc = z[finite].astype(np.complex128)
+
+    # Use a series expansion when close to the branch point -1/e
+    k = (np.abs(zc + 0.3678794411714423216) <= 1.5)
+    # [2], Eq. 4.22 and text
+    w = np.sqrt(5.43656365691809047 * zc + 2.) - 1
+    # Use asymptotic expansion w = log(z) - log(log(z)) for most z
+    tmp = np.log(zc[~k] + (zc[~k] == 0))
+    w[~k] = tmp - np.log(tmp + (tmp == 0))
+
+    active = np.arange(len(zc))
+    for j in range(100):
+        # Converge with Halley's method ([2], Eq. 5.9), about 5
+        # iterations satisfies the tolerance for most z
+        wa = w[active]
+        c1 = np.exp(wa)
+        c2 = wa * c1 - zc[active]
+        w1 = wa + (wa != -1)
+        dw = c2 / (c1 * w1 - ((wa + 2) * c2 / (2 * w1)))
+        wa -= dw
+        w[active] = wa
+
+        active = active[~(np.abs(dw) < 0.7e-16 * (2 + np.abs(wa)))]
+        if len(active) == 0:
+            break
+
+    out = np.full(z.shape, np.nan, dtype=np.complex128)
+    out[finite] = w
+    return out
+
+
+_INV_E = math.exp(-1)
+_E = math.e
+# arguments within rounding error of the branch point -1/e give W = -1
+_Z_MIN = -_INV_E * (1 + 1e-15)
+# Halley's method converges cubically, so once a relative step is below
+# 1e-5 the updated value is accurate to about 1e-14 and the iterations stop
+_TOL = 1e-5
+_MAXITER = 10
+
+
+def lambertw_real(z):
+    """
+    Real principal branch of the Lambert W function.
+
+    Solves z = w * exp(w) for w >= -1 using Halley's method [1]. Unlike
+    :py:func:`lambertw` and scipy.special.lambertw, all arithmetic is
+    real. Arguments larger than e are evaluated through
+    :py:func:`lambertw_log`.
+
+    Parameters
+    ----------
+    z : numeric
+        Arguments. Values less than -1/e, where the principal branch is
+        not real, return NaN. Values within rounding error of -1/e
+        return -1.
+
+    Returns
+    -------
+    w : numeric
+        W(z) as a float or numpy array.
+
+    References
+    ----------
+    [1] R.M. Corless, G.H. Gonnet, D.E.G. Hare, G.J. Jeffery, and D.E. Knuth.
+        "On the Lambert W Function." Advances in Computational Mathematics,
+        vol. 5, 1996
+
+    See also
+    --------
+    lambertw_log
+    """
+    z = np.asarray(z, dtype=np.float64)
+    kernels = _get_numba_kernels()
+    if kernels is not None:
+        return kernels[0](z)
+
+    w = np.full(z.shape, np.nan)
+    with np.errstate(invalid='ignore'):
+        small = (z >= _Z_MIN) & (z <= _E)
+        large = z > _E
+    w[small] = _lambertw_direct_numpy(z[small])
+    w[large] = _lambertw_log_numpy(np.log(z[large]))
+    return w[()]
+
+
+def lambertw_log(log_z):
+    """
+    Real principal branch of the Lambert W function of exp(log_z).
+
+    Evaluates W(exp(log_z)) without forming exp(log_z), so it does not
+    overflow for large log_z. For log_z > 1, w + log(w) = log_z is solved
+    with Halley's method starting from the asymptotic expansion [1].
+
+    Parameters
+    ----------
+    log_z : numeric
+        Natural logarithm of the arguments. -inf returns 0.
+
+    Returns
+    -------
+    w : numeric
+        W(exp(log_z)) as a float or numpy array.
+
+    References
+    ----------
+    [1] R.M. Corless, G.H. Gonnet, D.E.G. Hare, G.J. Jeffery, and D.E. Knuth.
+        "On the Lambert W Function." Advances in Computational Mathematics,
+        vol. 5, 1996
+
+    See also
+    --------
+    lambertw_real
+    """
+    log_z = np.asarray(log_z, dtype=np.float64)
+    kernels = _get_numba_kernels()
+    if kernels is not None:
+        return kernels[1](log_z)
+
+    w = np.full(log_z.shape, np.nan)
+    with np.errstate(invalid='ignore'):
+        small = log_z <= 1
+        large = log_z > 1
+    w[small] = _lambertw_direct_numpy(np.exp(log_z[small]))
+    w[large] = _lambertw_log_numpy(log_z[large])
+    return w[()]
+
+
+def _lambertw_direct_numpy(z):
+    """Halley iterations on w*exp(w) = z for -1/e <= z <= e."""
+    # initial guess from the branch point series for z < 0 ([1], Eq. 4.22)
+    # and from Winitzki's approximation otherwise
+    p = np.sqrt(np.maximum(2 * (_E * z + 1), 0))
+    lp = np.log1p(np.maximum(z, 0))
+    w = np.where(z < 0, -1 + p - p**2 / 3 + 11 / 72 * p**3,
+                 lp * (1 - np.log1p(lp) / (2 + lp)))
+
+    active = np.flatnonzero(w != -1)
+    for _ in range(_MAXITER):
+        if len(active) == 0:
+            break
+        wa = w[active]
+        ew = np.exp(wa)
+        f = wa * ew - z[active]
+        wp1 = wa + 1
+        dw = f / (ew * wp1 - (wa + 2) * f / (2 * wp1))
+        wa = wa - dw
+        w[active] = wa
+        active = active[~(np.abs(dw) <= _TOL * (1 + np.abs(wa)))]
+    return w
+
+
+def _lambertw_log_numpy(log_z):
+    """Halley iterations on w + log(w) = log_z for log_z > 1."""
+    with np.errstate(invalid='ignore'):
+        log_log_z = np.log(log_z)
+        w = log_z - log_log_z + log_log_z / log_z
+
+    finite = np.isfinite(log_z)
+    w[~finite] = log_z[~finite]
+    active = np.flatnonzero(finite)
+    for _ in range(_MAXITER):
+        if len(active) == 0:
+            break
+        wa = w[active]
+        g = wa + np.log(wa) - log_z[active]
+        dg = 1 + 1 / wa
+        d2g = -1 / wa**2
+        dw = g / dg / (1 - g * d2g / (2 * dg**2))
+        wa = wa - dw
+        w[active] = wa
+        active = active[~(np.abs(dw) <= _TOL * (1 + np.abs(wa)))]
+    return w
+
+
+def _make_scalar_kernels(jit):
+    """
+    Scalar versions of lambertw_real and lambertw_log. jit is applied to
+    each function, so the kernels may be compiled with numba.
+    """
+
+    @jit
+    def direct(z):
+        if z < 0:
+            p = math.sqrt(max(2 * (_E * z + 1), 0.))
+            w = -1 + p - p**2 / 3 + 11 / 72 * p**3
+        else:
+            lp = math.log1p(z)
+            w = lp * (1 - math.log1p(lp) / (2 + lp))
+        if w == -1:
+            return w
+        for _ in range(_MAXITER):
+            ew = math.exp(w)
+            f = w * ew - z
+            wp1 = w + 1
+            dw = f / (ew * wp1 - (w + 2) * f / (2 * wp1))
             w -= dw
+            if abs(dw) <= _TOL * (1 + abs(w)):
+                break
+        return w
 
-            if all(np.abs(dw) < 0.7e-16 * (2 + np.abs(w))):
+    @jit
+    def from_log(log_z):
+        if math.isinf(log_z):
+            return log_z
+        log_log_z = math.log(log_z)
+        w = log_z - log_log_z + log_log_z / log_z
+        for _ in range(_MAXITER):
+            g = w + math.log(w) - log_z
+            dg = 1 + 1 / w
+            d2g = -1 / w**2
+            dw = g / dg / (1 - g * d2g / (2 * dg**2))
+            w -= dw
+            if abs(dw) <= _TOL * (1 + abs(w)):
                 break
-    return w
+        return w
+
+    def real(z):
+        if math.isnan(z) or z < _Z_MIN:
+            return np.nan
+        if z <= _E:
+            return direct(z)
+        return from_log(math.log(z))
+
+    def log(log_z):
+        if math.isnan(log_z):
+            return np.nan
+        if log_z <= 1:
+            return direct(math.exp(log_z))
+        return from_log(log_z)
+
+    return real, log
+
+
+_NUMBA_KERNELS = []
+_NUMBA_KERNELS_LOCK = threading.Lock()
+
+
+def _get_numba_kernels():
+    """
+    Compile the scalar kernels to numba ufuncs on first use. Returns
+    None if numba is not enabled with PVLIB_USE_NUMBA or not installed.
+    """
+    with _NUMBA_KERNELS_LOCK:
+        if not _NUMBA_KERNELS:
+            kernels = None
+            if os.getenv('PVLIB_USE_NUMBA', '0') != '0':
+                try:
+                    import numba
+                except ImportError:
+                    pass
+                else:
+                    cache = os.getenv('PVLIB_NUMBA_CACHE', '0') != '0'
+                    real, log = _make_scalar_kernels(numba.njit(cache=cache))
+                    signature = ['float64(float64)']
+                    kernels = (
+                        numba.vectorize(signature, cache=cache)(real),
+                        numba.vectorize(signature, cache=cache)(log))
+            _NUMBA_KERNELS.append(kernels)
+    return _NUMBA_KERNELS[0]
@@ -194,7 +194,7 @@ class Location(object):
             Column names are: ``ghi, dni, dhi``.
         """
         if dni_extra is None:
-            dni_extra = irradiance.extraradiation(times.dayofyear)
+            dni_extra = irradiance.extraradiation(times).values
 
         try:
             pressure = kwargs.pop('pressure')
@@ -6,8 +6,10 @@ library. With great power comes great responsibility: users should take
 the time to read the source code for the module.
 """
 
+from collections import OrderedDict
 from functools import partial
 
+import numpy as np
 import pandas as pd
 
 from pvlib import solarposition, pvsystem, clearsky, atmosphere
@@ -213,6 +215,135 @@ def get_orientation(strategy, **kwargs):
     return surface_tilt, surface_azimuth
 
 
+def optimize_orientation(location, weather, model='perez', albedo=.25,
+                         solar_position=None, tilt_range=(0, 90),
+                         azimuth_range=(0, 360), tol=0.1,
+                         model_perez='allsitescomposite1990'):
+    """
+    Find the fixed surface tilt and surface azimuth that maximize the
+    plane of array irradiation at a location.
+
+    The solar position, decomposition, airmass and extraterrestrial
+    irradiance are computed once. Candidate orientations are then
+    evaluated together with the machinery of
+    :py:func:`pvlib.irradiance.total_irrad_grid`, on a coarse grid that
+    is refined around the best orientation until its spacing is below
+    ``tol``.
+
+    Parameters
+    ----------
+    location : Location
+    weather : DataFrame
+        Irradiance at the times of the index, typically a year. Columns
+        must include 'ghi'. If 'dni' or 'dhi' is missing, both are
+        estimated from 'ghi' with :py:func:`pvlib.irradiance.erbs`.
+    model : String, default 'perez'
+        Transposition model. See :py:func:`pvlib.irradiance.total_irrad`.
+    albedo : numeric, default 0.25
+        Surface albedo.
+    solar_position : None or DataFrame, default None
+        The output of ``location.get_solarposition(weather.index)``.
+        Supply it to reuse the solar position for many calls with the
+        same location and times.
+    tilt_range : tuple, default (0, 90)
+        Smallest and largest surface tilt to consider.
+    azimuth_range : tuple, default (0, 360)
+        Smallest and largest surface azimuth to consider. A range that
+        spans 360 degrees or more is searched as a full circle.
+    tol : float, default 0.1
+        Stop once the grid spacing is below tol degrees.
+    model_perez : String
+        See :py:func:`pvlib.irradiance.perez`.
+
+    Returns
+    -------
+    orientation : OrderedDict
+        Contains the keys ``'surface_tilt', 'surface_azimuth'`` of the
+        best orientation and ``'poa_global'``, its plane of array
+        irradiation in Wh/m^2 summed over the index of weather.
+
+    Notes
+    -----
+    The plane of array irradiation is a proxy for the energy yield. It
+    ignores angle of incidence, spectral and temperature losses, which
+    move the optimum by a fraction of a degree at most sites. The grid
+    search finds the best orientation of a coarse grid of 10 tilts by
+    12 or 13 azimuths and then refines the local maximum around it.
+    """
+
+    times = weather.index
+    if solar_position is None:
+        solar_position = location.get_solarposition(times)
+
+    ghi = weather['ghi']
+    if 'dni' in weather and 'dhi' in weather:
+        dni = weather['dni']
+        dhi = weather['dhi']
+    else:
+        erbs_out = pvlib.irradiance.erbs(ghi, solar_position['zenith'],
+                                         times)
+        dni = erbs_out['dni']
+        dhi = erbs_out['dhi']
+
+    dni_extra = pvlib.irradiance.extraradiation(times)
+    airmass = location.get_airmass(solar_position=solar_position)
+
+    model, sun, dni, terms = pvlib.irradiance._total_irrad_grid_terms(
+        solar_position['apparent_zenith'], solar_position['azimuth'],
+        dni, ghi, dhi, dni_extra, airmass['airmass_relative'], albedo,
+        model, model_perez)
+
+    if len(times) > 1:
+        hours = np.median(np.diff(times.asi8)) / 3.6e12
+    else:
+        hours = 1.
+
+    tilt_min, tilt_max = tilt_range
+    azimuth_min, azimuth_max = azimuth_range
+    full_circle = azimuth_max - azimuth_min >= 360
+
+    tilt_step = (tilt_max - tilt_min) / 9.
+    tilts = tilt_min + tilt_step * np.arange(10)
+    if full_circle:
+        azimuth_step = 30.
+        azimuths = azimuth_min + azimuth_step * np.arange(12)
+    else:
+        azimuth_step = (azimuth_max - azimuth_min) / 12.
+        azimuths = azimuth_min + azimuth_step * np.arange(13)
+
+    while True:
+        surface_tilts, surface_azimuths = [
+            grid.ravel() for grid in np.meshgrid(tilts, azimuths)]
+        energy = pvlib.irradiance._total_irrad_grid_energy(
+            surface_tilts, surface_azimuths, sun, dni, terms, model)[:, 0]
+        best = np.nanargmax(energy)
+        tilt, azimuth = surface_tilts[best], surface_azimuths[best]
+
+        if tilt_step < tol and azimuth_step < tol:
+            break
+
+        # the maximum is within one step of the best orientation, so
+        # halve the spacing and search a 3 x 3 grid around it
+        tilt_step /= 2
+        azimuth_step /= 2
+        offsets = np.array([-1., 0., 1.])
+        tilts = np.unique(np.clip(tilt + offsets * tilt_step,
+                                  tilt_min, tilt_max))
+        azimuths = azimuth + offsets * azimuth_step
+        if full_circle:
+            azimuths = np.unique(azimuths % 360)
+        else:
+            azimuths = np.unique(np.clip(azimuths, azimuth_min,
+                                         azimuth_max))
+
+    orientation = OrderedDict()
+    orientation['surface_tilt'] = tilt
+    orientation['surface_azimuth'] = azimuth
+    orientation['poa_global'] = energy[best] * hours
+
+    return orientation
+
+
 class ModelChain(object):
     """
     An experimental class that represents all of the modeling steps
@@ -253,8 +384,12 @@ class ModelChain(object):
     dc_model: None, str, or function
         If None, the model will be inferred from the contents of
         system.module_parameters. Valid strings are 'sapm',
-        'singlediode', 'pvwatts'. The ModelChain instance will be passed
-        as the first argument to a user-defined function.
+        'singlediode', 'singlediode_table', 'pvwatts'. The ModelChain
+        instance will be passed as the first argument to a user-defined
+        function. 'singlediode_table' interpolates the single-diode
+        model from a table computed once per module by
+        pvsystem.singlediode_table and stores the table, including its
+        interpolation error, in the dc_table attribute.
 
     ac_model: None, str, or function
         If None, the model will be inferred from the contents of
@@ -284,6 +419,11 @@ class ModelChain(object):
         Valid strings are 'pvwatts', 'no_loss'. The ModelChain instance
         will be passed as the first argument to a user-defined function.
 
+    singlediode_table_kwargs: None or dict
+        Keyword arguments, e.g. rtol, irradiance_range and temp_range,
+        passed to system.singlediode_table when dc_model is
+        'singlediode_table'.
+
     **kwargs
         Arbitrary keyword arguments. Included for compatibility, but not
         used.
@@ -297,7 +437,7 @@ class ModelChain(object):
                  airmass_model='kastenyoung1989',
                  dc_model=None, ac_model=None, aoi_model=None,
                  spectral_model=None, temp_model='sapm',
-                 losses_model='no_loss',
+                 losses_model='no_loss', singlediode_table_kwargs=None,
                  **kwargs):
 
         self.system = system
@@ -306,6 +446,7 @@ class ModelChain(object):
         self.transposition_model = transposition_model
         self.solar_position_method = solar_position_method
         self.airmass_model = airmass_model
+        self.singlediode_table_kwargs = singlediode_table_kwargs
 
         # calls setters
         self.dc_model = dc_model
@@ -353,6 +494,8 @@ class ModelChain(object):
                 self._dc_model = self.sapm
             elif model == 'singlediode':
                 self._dc_model = self.singlediode
+            elif model == 'singlediode_table':
+                self._dc_model = self.singlediode_table
             elif model == 'pvwatts':
                 self._dc_model = self.pvwatts_dc
             else:
@@ -397,6 +540,18 @@ class ModelChain(object):
 
         return self
 
+    def singlediode_table(self):
+        self.dc_table = self.system.singlediode_table(
+            **(self.singlediode_table_kwargs or {}))
+
+        self.dc = pvsystem.singlediode_from_table(self.dc_table,
+                                                  self.effective_irradiance,
+                                                  self.temps['temp_cell'])
+
+        self.dc = self.system.scale_voltage_current_power(self.dc).fillna(0)
+
+        return self
+
     def pvwatts_dc(self):
         self.dc = self.system.pvwatts_dc(self.effective_irradiance,
                                          self.temps['temp_cell'])
@@ -629,7 +784,8 @@ class ModelChain(object):
 
         self.times = times
 
-        self.solar_position = self.location.get_solarposition(self.times)
+        self.solar_position = self.location.get_solarposition(
+            self.times, method=self.solar_position_method)
 
         self.airmass = self.location.get_airmass(
             solar_position=self.solar_position, model=self.airmass_model)
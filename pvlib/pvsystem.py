@@ -5,9 +5,15 @@ performance of PV modules and inverters.
 
 from __future__ import division
 
-from collections import OrderedDict
+from collections import OrderedDict, deque
 import os
 import io
+import hashlib
+import math
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+import threading
+import warnings
 try:
     from urllib2 import urlopen
 except ImportError:
@@ -20,6 +26,8 @@ from pvlib import tools
 from pvlib.tools import _build_kwargs
 from pvlib.location import Location
 from pvlib import irradiance, atmosphere
+from pvlib.lambertw import lambertw_real, lambertw_log
+from pvlib.lambertw import _make_scalar_kernels as _lambertw_scalar_kernels
 
 
 # not sure if this belongs in the pvsystem module.
@@ -297,6 +305,33 @@ class PVSystem(object):
                                  self.module_parameters['EgRef'],
                                  self.module_parameters['dEgdT'], **kwargs)
 
+    def singlediode_desoto(self, poa_global, temp_cell, **kwargs):
+        """
+        Use the :py:func:`singlediode_desoto` function, the input
+        parameters and ``self.module_parameters`` to calculate the key
+        points of the IV curve in one step.
+
+        Parameters
+        ----------
+        poa_global : float or Series
+            The irradiance (in W/m^2) absorbed by the module.
+
+        temp_cell : float or Series
+            The average cell temperature of cells within a module in C.
+
+        **kwargs
+            See pvsystem.singlediode_desoto for details
+
+        Returns
+        -------
+        See pvsystem.singlediode_desoto for details
+        """
+        return singlediode_desoto(poa_global, temp_cell,
+                                  self.module_parameters['alpha_sc'],
+                                  self.module_parameters,
+                                  self.module_parameters['EgRef'],
+                                  self.module_parameters['dEgdT'], **kwargs)
+
     def sapm(self, effective_irradiance, temp_cell, **kwargs):
         """
         Use the :py:func:`sapm` function, the input parameters,
@@ -414,7 +449,8 @@ class PVSystem(object):
 
     def singlediode(self, photocurrent, saturation_current,
                     resistance_series, resistance_shunt, nNsVth,
-                    ivcurve_pnts=None):
+                    ivcurve_pnts=None, method='golden', chunksize=None,
+                    n_jobs=1, backend='thread'):
         """Wrapper around the :py:func:`singlediode` function.
 
         Parameters
@@ -427,7 +463,26 @@ class PVSystem(object):
         """
         return singlediode(photocurrent, saturation_current,
                            resistance_series, resistance_shunt, nNsVth,
-                           ivcurve_pnts=ivcurve_pnts)
+                           ivcurve_pnts=ivcurve_pnts, method=method,
+                           chunksize=chunksize, n_jobs=n_jobs,
+                           backend=backend)
+
+    def singlediode_table(self, **kwargs):
+        """
+        Use the :py:func:`singlediode_table` function and
+        ``self.module_parameters`` to tabulate the single-diode model
+        over irradiance and cell temperature.
+
+        Parameters
+        ----------
+        **kwargs
+            See pvsystem.singlediode_table for details
+
+        Returns
+        -------
+        See pvsystem.singlediode_table for details
+        """
+        return singlediode_table(self.module_parameters, **kwargs)
 
     def i_from_v(self, resistance_shunt, resistance_series, nNsVth, voltage,
                  saturation_current, photocurrent):
@@ -1038,6 +1093,220 @@ def calcparams_desoto(poa_global, temp_cell, alpha_isc, module_parameters,
     return IL, I0, Rs, Rsh, nNsVth
 
 
+def singlediode_desoto(poa_global, temp_cell, alpha_isc, module_parameters,
+                       EgRef, dEgdT, M=1, irrad_ref=1000, temp_ref=25,
+                       how='numpy'):
+    '''
+    Solve the single-diode model for the De Soto parameters at the given
+    irradiance and cell temperature.
+
+    Equivalent to ``singlediode(*calcparams_desoto(...),
+    method='newton')``, but with ``how='numba'`` both steps run in a
+    single compiled loop that computes the key points of the IV curve
+    one time step at a time, without intermediate arrays.
+
+    Parameters
+    ----------
+    poa_global : numeric
+        The irradiance (in W/m^2) absorbed by the module.
+
+    temp_cell : numeric
+        The average cell temperature of cells within a module in C.
+
+    alpha_isc, module_parameters, EgRef, dEgdT, M, irrad_ref, temp_ref
+        See ``calcparams_desoto``.
+
+    how : str, default 'numpy'
+        'numpy' calls ``calcparams_desoto`` and ``singlediode``. 'numba'
+        uses a kernel compiled with numba on first use. It falls back to
+        'numpy' with a warning if numba is not installed. Set the
+        ``PVLIB_NUMBA_CACHE`` environment variable to cache the compiled
+        kernel on disk.
+
+    Returns
+    -------
+    OrderedDict or DataFrame
+
+    The returned dict-like object contains the keys/columns i_sc, v_oc,
+    i_mp, v_mp, p_mp, i_x and i_xx. See ``singlediode``. The output will
+    be a DataFrame if poa_global is a Series.
+
+    See also
+    --------
+    calcparams_desoto
+    singlediode
+    '''
+
+    if how not in ('numpy', 'numba'):
+        raise ValueError("how must be either 'numba' or 'numpy'")
+
+    kernel = None
+    if how == 'numba':
+        kernel = _get_desoto_singlediode_kernel()
+        if kernel is None:
+            warnings.warn('Could not import numba, falling back to numpy '
+                          'calculation')
+
+    keys = ('i_sc', 'v_oc', 'i_mp', 'v_mp', 'p_mp', 'i_x', 'i_xx')
+
+    if kernel is None:
+        sd = singlediode(*calcparams_desoto(poa_global, temp_cell,
+                                            alpha_isc, module_parameters,
+                                            EgRef, dEgdT, M=M,
+                                            irrad_ref=irrad_ref,
+                                            temp_ref=temp_ref),
+                         method='newton')
+        out = OrderedDict((k, np.asarray(sd[k])) for k in keys)
+    else:
+        inputs = np.broadcast_arrays(
+            *[np.asarray(x, dtype=np.float64) for x in
+              (poa_global, temp_cell, np.maximum(M, 0))])
+        shape = inputs[0].shape
+        poa, temp, airmass = [np.array(x).ravel() for x in inputs]
+        values = np.empty((len(keys), poa.size))
+        kernel(poa, temp, airmass, float(alpha_isc),
+               float(module_parameters['a_ref']),
+               float(module_parameters['I_L_ref']),
+               float(module_parameters['I_o_ref']),
+               float(module_parameters['R_sh_ref']),
+               float(module_parameters['R_s']), float(EgRef), float(dEgdT),
+               float(irrad_ref), float(temp_ref), values)
+        out = OrderedDict((k, v.reshape(shape))
+                          for k, v in zip(keys, values))
+
+    if isinstance(poa_global, pd.Series):
+        out = pd.DataFrame(out, index=poa_global.index)
+    elif all(v.ndim == 0 for v in out.values()):
+        out = OrderedDict((k, v[()]) for k, v in out.items())
+
+    return out
+
+
+def _make_desoto_singlediode_kernel(jit, lambertw_log):
+    '''
+    Fused calcparams_desoto and singlediode(method='newton') loop.
+    Follows the array functions step by step, with lambertw_log a
+    scalar function. jit is applied to each function.
+    '''
+
+    @jit
+    def i_from_v(v, IL, I0, Rs, Rsh, a):
+        rsum = Rs + Rsh
+        log_arg = (math.log(Rs*I0*Rsh / (a*rsum)) +
+                   Rsh*(Rs*(IL + I0) + v) / (a*rsum))
+        w = lambertw_log(log_arg)
+        i = -v/rsum - (a/Rs)*w + Rsh*(IL + I0)/rsum
+        return i, w
+
+    @jit
+    def v_from_i(i, IL, I0, Rs, Rsh, a):
+        w = lambertw_log(math.log(I0*Rsh/a) + Rsh*(-i + IL + I0)/a)
+        return -i*(Rs + Rsh) + IL*Rsh - a*w + I0*Rsh
+
+    @jit
+    def kernel(poa, temp_cell, M, alpha_isc, a_ref, IL_ref, I0_ref,
+               Rsh_ref, Rs, EgRef, dEgdT, irrad_ref, temp_ref, out):
+        k_b = 8.617332478e-05
+        Tref_K = temp_ref + 273.15
+        vtol = 1e-8
+        for n in range(len(poa)):
+            if not (poa[n] > 0 or poa[n] < 0):
+                # zero or nan irradiance
+                for m in range(7):
+                    out[m, n] = np.nan
+                continue
+
+            # calcparams_desoto
+            Tcell_K = temp_cell[n] + 273.15
+            E_g = EgRef * (1 + dEgdT*(Tcell_K - Tref_K))
+            a = a_ref * (Tcell_K / Tref_K)
+            IL = (poa[n]/irrad_ref) * M[n] * (IL_ref +
+                                              alpha_isc*(Tcell_K - Tref_K))
+            I0 = (I0_ref * ((Tcell_K / Tref_K) ** 3) *
+                  math.exp(EgRef / (k_b*Tref_K) - (E_g / (k_b*Tcell_K))))
+            Rsh = Rsh_ref * (irrad_ref / poa[n])
+            rsum = Rs + Rsh
+
+            i_sc = i_from_v(0.01, IL, I0, Rs, Rsh, a)[0]
+            if poa[n] < 0:
+                # as in singlediode, only i_sc is defined for negative
+                # irradiance
+                out[0, n] = i_sc
+                for m in range(1, 7):
+                    out[m, n] = np.nan
+                continue
+            v_oc = v_from_i(0., IL, I0, Rs, Rsh, a)
+
+            # bracketed Newton on dP/dV, as in _mpp_newton
+            if v_oc <= 0:
+                v_mp = 0.
+                i_mp = max(IL, 0.)
+            elif math.isnan(v_oc):
+                v_mp = np.nan
+                i_mp = np.nan
+            else:
+                lo = 0.
+                hi = v_oc
+                v = 0.8 * v_oc
+                for _ in range(50):
+                    i, w = i_from_v(v, IL, I0, Rs, Rsh, a)
+                    di = -(1 + Rsh/Rs * w/(1 + w)) / rsum
+                    d2i = -(Rsh**2 * w) / (Rs * a * rsum**2 * (1 + w)**3)
+                    g = i + v*di
+                    dg = 2*di + v*d2i
+                    if g > 0:
+                        lo = v
+                    else:
+                        hi = v
+                    step = g/dg
+                    v_new = v - step
+                    if abs(step) < vtol or hi - lo < vtol:
+                        v = v_new
+                        break
+                    if not (lo <= v_new <= hi):
+                        v_new = 0.5*(lo + hi)
+                    v = v_new
+                v_mp = v
+                i_mp = i_from_v(v_mp, IL, I0, Rs, Rsh, a)[0]
+
+            out[0, n] = i_sc
+            out[1, n] = v_oc
+            out[2, n] = i_mp
+            out[3, n] = v_mp
+            out[4, n] = v_mp * i_mp
+            out[5, n] = i_from_v(0.5*v_oc, IL, I0, Rs, Rsh, a)[0]
+            out[6, n] = i_from_v(0.5*(v_oc + v_mp), IL, I0, Rs, Rsh, a)[0]
+
+    return kernel
+
+
+_DESOTO_SINGLEDIODE_KERNEL = []
+_DESOTO_SINGLEDIODE_KERNEL_LOCK = threading.Lock()
+
+
+def _get_desoto_singlediode_kernel():
+    '''
+    Compile the fused kernel with numba on first use. Returns None if
+    numba is not installed.
+    '''
+    with _DESOTO_SINGLEDIODE_KERNEL_LOCK:
+        if not _DESOTO_SINGLEDIODE_KERNEL:
+            kernel = None
+            try:
+                import numba
+            except ImportError:
+                pass
+            else:
+                cache = os.getenv('PVLIB_NUMBA_CACHE', '0') != '0'
+                # numpy error model so division by zero gives inf or nan
+                jit = numba.njit(cache=cache, error_model='numpy')
+                lambertw_log_scalar = jit(_lambertw_scalar_kernels(jit)[1])
+                kernel = _make_desoto_singlediode_kernel(
+                    jit, lambertw_log_scalar)
+            _DESOTO_SINGLEDIODE_KERNEL.append(kernel)
+    return _DESOTO_SINGLEDIODE_KERNEL[0]
+
+
 def retrieve_sam(name=None, path=None):
     '''
     Retrieve latest module and inverter info from a local file or the
@@ -1080,6 +1349,13 @@ def retrieve_sam(name=None, path=None):
     -----
     Files available at https://sam.nrel.gov/sites/default/files/
 
+    Parsed databases are cached in memory, keyed on the sha1 of the csv
+    file, so repeated calls only copy the cached DataFrame. Files
+    downloaded from a URL are kept for the rest of the session. If the
+    ``PVLIB_SAM_CACHE`` environment variable is set, parsed databases are
+    also pickled to that directory and reused by later sessions. Use
+    :py:func:`retrieve_sam_entry` to fetch a single module or inverter.
+
     Examples
     --------
 
@@ -1104,32 +1380,106 @@ def retrieve_sam(name=None, path=None):
     Name: AE_Solar_Energy__AE6_0__277V__277V__CEC_2012_, dtype: float64
     '''
 
-    pvlib_path = os.path.dirname(os.path.abspath(__file__))
-    filepath = os.path.join(pvlib_path, 'data', 'LinkeTurbidities.mat')
+    df, _, _ = _sam_table(name, path)
+    # hand out a copy so that callers cannot modify the cached table
+    return df.copy()
+
+
+def retrieve_sam_entry(entry, name=None, path=None):
+    '''
+    Retrieve the parameters of a single module or inverter from a SAM
+    database.
+
+    The database is parsed and cached by :py:func:`retrieve_sam` on the
+    first call, after which a lookup in the name index of the cached
+    table takes a few microseconds.
+
+    Parameters
+    ----------
+    entry : string
+        Name of the module or inverter, as it appears in the columns of
+        the DataFrame returned by :py:func:`retrieve_sam`.
+
+    name : None or string
+        Name of the database. See :py:func:`retrieve_sam`.
+
+    path : None or string
+        Path to the SAM file. May also be a URL.
+
+    Returns
+    -------
+    parameters : Series
+        The parameters of ``entry``. If ``entry`` appears more than once
+        in the database, a DataFrame with one column per occurrence is
+        returned instead.
+
+    Examples
+    --------
+
+    >>> from pvlib import pvsystem
+    >>> inverter = pvsystem.retrieve_sam_entry(
+    ...     'AE_Solar_Energy__AE6_0__277V__277V__CEC_2012_', 'CECInverter')
+    '''
+
+    if name is None and path is None:
+        raise ValueError('name or path must be provided')
+
+    df, values, names = _sam_table(name, path)
+    loc = names[entry]
+    if isinstance(loc, list):
+        return df.iloc[:, loc].copy()
+    # copy the column so that callers cannot modify the cached table
+    return pd.Series(values[:, loc].copy(), index=df.index, name=entry)
+
+
+# parsed SAM databases keyed on the sha1 of the raw csv. Each value is a
+# (DataFrame, values, names) tuple, where values is the DataFrame as a 2d
+# array and names maps each column name to its position, or to a list of
+# positions for names that appear more than once.
+_SAM_TABLES = {}
+
+# raw csv downloaded from a URL, keyed on the URL
+_SAM_DOWNLOADS = {}
+
+# sha1 of local csv files, keyed on (path, modification time, size)
+_SAM_KEYS = {}
+
+_SAM_FILES = {
+    'cecmod': 'sam-library-cec-modules-2015-6-30.csv',
+    'sandiamod': 'sam-library-sandia-modules-2015-6-30.csv',
+    # Allowing either, to provide for old code,
+    # while aligning with current expectations
+    'cecinverter': 'sam-library-cec-inverters-2015-6-30.csv',
+    'sandiainverter': 'sam-library-cec-inverters-2015-6-30.csv',
+}
+
+# characters that are replaced by underscores in module and inverter names
+_SAM_NAME_CHARS = ' -.()[]:+/",'
+
+
+def _sam_table(name, path):
+    """
+    Returns the cached (DataFrame, values, names) tuple of a SAM database,
+    parsing it first if needed.
+
+    The parsed DataFrame is also pickled to the directory given by the
+    ``PVLIB_SAM_CACHE`` environment variable, if it is set, so that
+    later sessions can skip parsing the csv file.
+    """
 
     if name is not None:
         name = name.lower()
-        data_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), 'data')
-        if name == 'cecmod':
-            csvdata = os.path.join(
-                data_path, 'sam-library-cec-modules-2015-6-30.csv')
-        elif name == 'sandiamod':
-            csvdata = os.path.join(
-                data_path, 'sam-library-sandia-modules-2015-6-30.csv')
-        elif name in ['cecinverter', 'sandiainverter']:
-            # Allowing either, to provide for old code,
-            # while aligning with current expectations
-            csvdata = os.path.join(
-                data_path, 'sam-library-cec-inverters-2015-6-30.csv')
-        else:
+        try:
+            filename = _SAM_FILES[name]
+        except KeyError:
             raise ValueError('invalid name {}'.format(name))
+        csvfile = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), 'data', filename)
     elif path is not None:
         if path.startswith('http'):
-            response = urlopen(path)
-            csvdata = io.StringIO(response.read().decode(errors='ignore'))
+            csvfile = None
         else:
-            csvdata = path
+            csvfile = path
     elif name is None and path is None:
         try:
             # python 2
@@ -1141,35 +1491,91 @@ def retrieve_sam(name=None, path=None):
             from tkinter.filedialog import askopenfilename
 
         tkinter.Tk().withdraw()
-        csvdata = askopenfilename()
+        csvfile = askopenfilename()
+
+    raw = None
+    if csvfile is None:
+        try:
+            raw = _SAM_DOWNLOADS[path]
+        except KeyError:
+            response = urlopen(path)
+            raw = response.read().decode(errors='ignore').encode('utf-8')
+            _SAM_DOWNLOADS[path] = raw
+        key = hashlib.sha1(raw).hexdigest()
+    else:
+        # skip reading and hashing files that have not changed since
+        # they were last parsed
+        stat = os.stat(csvfile)
+        file_id = (os.path.abspath(csvfile), stat.st_mtime, stat.st_size)
+        key = _SAM_KEYS.get(file_id)
+        if key is None:
+            with open(csvfile, 'rb') as f:
+                raw = f.read()
+            key = hashlib.sha1(raw).hexdigest()
+            _SAM_KEYS[file_id] = key
 
-    return _parse_raw_sam_df(csvdata)
+    try:
+        return _SAM_TABLES[key]
+    except KeyError:
+        pass
+
+    if csvfile is not None and raw is None:
+        with open(csvfile, 'rb') as f:
+            raw = f.read()
+
+    cache_dir = os.getenv('PVLIB_SAM_CACHE')
+    if cache_dir:
+        # pickles are not portable across pandas versions
+        cache_file = os.path.join(
+            cache_dir, 'sam-{}-pandas-{}.pkl'.format(key, pd.__version__))
+
+    df = None
+    if cache_dir and os.path.exists(cache_file):
+        try:
+            df = pd.read_pickle(cache_file)
+        except Exception:
+            # unreadable cache file, parse the csv again and replace it
+            df = None
+
+    if df is None:
+        df = _parse_raw_sam_df(io.BytesIO(raw))
+        if cache_dir:
+            try:
+                if not os.path.isdir(cache_dir):
+                    os.makedirs(cache_dir)
+                tools._atomic_write(cache_file, df.to_pickle)
+            except (IOError, OSError) as e:
+                warnings.warn('could not write SAM cache {}: {}'
+                              .format(cache_file, e))
+
+    names = {}
+    for i, column in enumerate(df.columns):
+        loc = names.setdefault(column, i)
+        if loc != i:
+            if not isinstance(loc, list):
+                names[column] = loc = [loc]
+            loc.append(i)
+
+    table = (df, df.values, names)
+    _SAM_TABLES[key] = table
+    return table
 
 
 def _parse_raw_sam_df(csvdata):
     df = pd.read_csv(csvdata, index_col=0, skiprows=[1, 2])
-    colnames = df.columns.values.tolist()
-    parsedcolnames = []
-    for cn in colnames:
-        parsedcolnames.append(cn.replace(' ', '_'))
-
-    df.columns = parsedcolnames
-
-    parsedindex = []
-    for index in df.index:
-        parsedindex.append(index.replace(' ', '_').replace('-', '_')
-                                .replace('.', '_').replace('(', '_')
-                                .replace(')', '_').replace('[', '_')
-                                .replace(']', '_').replace(':', '_')
-                                .replace('+', '_').replace('/', '_')
-                                .replace('"', '_').replace(',', '_'))
-
-    df.index = parsedindex
+    df.columns = [cn.replace(' ', '_') for cn in df.columns]
+    df.index = [_sam_name(index) for index in df.index]
     df = df.transpose()
 
     return df
 
 
+def _sam_name(name):
+    for char in _SAM_NAME_CHARS:
+        name = name.replace(char, '_')
+    return name
+
+
 def sapm(effective_irradiance, temp_cell, module):
     '''
     The Sandia PV Array Performance Model (SAPM) generates 5 points on a
@@ -1535,7 +1941,8 @@ def sapm_effective_irradiance(poa_direct, poa_diffuse, airmass_absolute, aoi,
 
 
 def singlediode(photocurrent, saturation_current, resistance_series,
-                resistance_shunt, nNsVth, ivcurve_pnts=None):
+                resistance_shunt, nNsVth, ivcurve_pnts=None, method='golden',
+                chunksize=None, n_jobs=1, backend='thread'):
     r'''
     Solve the single-diode model to obtain a photovoltaic IV curve.
 
@@ -1584,7 +1991,29 @@ def singlediode(photocurrent, saturation_current, resistance_series,
 
     ivcurve_pnts : None or int
         Number of points in the desired IV curve. If None or 0, no
-        IV curves will be produced.
+        IV curves will be produced. See ``singlediode_ivcurves`` to
+        generate the curves of long inputs in blocks.
+
+    method : str, default 'golden'
+        Method used to find the maximum power point. 'golden' uses a
+        golden section search on the power curve. 'newton' uses a
+        bracketed Newton iteration on dP/dV = 0 that converges
+        quadratically and is much faster for long inputs.
+
+    chunksize : None or int, default None
+        If not None, the inputs are solved in blocks of at most
+        chunksize elements that are written into preallocated outputs,
+        which bounds the memory used by intermediate arrays. If None and
+        n_jobs is not 1, the inputs are split evenly between the jobs.
+
+    n_jobs : None or int, default 1
+        Number of blocks to solve at the same time. If None, use the
+        number of CPUs.
+
+    backend : str, default 'thread'
+        'thread' solves the blocks in a thread pool, which works well
+        because numpy releases the GIL for most of the computation.
+        'process' uses a process pool instead.
 
     Returns
     -------
@@ -1618,6 +2047,11 @@ def singlediode(photocurrent, saturation_current, resistance_series,
     the Lambert W function to obtain an explicit function of V=f(i) and
     I=f(V) as shown in [2].
 
+    With ``method='newton'``, the derivatives of I=f(V) are also
+    expressed in terms of the Lambert W function, so each Newton step
+    needs a single Lambert W evaluation. Rows are removed from the
+    iteration as soon as they converge.
+
     References
     -----------
     [1] S.R. Wenham, M.A. Green, M.E. Watt, "Applied Photovoltaics" ISBN
@@ -1634,8 +2068,19 @@ def singlediode(photocurrent, saturation_current, resistance_series,
     --------
     sapm
     calcparams_desoto
+    singlediode_ivcurves
     '''
 
+    if method not in ('golden', 'newton'):
+        raise ValueError("method must be 'golden' or 'newton', got {}"
+                         .format(method))
+
+    if chunksize is not None or n_jobs != 1:
+        return _singlediode_chunked(photocurrent, saturation_current,
+                                    resistance_series, resistance_shunt,
+                                    nNsVth, ivcurve_pnts, method, chunksize,
+                                    n_jobs, backend)
+
     # Find short circuit current using Lambert W
     i_sc = i_from_v(resistance_shunt, resistance_series, nNsVth, 0.01,
                     saturation_current, photocurrent)
@@ -1644,18 +2089,25 @@ def singlediode(photocurrent, saturation_current, resistance_series,
     v_oc = v_from_i(resistance_shunt, resistance_series, nNsVth, 0.0,
                     saturation_current, photocurrent)
 
-    params = {'r_sh': resistance_shunt,
-              'r_s': resistance_series,
-              'nNsVth': nNsVth,
-              'i_0': saturation_current,
-              'i_l': photocurrent}
+    if method == 'golden':
+        params = {'r_sh': resistance_shunt,
+                  'r_s': resistance_series,
+                  'nNsVth': nNsVth,
+                  'i_0': saturation_current,
+                  'i_l': photocurrent}
 
-    p_mp, v_mp = _golden_sect_DataFrame(params, 0, v_oc*1.14, _pwr_optfcn)
+        p_mp, v_mp = _golden_sect_DataFrame(params, 0, v_oc*1.14,
+                                            _pwr_optfcn)
 
-    # Invert the Power-Current curve. Find the current where the inverted power
-    # is minimized. This is i_mp. Start the optimization at v_oc/2
-    i_mp = i_from_v(resistance_shunt, resistance_series, nNsVth, v_mp,
-                    saturation_current, photocurrent)
+        # Invert the Power-Current curve. Find the current where the
+        # inverted power is minimized. This is i_mp. Start the
+        # optimization at v_oc/2
+        i_mp = i_from_v(resistance_shunt, resistance_series, nNsVth, v_mp,
+                        saturation_current, photocurrent)
+    else:
+        p_mp, v_mp, i_mp = _mpp_newton(resistance_shunt, resistance_series,
+                                       nNsVth, saturation_current,
+                                       photocurrent, v_oc)
 
     # Find Ix and Ixx using Lambert W
     i_x = i_from_v(resistance_shunt, resistance_series, nNsVth,
@@ -1689,6 +2141,427 @@ def singlediode(photocurrent, saturation_current, resistance_series,
     return out
 
 
+def _singlediode_chunked(photocurrent, saturation_current, resistance_series,
+                         resistance_shunt, nNsVth, ivcurve_pnts, method,
+                         chunksize, n_jobs, backend):
+    '''
+    singlediode in blocks of rows, optionally in a thread or process
+    pool, with the results written into preallocated arrays.
+    '''
+    if backend not in ('thread', 'process'):
+        raise ValueError("backend must be 'thread' or 'process', got {}"
+                         .format(backend))
+    if n_jobs is None:
+        n_jobs = multiprocessing.cpu_count()
+    n_jobs = max(int(n_jobs), 1)
+
+    params = np.broadcast_arrays(
+        *[np.asarray(p, dtype=np.float64) for p in
+          (photocurrent, saturation_current, resistance_series,
+           resistance_shunt, nNsVth)])
+    shape = params[0].shape
+    params = [p.reshape(-1) for p in params]
+    size = len(params[0])
+    if chunksize is None:
+        chunksize = -(-size // n_jobs)  # ceil division
+    chunksize = max(int(chunksize), 1)
+
+    keys = ['i_sc', 'v_oc', 'i_mp', 'v_mp', 'p_mp', 'i_x', 'i_xx']
+    out = OrderedDict((k, np.empty(size)) for k in keys)
+    if ivcurve_pnts:
+        out['v'] = np.empty((size, ivcurve_pnts))
+        out['i'] = np.empty((size, ivcurve_pnts))
+
+    blocks = [slice(start, start + chunksize)
+              for start in range(0, size, chunksize)]
+    tasks = ([p[block] for p in params] + [ivcurve_pnts, method]
+             for block in blocks)
+
+    def store(block, result):
+        for k in out:
+            out[k][block] = result[k]
+
+    if n_jobs == 1 or len(blocks) < 2:
+        for block, task in zip(blocks, tasks):
+            store(block, _singlediode_block(task))
+    else:
+        if backend == 'thread':
+            pool = ThreadPool(n_jobs)
+        else:
+            pool = multiprocessing.Pool(n_jobs)
+        try:
+            # submit at most two blocks per job ahead of the results that
+            # have been stored, so that only a few blocks are in flight
+            pending = deque()
+            for block, task in zip(blocks, tasks):
+                if len(pending) >= 2 * n_jobs:
+                    done, result = pending.popleft()
+                    store(done, result.get())
+                pending.append((block, pool.apply_async(_singlediode_block,
+                                                        (task, ))))
+            while pending:
+                done, result = pending.popleft()
+                store(done, result.get())
+        finally:
+            pool.close()
+            pool.join()
+
+    for k in out:
+        out[k] = out[k].reshape(shape + out[k].shape[1:])
+        if out[k].ndim == 0:
+            out[k] = out[k][()]
+
+    if isinstance(photocurrent, pd.Series) and not ivcurve_pnts:
+        out = pd.DataFrame(out, index=photocurrent.index)
+
+    return out
+
+
+def _singlediode_block(args):
+    '''
+    singlediode for one block of _singlediode_chunked. Takes a single
+    tuple of arguments so that it can be submitted to a pool.
+    '''
+    (photocurrent, saturation_current, resistance_series, resistance_shunt,
+     nNsVth, ivcurve_pnts, method) = args
+    return singlediode(photocurrent, saturation_current, resistance_series,
+                       resistance_shunt, nNsVth, ivcurve_pnts=ivcurve_pnts,
+                       method=method)
+
+
+def singlediode_ivcurves(photocurrent, saturation_current, resistance_series,
+                         resistance_shunt, nNsVth, ivcurve_pnts,
+                         chunksize=1000, spacing='linear'):
+    '''
+    Generate IV curves of the single-diode model in blocks of rows.
+
+    ``singlediode`` with ``ivcurve_pnts`` builds the IV curves for all
+    inputs at once, which needs memory proportional to the number of
+    inputs times ``ivcurve_pnts``. This generator instead yields the
+    curves for at most ``chunksize`` inputs at a time, so that long
+    time series can be processed with bounded memory.
+
+    Parameters
+    ----------
+    photocurrent : numeric
+        Light-generated current (photocurrent) in amperes under desired
+        IV curve conditions. Often abbreviated ``I_L``.
+
+    saturation_current : numeric
+        Diode saturation current in amperes under desired IV curve
+        conditions. Often abbreviated ``I_0``.
+
+    resistance_series : numeric
+        Series resistance in ohms under desired IV curve conditions.
+        Often abbreviated ``Rs``.
+
+    resistance_shunt : numeric
+        Shunt resistance in ohms under desired IV curve conditions.
+        Often abbreviated ``Rsh``.
+
+    nNsVth : numeric
+        The product of the diode ideality factor, the number of cells in
+        series and the cell thermal voltage. See ``singlediode``.
+
+    ivcurve_pnts : int
+        Number of points in each IV curve.
+
+    chunksize : int, default 1000
+        Maximum number of IV curves in each yielded block.
+
+    spacing : str, default 'linear'
+        Placement of the points on each curve. 'linear' spaces the
+        voltages evenly between 0 and v_oc, as in ``singlediode``.
+        'knee' spaces half of the points evenly in voltage and the
+        other half evenly in current between 0 and i_sc, which puts
+        more points around the knee of the curve and on its steep part
+        near v_oc. The points are returned in order of increasing
+        voltage. Each curve includes 0 and v_oc, so 'knee' requires
+        ivcurve_pnts >= 2.
+
+    Yields
+    ------
+    v, i : tuple of np.array
+        IV curve voltages in volts and currents in amperes, each of
+        shape ``(n, ivcurve_pnts)`` with ``n <= chunksize``. The blocks
+        follow the order of the inputs; block ``k`` holds inputs
+        ``k*chunksize`` to ``(k+1)*chunksize - 1``.
+
+    See also
+    --------
+    singlediode
+    '''
+
+    if spacing not in ('linear', 'knee'):
+        raise ValueError("spacing must be 'linear' or 'knee', got {}"
+                         .format(spacing))
+    if spacing == 'knee' and ivcurve_pnts < 2:
+        raise ValueError("spacing='knee' requires ivcurve_pnts >= 2")
+    if chunksize < 1:
+        raise ValueError('chunksize must be at least 1')
+
+    params = np.broadcast_arrays(
+        *[np.atleast_1d(np.asarray(p, dtype=float)) for p in
+          (photocurrent, saturation_current, resistance_series,
+           resistance_shunt, nNsVth)])
+    if params[0].ndim != 1:
+        raise ValueError('singlediode_ivcurves inputs must be 1-D')
+
+    for start in range(0, len(params[0]), chunksize):
+        IL, I0, Rs, Rsh, nNsVth_ = [p[start:start + chunksize]
+                                    for p in params]
+        yield _ivcurve(IL, I0, Rs, Rsh, nNsVth_, ivcurve_pnts, spacing)
+
+
+def _ivcurve(IL, I0, Rs, Rsh, nNsVth, ivcurve_pnts, spacing):
+    '''
+    IV curve points for 1-D arrays of single-diode parameters.
+    '''
+    v_oc = v_from_i(Rsh, Rs, nNsVth, 0.0, I0, IL)
+
+    if spacing == 'linear':
+        n_v = ivcurve_pnts
+    else:
+        # at least 0 and v_oc
+        n_v = max(ivcurve_pnts - ivcurve_pnts // 2, 2)
+
+    v = v_oc[:, np.newaxis] * np.linspace(0, 1, n_v)
+    i = i_from_v(Rsh, Rs, nNsVth, v.T, I0, IL).T
+
+    if spacing == 'knee':
+        # remaining points at evenly spaced currents strictly between 0
+        # and i_sc, then sort each curve by voltage
+        i_sc = i_from_v(Rsh, Rs, nNsVth, 0.0, I0, IL)
+        n_i = ivcurve_pnts - n_v
+        i_knee = i_sc[:, np.newaxis] * np.linspace(0, 1, n_i + 2)[1:-1]
+        v_knee = v_from_i(Rsh, Rs, nNsVth, i_knee.T, I0, IL).T
+        v = np.concatenate((v, v_knee), axis=1)
+        i = np.concatenate((i, i_knee), axis=1)
+        order = np.argsort(v, axis=1)
+        rows = np.arange(len(v))[:, np.newaxis]
+        v = v[rows, order]
+        i = i[rows, order]
+
+    return v, i
+
+
+# recently used singlediode_table results, keyed on the module parameters
+# and the table arguments
+_SINGLEDIODE_TABLES = tools.LRUCache(128 * 2**20)
+
+_SINGLEDIODE_TABLE_KEYS = ('i_sc', 'v_oc', 'i_mp', 'v_mp', 'p_mp', 'i_x',
+                           'i_xx')
+
+# quantities that are close to proportional to irradiance. These are
+# interpolated after dividing by irradiance.
+_SINGLEDIODE_TABLE_SCALED = ('i_sc', 'i_mp', 'p_mp', 'i_x', 'i_xx')
+
+
+def singlediode_table(module_parameters, irradiance_range=(1., 2000.),
+                      temp_range=(-50., 120.), rtol=1e-3):
+    '''
+    Tabulate the single-diode model of a module over a grid of
+    irradiance and cell temperature.
+
+    The table is computed with ``calcparams_desoto`` and ``singlediode``
+    and can be interpolated with ``singlediode_from_table``, which is
+    much faster than solving the single-diode model at every time step
+    when many systems use the same module. The grid is refined until
+    the interpolation error is below ``rtol``. Tables are cached, so a
+    second call with the same module parameters and arguments returns
+    the same table without recomputing it. The least recently used
+    tables are dropped from the cache when the cached tables use more
+    than 128 MB.
+
+    Parameters
+    ----------
+    module_parameters : dict or Series
+        CEC module parameters. Must contain the keys 'alpha_sc',
+        'a_ref', 'I_L_ref', 'I_o_ref', 'R_sh_ref', 'R_s', 'EgRef' and
+        'dEgdT'. See ``calcparams_desoto``.
+
+    irradiance_range : tuple of float, default (1, 2000)
+        Lowest and highest effective irradiance of the table in W/m^2.
+        The irradiance grid is spaced logarithmically.
+
+    temp_range : tuple of float, default (-50, 120)
+        Lowest and highest cell temperature of the table in C.
+
+    rtol : float, default 1e-3
+        Maximum interpolation error of each quantity as a fraction of
+        its largest value in the table.
+
+    Returns
+    -------
+    OrderedDict
+
+    The returned dict contains the keys:
+
+        * irradiance - irradiance grid in W/m^2, shape (M,).
+        * temp_cell - cell temperature grid in C, shape (N,).
+        * i_sc, v_oc, i_mp, v_mp, p_mp, i_x, i_xx - ``singlediode``
+          outputs at the grid points, shape (M, N).
+        * error - OrderedDict of the largest interpolation error of
+          each quantity as a fraction of its largest value in the
+          table.
+
+    The arrays are read-only because the table is shared by all
+    callers.
+
+    Notes
+    -----
+    The error is measured at the centers of the grid cells, where
+    bilinear interpolation of a smooth function is least accurate.
+    The grid spacing is halved in both directions, up to 6 times,
+    until the error of every quantity is below ``rtol``. A warning is
+    raised if ``rtol`` cannot be reached.
+
+    See also
+    --------
+    singlediode_from_table
+    calcparams_desoto
+    singlediode
+    '''
+
+    params = tuple(float(module_parameters[k]) for k in
+                   ('alpha_sc', 'a_ref', 'I_L_ref', 'I_o_ref', 'R_sh_ref',
+                    'R_s', 'EgRef', 'dEgdT'))
+    key = (params, tuple(irradiance_range), tuple(temp_range), rtol)
+    table = _SINGLEDIODE_TABLES.get(key)
+    if table is not None:
+        return table
+
+    def solve(irrad, temp_cell):
+        desoto = calcparams_desoto(irrad.ravel(), temp_cell.ravel(),
+                                   params[0], module_parameters, params[6],
+                                   params[7])
+        sd = singlediode(*desoto, method='newton')
+        return OrderedDict((k, sd[k].reshape(irrad.shape))
+                           for k in _SINGLEDIODE_TABLE_KEYS)
+
+    log_irrad_range = np.log10(irradiance_range)
+    n_irrad, n_temp = 17, 9
+    for refinement in range(7):
+        irrad = np.logspace(log_irrad_range[0], log_irrad_range[1], n_irrad)
+        temp_cell = np.linspace(temp_range[0], temp_range[1], n_temp)
+        table = OrderedDict([('irradiance', irrad),
+                             ('temp_cell', temp_cell)])
+        grid = solve(*np.meshgrid(irrad, temp_cell, indexing='ij'))
+        table.update(grid)
+
+        # exact and interpolated values at the grid cell centers
+        irrad_mid, temp_mid = np.meshgrid(np.sqrt(irrad[1:] * irrad[:-1]),
+                                          (temp_cell[1:] + temp_cell[:-1])/2,
+                                          indexing='ij')
+        exact = solve(irrad_mid, temp_mid)
+        interp = singlediode_from_table(table, irrad_mid, temp_mid)
+        table['error'] = OrderedDict(
+            (k, np.nanmax(np.abs(interp[k] - exact[k])) /
+             np.nanmax(np.abs(grid[k]))) for k in _SINGLEDIODE_TABLE_KEYS)
+
+        if max(table['error'].values()) <= rtol:
+            break
+        n_irrad, n_temp = 2*n_irrad - 1, 2*n_temp - 1
+    else:
+        warnings.warn('singlediode_table could not reach rtol={}, the '
+                      'largest error is {}'
+                      .format(rtol, max(table['error'].values())))
+
+    for k in table:
+        if k != 'error':
+            table[k].flags.writeable = False
+
+    nbytes = sum(v.nbytes for k, v in table.items() if k != 'error')
+    _SINGLEDIODE_TABLES.set(key, table, nbytes)
+    return table
+
+
+def singlediode_from_table(table, effective_irradiance, temp_cell):
+    '''
+    Interpolate the single-diode model from a table made by
+    ``singlediode_table``.
+
+    Parameters
+    ----------
+    table : dict
+        Table returned by ``singlediode_table``.
+
+    effective_irradiance : numeric
+        The irradiance (in W/m^2) absorbed by the module.
+
+    temp_cell : numeric
+        The average cell temperature of cells within a module in C.
+
+    Returns
+    -------
+    OrderedDict or DataFrame
+
+    The returned dict-like object contains the keys/columns i_sc, v_oc,
+    i_mp, v_mp, p_mp, i_x and i_xx. See ``singlediode``. The values are
+    NaN where ``effective_irradiance`` or ``temp_cell`` is outside of
+    the table, including at irradiance below the lowest irradiance of
+    the table.
+
+    The output will be a DataFrame if effective_irradiance is a Series.
+
+    Notes
+    -----
+    The voltages are interpolated bilinearly in log(irradiance) and
+    temperature. The currents and power are close to proportional to
+    irradiance, so they are divided by irradiance before
+    interpolating, which makes the interpolation much more accurate.
+
+    See also
+    --------
+    singlediode_table
+    '''
+
+    irrad_grid = np.log(table['irradiance'])
+    temp_grid = table['temp_cell']
+
+    irrad = np.asarray(effective_irradiance, dtype=float)
+    temp = np.asarray(temp_cell, dtype=float)
+    irrad, temp = np.broadcast_arrays(irrad, temp)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_irrad = np.log(irrad)
+
+    # index of the lower grid point and the weight of the upper one.
+    # eps accepts points at the ends of the grid despite rounding.
+    i = np.clip(np.searchsorted(irrad_grid, log_irrad) - 1, 0,
+                len(irrad_grid) - 2)
+    j = np.clip(np.searchsorted(temp_grid, temp) - 1, 0,
+                len(temp_grid) - 2)
+    w_irrad = (log_irrad - irrad_grid[i]) / (irrad_grid[i+1] - irrad_grid[i])
+    w_temp = (temp - temp_grid[j]) / (temp_grid[j+1] - temp_grid[j])
+    eps = 1e-9
+    outside = ((w_irrad < -eps) | (w_irrad > 1 + eps) | (w_temp < -eps) |
+               (w_temp > 1 + eps) | np.isnan(w_irrad) | np.isnan(w_temp))
+    too_hot_or_bright = ((irrad > table['irradiance'][-1]) |
+                         (temp < temp_grid[0]) | (temp > temp_grid[-1]))
+    if np.any(too_hot_or_bright):
+        warnings.warn('singlediode_from_table inputs are outside of the '
+                      'table, the outputs there are NaN')
+
+    out = OrderedDict()
+    for k in _SINGLEDIODE_TABLE_KEYS:
+        values = table[k]
+        if k in _SINGLEDIODE_TABLE_SCALED:
+            values = values / table['irradiance'][:, np.newaxis]
+        with np.errstate(invalid='ignore'):
+            value = ((1 - w_irrad) * (1 - w_temp) * values[i, j] +
+                     w_irrad * (1 - w_temp) * values[i+1, j] +
+                     (1 - w_irrad) * w_temp * values[i, j+1] +
+                     w_irrad * w_temp * values[i+1, j+1])
+            if k in _SINGLEDIODE_TABLE_SCALED:
+                value = value * irrad
+        out[k] = np.where(outside, np.nan, value)
+
+    if isinstance(effective_irradiance, pd.Series):
+        out = pd.DataFrame(out, index=effective_irradiance.index)
+
+    return out
+
+
 # Created April,2014
 # Author: Rob Andrews, Calama Consulting
 
@@ -1771,6 +2644,82 @@ def _pwr_optfcn(df, loc):
     return I*df[loc]
 
 
+def _mpp_newton(resistance_shunt, resistance_series, nNsVth,
+                saturation_current, photocurrent, v_oc, vtol=1e-8,
+                maxiter=50):
+    '''
+    Vectorized bracketed Newton search for the maximum power point.
+
+    Solves dP/dV = I + V*dI/dV = 0 on [0, v_oc]. With I=f(V) from Eq 2
+    of Jain and Kapoor 2004, dI/dV and d2I/dV2 are closed-form in the
+    Lambert W term, and P(V) is concave, so each row has a single root.
+    Steps that leave the bracket fall back to bisection. Converged rows
+    are removed from the iteration.
+
+    Returns
+    -------
+    p_mp, v_mp, i_mp : numeric
+    '''
+    Rsh, Rs, nNsVth, I0, IL, v_oc = np.broadcast_arrays(
+        *[np.asarray(x, dtype=np.float64) for x in
+          (resistance_shunt, resistance_series, nNsVth, saturation_current,
+           photocurrent, v_oc)])
+    shape = v_oc.shape
+    Rsh, Rs, nNsVth, I0, IL, v_oc = [x.ravel() for x in
+                                     (Rsh, Rs, nNsVth, I0, IL, v_oc)]
+
+    v_mp = np.full(v_oc.shape, np.nan)
+    i_mp = np.full(v_oc.shape, np.nan)
+
+    # rows with no power are at v = 0
+    zero = v_oc <= 0
+    v_mp[zero] = 0.
+    active = np.flatnonzero(np.isfinite(v_oc) & ~zero)
+
+    def _iv_derivatives(idx, v):
+        rsh, rs, a = Rsh[idx], Rs[idx], nNsVth[idx]
+        i0, il = I0[idx], IL[idx]
+        rsum = rs + rsh
+        w = _i_from_v_lambertw_term(rsh, rs, a, v, i0, il)
+        i = -v/rsum - (a/rs)*w + rsh*(il + i0)/rsum
+        di = -(1 + rsh/rs * w/(1 + w)) / rsum
+        d2i = -(rsh**2 * w) / (rs * a * rsum**2 * (1 + w)**3)
+        return i, di, d2i
+
+    lo = np.zeros(len(active))
+    hi = v_oc[active]
+    v = 0.8 * hi
+    for _ in range(maxiter):
+        if len(active) == 0:
+            break
+        i, di, d2i = _iv_derivatives(active, v)
+        g = i + v*di
+        dg = 2*di + v*d2i
+        # g decreases with v, so g > 0 means the root is above v
+        lo = np.where(g > 0, v, lo)
+        hi = np.where(g > 0, hi, v)
+        step = g/dg
+        v_new = v - step
+        done = (np.abs(step) < vtol) | (hi - lo < vtol)
+        outside = ~((v_new >= lo) & (v_new <= hi)) & ~done
+        v_new[outside] = 0.5*(lo[outside] + hi[outside])
+
+        v_mp[active[done]] = v_new[done]
+        keep = ~done
+        active, v, lo, hi = active[keep], v_new[keep], lo[keep], hi[keep]
+    else:
+        v_mp[active] = v
+
+    valid = np.flatnonzero(np.isfinite(v_mp) & ~zero)
+    i_mp[valid] = _iv_derivatives(valid, v_mp[valid])[0]
+    i_mp[zero] = np.maximum(IL[zero], 0.)
+    p_mp = v_mp * i_mp
+
+    if shape == ():
+        return p_mp[0], v_mp[0], i_mp[0]
+    return p_mp.reshape(shape), v_mp.reshape(shape), i_mp.reshape(shape)
+
+
 def v_from_i(resistance_shunt, resistance_series, nNsVth, current,
              saturation_current, photocurrent):
     '''
@@ -1816,35 +2765,21 @@ def v_from_i(resistance_shunt, resistance_series, nNsVth, current,
     parameters of real solar cells using Lambert W-function", Solar
     Energy Materials and Solar Cells, 81 (2004) 269-277.
     '''
-    try:
-        from scipy.special import lambertw
-    except ImportError:
-        raise ImportError('This function requires scipy')
-
     Rsh = resistance_shunt
     Rs = resistance_series
     I0 = saturation_current
     IL = photocurrent
     I = current
 
-    argW = I0 * Rsh / nNsVth * np.exp(Rsh * (-I + IL + I0) / nNsVth)
-    lambertwterm = lambertw(argW).real
-
-    # Calculate using log(argW) in case argW is really big
-    logargW = (np.log(I0) + np.log(Rsh) - np.log(nNsVth) +
-               Rsh * (-I + IL + I0) / nNsVth)
+    with np.errstate(over='ignore'):
+        argW = I0 * Rsh / nNsVth * np.exp(Rsh * (-I + IL + I0) / nNsVth)
 
-    # Three iterations of Newton-Raphson method to solve
-    # w+log(w)=logargW. The initial guess is w=logargW. Where direct
-    # evaluation (above) results in NaN from overflow, 3 iterations
-    # of Newton's method gives approximately 8 digits of precision.
-    w = logargW
-    for i in range(0, 3):
-        w = w * (1 - np.log(w) + logargW) / (1 + w)
-    lambertwterm_log = w
+    def logargW():
+        # log(argW), for where argW is really big
+        return (np.log(I0) + np.log(Rsh) - np.log(nNsVth) +
+                Rsh * (-I + IL + I0) / nNsVth)
 
-    lambertwterm = np.where(np.isfinite(lambertwterm), lambertwterm,
-                            lambertwterm_log)
+    lambertwterm = _lambertw_term(argW, logargW)
 
     # Eqn. 3 in Jain and Kapoor, 2004
     V = -I*(Rs + Rsh) + IL*Rsh - nNsVth*lambertwterm + I0*Rsh
@@ -1897,11 +2832,6 @@ def i_from_v(resistance_shunt, resistance_series, nNsVth, voltage,
     parameters of real solar cells using Lambert W-function", Solar
     Energy Materials and Solar Cells, 81 (2004) 269-277.
     '''
-    try:
-        from scipy.special import lambertw
-    except ImportError:
-        raise ImportError('This function requires scipy')
-
     # asarray turns Series into arrays so that we don't have to worry
     # about multidimensional broadcasting failing
     Rsh = np.asarray(resistance_shunt)
@@ -1909,11 +2839,9 @@ def i_from_v(resistance_shunt, resistance_series, nNsVth, voltage,
     I0 = np.asarray(saturation_current)
     IL = np.asarray(photocurrent)
     V = np.asarray(voltage)
+    nNsVth = np.asarray(nNsVth)
 
-    argW = (Rs*I0*Rsh *
-            np.exp(Rsh*(Rs*(IL+I0)+V) / (nNsVth*(Rs+Rsh))) /
-            (nNsVth*(Rs + Rsh)))
-    lambertwterm = lambertw(argW).real
+    lambertwterm = _i_from_v_lambertw_term(Rsh, Rs, nNsVth, V, I0, IL)
 
     # Eqn. 4 in Jain and Kapoor, 2004
     I = -V/(Rs + Rsh) - (nNsVth/Rs)*lambertwterm + Rsh*(IL + I0)/(Rs + Rsh)
@@ -1921,7 +2849,37 @@ def i_from_v(resistance_shunt, resistance_series, nNsVth, voltage,
     return I
 
 
-def snlinverter(v_dc, p_dc, inverter):
+def _i_from_v_lambertw_term(Rsh, Rs, nNsVth, V, I0, IL):
+    '''
+    Lambert W term in Eq 2 of Jain and Kapoor 2004.
+    '''
+    with np.errstate(over='ignore'):
+        argW = (Rs*I0*Rsh *
+                np.exp(Rsh*(Rs*(IL+I0)+V) / (nNsVth*(Rs+Rsh))) /
+                (nNsVth*(Rs + Rsh)))
+
+    def logargW():
+        return (np.log(Rs) + np.log(I0) + np.log(Rsh) - np.log(nNsVth) -
+                np.log(Rs + Rsh) + Rsh*(Rs*(IL+I0)+V) / (nNsVth*(Rs+Rsh)))
+
+    return _lambertw_term(argW, logargW)
+
+
+def _lambertw_term(argW, logargW):
+    '''
+    Real Lambert W of argW. Where argW overflows, W is instead evaluated
+    from its logarithm, which is given by calling logargW().
+    '''
+    lambertwterm = lambertw_real(argW)
+    overflow = np.isposinf(argW)
+    if np.any(overflow):
+        lambertwterm = np.array(lambertwterm)
+        lambertwterm[overflow] = lambertw_log(
+            np.broadcast_arrays(logargW(), overflow)[0][overflow])
+    return lambertwterm
+
+
+def snlinverter(v_dc, p_dc, inverter, out=None):
     '''
     Converts DC power and voltage to AC power using Sandia's
     Grid-Connected PV Inverter model.
@@ -1980,6 +2938,15 @@ def snlinverter(v_dc, p_dc, inverter):
                  maintain circuitry required to sense PV array voltage (W)
         ======   ============================================================
 
+        The parameters may also be arrays with one value per inverter,
+        for example ``retrieve_sam('cecinverter')[names].T``, to model
+        several inverters at once. v_dc and p_dc then broadcast against
+        them, e.g. as arrays of shape (time, inverter).
+
+    out : None or np.array, default None
+        Array in which to store the result. It must have the broadcast
+        shape of the inputs.
+
     Returns
     -------
     ac_power : numeric
@@ -1990,7 +2957,15 @@ def snlinverter(v_dc, p_dc, inverter):
         ac_power is set to -1*abs(Pnt) to represent nightly power
         losses. ac_power is not adjusted for maximum power point
         tracking (MPPT) voltage windows or maximum current limits of the
-        inverter.
+        inverter. If out is given, ac_power is out.
+
+    Notes
+    -----
+    If the ``PVLIB_USE_NUMBA`` environment variable is set and numba is
+    installed, the model is evaluated by a compiled ufunc that computes
+    each element in one pass, without temporary arrays. Otherwise it is
+    evaluated by in-place numpy operations in out (or a new array) and
+    four temporary arrays of the output shape.
 
     References
     ----------
@@ -2004,32 +2979,230 @@ def snlinverter(v_dc, p_dc, inverter):
     --------
     sapm
     singlediode
+    snlinverter_batch
     '''
 
-    Paco = inverter['Paco']
-    Pdco = inverter['Pdco']
-    Vdco = inverter['Vdco']
-    Pso = inverter['Pso']
-    C0 = inverter['C0']
-    C1 = inverter['C1']
-    C2 = inverter['C2']
-    C3 = inverter['C3']
-    Pnt = inverter['Pnt']
-
-    A = Pdco * (1 + C1*(v_dc - Vdco))
-    B = Pso * (1 + C2*(v_dc - Vdco))
-    C = C0 * (1 + C3*(v_dc - Vdco))
-
-    ac_power = (Paco/(A-B) - C*(A-B)) * (p_dc-B) + C*((p_dc-B)**2)
-    ac_power = np.minimum(Paco, ac_power)
-    ac_power = np.where(p_dc < Pso, -1.0 * abs(Pnt), ac_power)
-
-    if isinstance(p_dc, pd.Series):
+    params = [np.asarray(inverter[k], dtype=np.float64) for k in
+              ('Paco', 'Pdco', 'Vdco', 'Pso', 'C0', 'C1', 'C2', 'C3', 'Pnt')]
+
+    series = isinstance(p_dc, pd.Series) and out is None
+
+    ufuncs = _get_power_ufuncs()
+    if ufuncs is not None:
+        ac_power = ufuncs['snlinverter'](np.asarray(v_dc, dtype=np.float64),
+                                         np.asarray(p_dc, dtype=np.float64),
+                                         *params, out=out)
+    else:
+        Paco, Pdco, Vdco, Pso, C0, C1, C2, C3, Pnt = params
+        v_dc_ = np.asarray(v_dc)
+        p_dc_ = np.asarray(p_dc)
+
+        shape = np.broadcast(v_dc_, p_dc_, *params).shape
+        if out is None:
+            out = np.empty(shape)
+        night = np.empty(shape, dtype=bool)
+        B = np.empty(shape)
+        C = np.empty(shape)
+        p_B = np.empty(shape)
+
+        # the inputs are read before out is written, so that out may be
+        # the v_dc or p_dc buffer
+        np.less(p_dc_, Pso, out=night)
+        dv = np.subtract(v_dc_, Vdco, out=C)
+        np.multiply(C2, dv, out=B)
+        B += 1
+        B *= Pso
+        np.subtract(p_dc_, B, out=p_B)
+
+        A_B = np.multiply(C1, dv, out=out)
+        A_B += 1
+        A_B *= Pdco
+        A_B -= B
+        C *= C3
+        C += 1
+        C *= C0
+
+        # ac_power = (Paco/A_B - C*A_B) * p_B + C*(p_B**2)
+        C_A_B = np.multiply(C, A_B, out=B)
+        ac_power = np.divide(Paco, A_B, out=out)
+        ac_power -= C_A_B
+        ac_power *= p_B
+        p_B *= p_B
+        p_B *= C
+        ac_power += p_B
+        np.minimum(Paco, ac_power, out=ac_power)
+        np.copyto(ac_power, -1.0 * abs(Pnt), where=night)
+
+    if series:
         ac_power = pd.Series(ac_power, index=p_dc.index)
 
     return ac_power
 
 
+def snlinverter_batch(v_dc, p_dc, inverters, energy=False):
+    '''
+    Evaluate Sandia's Grid-Connected PV Inverter model for many
+    inverters at once.
+
+    Parameters
+    ----------
+    v_dc : numeric
+        DC voltages, in volts. A 1-D profile is applied to every
+        inverter. A 2-D array has shape (time, inverter).
+
+    p_dc : numeric
+        DC powers, in watts, with the same shape rules as v_dc.
+
+    inverters : DataFrame
+        Inverter parameters, for example
+        ``retrieve_sam('cecinverter')`` or a selection of its columns,
+        with one column per inverter. A DataFrame with one row per
+        inverter is also accepted. See ``snlinverter`` for the required
+        parameters.
+
+    energy : bool, default False
+        If True, return the AC energy of each inverter instead of the
+        AC power at each time. The energy is computed in blocks of
+        time, so the (time, inverter) matrix is never held in memory.
+
+    Returns
+    -------
+    ac_power : DataFrame or Series
+        If energy is False, the AC power in watts as a DataFrame with
+        one row per time and one column per inverter. The index is the
+        index of p_dc if it is a Series. If energy is True, a Series of
+        the AC energy in Wh of each inverter, which is the sum over time
+        of AC power times the time step in hours. The time step is the
+        median spacing of p_dc's DatetimeIndex, or 1 hour otherwise. NaN
+        AC powers are left out of the sum.
+
+    See also
+    --------
+    snlinverter
+    retrieve_sam
+    '''
+    if 'Paco' not in inverters.columns:
+        inverters = inverters.T
+    params = dict((k, np.asarray(inverters[k], dtype=np.float64)) for k in
+                  ('Paco', 'Pdco', 'Vdco', 'Pso', 'C0', 'C1', 'C2', 'C3',
+                   'Pnt'))
+
+    index = getattr(p_dc, 'index', None)
+    # promote each 1-D profile to a (time, 1) column
+    v_dc, p_dc = [np.asarray(x, dtype=np.float64) for x in (v_dc, p_dc)]
+    v_dc, p_dc = [np.atleast_1d(x)[:, np.newaxis] if x.ndim < 2 else x
+                  for x in (v_dc, p_dc)]
+    n_inverters = len(inverters)
+    try:
+        v_dc, p_dc = np.broadcast_arrays(v_dc, p_dc)
+    except ValueError:
+        raise ValueError('v_dc and p_dc must have the same number of times, '
+                         'got shapes {} and {}'.format(v_dc.shape,
+                                                       p_dc.shape))
+    if p_dc.ndim != 2 or p_dc.shape[1] not in (1, n_inverters):
+        raise ValueError('v_dc and p_dc must be 1-D or have shape (time, {}),'
+                         ' got shape {}'.format(n_inverters, p_dc.shape))
+    n_times = len(p_dc)
+
+    # evaluate blocks of about 2**18 elements, which bounds the size of
+    # the temporary arrays
+    rows = max(2**18 // n_inverters, 1)
+    if energy:
+        buffer = np.empty((min(rows, n_times), n_inverters))
+        total = np.zeros(n_inverters)
+    else:
+        ac_power = np.empty((n_times, n_inverters))
+    for start in range(0, n_times, rows):
+        block = slice(start, start + rows)
+        if energy:
+            out = buffer[:len(p_dc[block])]
+        else:
+            out = ac_power[block]
+        snlinverter(v_dc[block], p_dc[block], params, out=out)
+        if energy:
+            total += np.nansum(out, axis=0)
+
+    if not energy:
+        return pd.DataFrame(ac_power, index=index, columns=inverters.index)
+
+    if isinstance(index, pd.DatetimeIndex) and len(index) > 1:
+        hours = np.median(np.diff(index.asi8)) / 3.6e12
+    else:
+        hours = 1.
+
+    return pd.Series(total * hours, index=inverters.index)
+
+
+def _make_power_kernels(jit):
+    '''
+    Scalar versions of snlinverter, pvwatts_dc and pvwatts_ac. jit is
+    applied to each function, so the kernels may be compiled with numba.
+    '''
+
+    @jit
+    def snl(v_dc, p_dc, Paco, Pdco, Vdco, Pso, C0, C1, C2, C3, Pnt):
+        if p_dc < Pso:
+            return -1.0 * abs(Pnt)
+        A = Pdco * (1 + C1*(v_dc - Vdco))
+        B = Pso * (1 + C2*(v_dc - Vdco))
+        C = C0 * (1 + C3*(v_dc - Vdco))
+        ac_power = (Paco/(A-B) - C*(A-B)) * (p_dc-B) + C*((p_dc-B)**2)
+        if ac_power > Paco:
+            ac_power = Paco
+        return ac_power
+
+    @jit
+    def pvw_dc(g_poa_effective, temp_cell, pdc0, gamma_pdc, temp_ref):
+        return (g_poa_effective * 0.001 * pdc0 *
+                (1 + gamma_pdc * (temp_cell - temp_ref)))
+
+    @jit
+    def pvw_ac(pdc, pdc0, eta_inv_nom, eta_inv_ref):
+        pac0 = eta_inv_nom * pdc0
+        zeta = pdc / pdc0
+        eta = eta_inv_nom / eta_inv_ref * (-0.0162*zeta - 0.0059/zeta +
+                                           0.9858)
+        pac = eta * pdc
+        if pac > pac0:
+            pac = pac0
+        return pac
+
+    return snl, pvw_dc, pvw_ac
+
+
+_POWER_UFUNCS = []
+_POWER_UFUNCS_LOCK = threading.Lock()
+
+
+def _get_power_ufuncs():
+    '''
+    Compile the scalar power kernels to numba ufuncs on first use.
+    Returns None if numba is not enabled with PVLIB_USE_NUMBA or not
+    installed.
+    '''
+    with _POWER_UFUNCS_LOCK:
+        if not _POWER_UFUNCS:
+            ufuncs = None
+            if os.getenv('PVLIB_USE_NUMBA', '0') != '0':
+                try:
+                    import numba
+                except ImportError:
+                    pass
+                else:
+                    cache = os.getenv('PVLIB_NUMBA_CACHE', '0') != '0'
+                    snl, pvw_dc, pvw_ac = _make_power_kernels(lambda f: f)
+                    ufuncs = {}
+                    for name, func, nargs in (('snlinverter', snl, 11),
+                                              ('pvwatts_dc', pvw_dc, 5),
+                                              ('pvwatts_ac', pvw_ac, 4)):
+                        signature = 'float64({})'.format(
+                            ', '.join(['float64'] * nargs))
+                        ufuncs[name] = numba.vectorize(
+                            [signature], cache=cache)(func)
+            _POWER_UFUNCS.append(ufuncs)
+    return _POWER_UFUNCS[0]
+
+
 def scale_voltage_current_power(data, voltage=1, current=1):
     """
     Scales the voltage, current, and power of the DataFrames
@@ -2064,7 +3237,8 @@ def scale_voltage_current_power(data, voltage=1, current=1):
     return data
 
 
-def pvwatts_dc(g_poa_effective, temp_cell, pdc0, gamma_pdc, temp_ref=25.):
+def pvwatts_dc(g_poa_effective, temp_cell, pdc0, gamma_pdc, temp_ref=25.,
+               out=None):
     r"""
     Implements NREL's PVWatts DC power model [1]_:
 
@@ -2089,11 +3263,20 @@ def pvwatts_dc(g_poa_effective, temp_cell, pdc0, gamma_pdc, temp_ref=25.):
     temp_ref: numeric
         Cell reference temperature. PVWatts defines it to be 25 C and
         is included here for flexibility.
+    out: None or np.array
+        Array in which to store the result. It must have the broadcast
+        shape of the inputs.
 
     Returns
     -------
     pdc: numeric
-        DC power.
+        DC power. If out is given, pdc is out.
+
+    Notes
+    -----
+    If the ``PVLIB_USE_NUMBA`` environment variable is set and numba is
+    installed, the model is evaluated by a compiled ufunc. Otherwise, if
+    out is given, the result is computed in place in out.
 
     References
     ----------
@@ -2102,8 +3285,30 @@ def pvwatts_dc(g_poa_effective, temp_cell, pdc0, gamma_pdc, temp_ref=25.):
            (2014).
     """
 
-    pdc = (g_poa_effective * 0.001 * pdc0 *
-           (1 + gamma_pdc * (temp_cell - temp_ref)))
+    ufuncs = _get_power_ufuncs()
+    if ufuncs is not None:
+        pdc = ufuncs['pvwatts_dc'](
+            *[np.asarray(x, dtype=np.float64) for x in
+              (g_poa_effective, temp_cell, pdc0, gamma_pdc, temp_ref)],
+            out=out)
+        # wrap the result like the pandas arithmetic of the numpy path
+        if out is None:
+            for x in (g_poa_effective, temp_cell):
+                if isinstance(x, pd.DataFrame) and x.shape == pdc.shape:
+                    pdc = pd.DataFrame(pdc, index=x.index, columns=x.columns)
+                    break
+                elif isinstance(x, pd.Series) and x.shape == pdc.shape:
+                    pdc = pd.Series(pdc, index=x.index)
+                    break
+    elif out is not None:
+        # the temperature factor goes in a temporary array so that out may
+        # be the g_poa_effective or temp_cell buffer
+        factor = 0.001 * pdc0 * (1 + gamma_pdc *
+                                 (np.asarray(temp_cell) - temp_ref))
+        pdc = np.multiply(np.asarray(g_poa_effective), factor, out=out)
+    else:
+        pdc = (g_poa_effective * 0.001 * pdc0 *
+               (1 + gamma_pdc * (temp_cell - temp_ref)))
 
     return pdc
 
@@ -2161,7 +3366,7 @@ def pvwatts_losses(soiling=2, shading=3, snow=0, mismatch=2, wiring=2,
     return losses
 
 
-def pvwatts_ac(pdc, pdc0, eta_inv_nom=0.96, eta_inv_ref=0.9637):
+def pvwatts_ac(pdc, pdc0, eta_inv_nom=0.96, eta_inv_ref=0.9637, out=None):
     r"""
     Implements NREL's PVWatts inverter model [1]_.
 
@@ -2186,11 +3391,22 @@ def pvwatts_ac(pdc, pdc0, eta_inv_nom=0.96, eta_inv_ref=0.9637):
     eta_inv_ref: numeric
         Reference inverter efficiency. PVWatts defines it to be 0.9637
         and is included here for flexibility.
+    out: None or np.array
+        Array in which to store the result. It must have the broadcast
+        shape of the inputs.
 
     Returns
     -------
     pac: numeric
-        AC power.
+        AC power. If out is given, pac is out.
+
+    Notes
+    -----
+    If the ``PVLIB_USE_NUMBA`` environment variable is set and numba is
+    installed, the model is evaluated by a compiled ufunc that computes
+    each element in one pass, without temporary arrays. Otherwise, if out
+    is given, it is evaluated by in-place numpy operations in out and two
+    temporary arrays of the output shape.
 
     References
     ----------
@@ -2199,6 +3415,32 @@ def pvwatts_ac(pdc, pdc0, eta_inv_nom=0.96, eta_inv_ref=0.9637):
            (2014).
     """
 
+    ufuncs = _get_power_ufuncs()
+    if ufuncs is not None:
+        pac = ufuncs['pvwatts_ac'](
+            *[np.asarray(x, dtype=np.float64) for x in
+              (pdc, pdc0, eta_inv_nom, eta_inv_ref)],
+            out=out)
+        if isinstance(pdc, pd.Series) and out is None:
+            pac = pd.Series(pac, index=pdc.index)
+        return pac
+
+    if out is not None:
+        pdc = np.asarray(pdc)
+        shape = np.broadcast(pdc, pdc0, eta_inv_nom, eta_inv_ref).shape
+        zeta = np.empty(shape)
+        tmp = np.empty(shape)
+
+        # out is only written at the end, so that it may be the pdc buffer
+        np.divide(pdc, pdc0, out=zeta)
+        np.divide(0.0059, zeta, out=tmp)
+        eta = np.multiply(-0.0162, zeta, out=zeta)
+        eta -= tmp
+        eta += 0.9858
+        np.multiply(eta_inv_nom / eta_inv_ref, eta, out=eta)
+        pac = np.multiply(eta, pdc, out=out)
+        return np.minimum(eta_inv_nom * pdc0, pac, out=pac)
+
     pac0 = eta_inv_nom * pdc0
     zeta = pdc / pdc0
 
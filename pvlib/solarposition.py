@@ -12,21 +12,20 @@ import os
 import logging
 pvl_logger = logging.getLogger('pvlib')
 import datetime as dt
-try:
-    from importlib import reload
-except ImportError:
-    try:
-        from imp import reload
-    except ImportError:
-        pass
-
+from collections import OrderedDict
+import hashlib
+import multiprocessing
+import threading
 import warnings
+import zipfile
 
 import numpy as np
 import pandas as pd
 
 from pvlib import atmosphere
-from pvlib.tools import localize_to_utc, datetime_to_djd, djd_to_datetime
+from pvlib.version import __version__
+from pvlib.tools import (localize_to_utc, datetime_to_djd, djd_to_datetime,
+                         LRUCache, _hash_key, _atomic_write)
 
 
 def get_solarposition(time, latitude, longitude,
@@ -58,12 +57,21 @@ def get_solarposition(time, latitude, longitude,
         'nrel_numba' uses an implementation of the NREL SPA algorithm
         described in [1], but also compiles the code first: :func:`spa_python`
 
+        'nrel_numpy_interp' uses the numpy implementation of the NREL SPA
+        algorithm, but calculates the time dependent terms exactly only
+        at anchor times every ``anchor_freq`` (default '5min') and
+        interpolates them: :func:`spa_python`. Suitable for high
+        resolution time series.
+
         'ephemeris' uses the pvlib ephemeris code: :func:`ephemeris`
     temperature : float
         Degrees C.
 
     Other keywords are passed to the underlying solar position function.
 
+    If :py:func:`enable_cache` has been called, results are cached and
+    reused for repeated calls with the same arguments.
+
     References
     ----------
     [1] I. Reda and A. Andreas, Solar position algorithm for solar radiation
@@ -87,6 +95,16 @@ def get_solarposition(time, latitude, longitude,
     if isinstance(time, dt.datetime):
         time = pd.DatetimeIndex([time, ])
 
+    cache = _solar_position_cache
+    if cache is not None and isinstance(time, pd.DatetimeIndex):
+        key = _hash_key((time, latitude, longitude, altitude, pressure,
+                         temperature, method, kwargs))
+        ephem_df = cache.get(key, time)
+        if ephem_df is not None:
+            return ephem_df
+    else:
+        cache = None
+
     if method == 'nrel_c':
         ephem_df = spa_c(time, latitude, longitude, pressure, temperature,
                          **kwargs)
@@ -98,6 +116,11 @@ def get_solarposition(time, latitude, longitude,
         ephem_df = spa_python(time, latitude, longitude, altitude,
                               pressure, temperature,
                               how='numpy', **kwargs)
+    elif method == 'nrel_numpy_interp':
+        kwargs.setdefault('anchor_freq', '5min')
+        ephem_df = spa_python(time, latitude, longitude, altitude,
+                              pressure, temperature,
+                              how='numpy', **kwargs)
     elif method == 'pyephem':
         ephem_df = pyephem(time, latitude, longitude, pressure, temperature,
                            **kwargs)
@@ -107,9 +130,128 @@ def get_solarposition(time, latitude, longitude,
     else:
         raise ValueError('Invalid solar position method')
 
+    if cache is not None:
+        cache.set(key, ephem_df)
+
     return ephem_df
 
 
+class SolarPositionCache(object):
+    """
+    A least recently used cache of solar position results.
+
+    The cache is keyed on the times, location, atmospheric parameters,
+    method and any other arguments passed to
+    :py:func:`get_solarposition`. Use :py:func:`enable_cache` to have
+    :py:func:`get_solarposition`, and therefore
+    :py:meth:`pvlib.location.Location.get_solarposition` and
+    :py:class:`pvlib.modelchain.ModelChain`, use a cache.
+
+    Parameters
+    ----------
+    max_bytes : int, default 256 MB
+        Memory budget of the cache. Least recently used results are
+        evicted when it is exceeded.
+    path : None or str
+        If not None, results are also saved to ``.npz`` files in this
+        directory and reloaded from it when they are not in memory,
+        including by other processes.
+    """
+
+    def __init__(self, max_bytes=256 * 2**20, path=None):
+        self.path = path
+        self._memory = LRUCache(max_bytes)
+        if path is not None and not os.path.isdir(path):
+            os.makedirs(path)
+
+    def _filename(self, key):
+        # results saved by other pvlib versions may come from different
+        # algorithms
+        digest = hashlib.sha1(
+            repr((__version__, key)).encode('utf-8')).hexdigest()
+        return os.path.join(self.path, 'solarposition_' + digest + '.npz')
+
+    def get(self, key, times):
+        """
+        Get a copy of the result for key, or None if it is not cached.
+        ``times`` is used as the index of results loaded from disk.
+        """
+        result = self._memory.get(key)
+        if result is None and self.path is not None:
+            filename = self._filename(key)
+            if os.path.exists(filename):
+                try:
+                    with np.load(filename) as data:
+                        result = pd.DataFrame(data['values'], index=times,
+                                              columns=list(data['columns']))
+                except (IOError, OSError, ValueError, EOFError, KeyError,
+                        zipfile.BadZipfile) as e:
+                    # unreadable file, the result is calculated again and
+                    # the file replaced by set
+                    warnings.warn('could not read solar position cache '
+                                  '{}: {}'.format(filename, e))
+                    result = None
+                else:
+                    self._memory.set(key, result, result.values.nbytes)
+        if result is not None:
+            result = result.copy()
+        return result
+
+    def set(self, key, result):
+        """Store a copy of result under key."""
+        result = result.copy()
+        self._memory.set(key, result, result.values.nbytes)
+        if self.path is not None and result.values.dtype.kind == 'f':
+            filename = self._filename(key)
+            columns = np.array(result.columns, dtype=str)
+            try:
+                _atomic_write(filename, lambda path: np.savez(
+                    path, values=result.values, columns=columns))
+            except (IOError, OSError, ValueError) as e:
+                warnings.warn('could not write solar position cache '
+                              '{}: {}'.format(filename, e))
+
+    def clear(self):
+        """Remove all results from memory. Files on disk are kept."""
+        self._memory.clear()
+
+
+_solar_position_cache = None
+
+
+def enable_cache(max_bytes=256 * 2**20, path=None):
+    """
+    Cache the results of :py:func:`get_solarposition`.
+
+    Repeated calls with the same times, location and parameters, for
+    example when a :py:class:`pvlib.modelchain.ModelChain` is run
+    several times for the same site and year with different system
+    models, then reuse the solar position instead of recalculating it.
+
+    Parameters
+    ----------
+    max_bytes : int, default 256 MB
+        Memory budget of the cache.
+    path : None or str
+        Directory in which results are also saved. See
+        :py:class:`SolarPositionCache`.
+
+    Returns
+    -------
+    cache : SolarPositionCache
+    """
+    global _solar_position_cache
+    _solar_position_cache = SolarPositionCache(max_bytes=max_bytes,
+                                               path=path)
+    return _solar_position_cache
+
+
+def disable_cache():
+    """Stop caching the results of :py:func:`get_solarposition`."""
+    global _solar_position_cache
+    _solar_position_cache = None
+
+
 def spa_c(time, latitude, longitude, pressure=101325, altitude=0,
           temperature=12, delta_t=67.0,
           raw_spa_output=False):
@@ -207,39 +349,75 @@ def spa_c(time, latitude, longitude, pressure=101325, altitude=0,
         return dfout
 
 
+_SPA_ENGINES = {}
+_SPA_ENGINES_LOCK = threading.Lock()
+
+
 def _spa_python_import(how):
-    """Compile spa.py appropriately"""
+    """
+    Get a version of spa.py compiled appropriately.
 
-    from pvlib import spa
+    Each version is built once per process and cached, so that the numpy
+    and numba versions live side by side and callers may switch between
+    them at no cost. Set the ``PVLIB_NUMBA_CACHE`` environment variable
+    to cache the numba compiled functions on disk across processes.
+    """
 
-    # check to see if the spa module was compiled with numba
-    using_numba = spa.USE_NUMBA
-
-    if how == 'numpy' and using_numba:
-        # the spa module was compiled to numba code, so we need to
-        # reload the module without compiling
-        # the PVLIB_USE_NUMBA env variable is used to tell the module
-        # to not compile with numba
-        os.environ['PVLIB_USE_NUMBA'] = '0'
-        pvl_logger.debug('Reloading spa module without compiling')
-        spa = reload(spa)
-        del os.environ['PVLIB_USE_NUMBA']
-    elif how == 'numba' and not using_numba:
-        # The spa module was not compiled to numba code, so set
-        # PVLIB_USE_NUMBA so it does compile to numba on reload.
-        os.environ['PVLIB_USE_NUMBA'] = '1'
-        pvl_logger.debug('Reloading spa module, compiling with numba')
-        spa = reload(spa)
-        del os.environ['PVLIB_USE_NUMBA']
-    elif how != 'numba' and how != 'numpy':
+    if how != 'numba' and how != 'numpy':
         raise ValueError("how must be either 'numba' or 'numpy'")
 
-    return spa
+    try:
+        return _SPA_ENGINES[how]
+    except KeyError:
+        pass
+
+    with _SPA_ENGINES_LOCK:
+        # another thread may have built the module while we waited
+        if how not in _SPA_ENGINES:
+            _SPA_ENGINES[how] = _load_spa_module(how)
+
+    return _SPA_ENGINES[how]
+
+
+def _load_spa_module(how):
+    """
+    Load a private copy of spa.py that is compiled with numba if
+    how == 'numba'. The pvlib.spa module itself is not modified.
+    Must be called with _SPA_ENGINES_LOCK held.
+    """
+
+    from pvlib import spa
+
+    path = os.path.splitext(spa.__file__)[0] + '.py'
+    name = 'pvlib._spa_' + how
+
+    # the engine is set in the namespace of the new module before it is
+    # executed, so the process wide PVLIB_USE_NUMBA env variable, which
+    # other threads may be reading, is never modified
+    pvl_logger.debug('Loading spa module with how=%s', how)
+    try:
+        from importlib.util import spec_from_file_location
+        from importlib.util import module_from_spec
+    except ImportError:
+        import imp
+        module = imp.new_module(name)
+        module.__file__ = path
+        module._SPA_ENGINE = how
+        with open(path) as f:
+            exec(compile(f.read(), path, 'exec'), module.__dict__)
+    else:
+        spec = spec_from_file_location(name, path)
+        module = module_from_spec(spec)
+        module._SPA_ENGINE = how
+        spec.loader.exec_module(module)
+
+    return module
 
 
 def spa_python(time, latitude, longitude,
                altitude=0, pressure=101325, temperature=12, delta_t=None,
-               atmos_refract=None, how='numpy', numthreads=4, **kwargs):
+               atmos_refract=None, how='numpy', numthreads=4,
+               anchor_freq=None, **kwargs):
     """
     Calculate the solar position using a python implementation of the
     NREL SPA algorithm described in [1].
@@ -247,7 +425,9 @@ def spa_python(time, latitude, longitude,
     If numba is installed, the functions can be compiled to
     machine code and the function can be multithreaded.
     Without numba, the function evaluates via numpy with
-    a slight performance hit.
+    a slight performance hit. The numpy and numba versions of the
+    functions are each built once per process, so ``how`` may be
+    changed from call to call at no cost.
 
     Parameters
     ----------
@@ -270,8 +450,19 @@ def spa_python(time, latitude, longitude,
         Options are 'numpy' or 'numba'. If numba >= 0.17.0
         is installed, how='numba' will compile the spa functions
         to machine code and run them multithreaded.
-    numthreads : int, optional
-        Number of threads to use if how == 'numba'.
+    numthreads : None or int, optional
+        Number of threads to use if how == 'numba'. If None, use
+        the number of CPUs.
+    anchor_freq : None or str or pandas DateOffset, optional
+        If not None, calculate the time dependent terms of the
+        algorithm exactly only at anchor times spaced by anchor_freq,
+        e.g. '5min', and linearly interpolate the local hour angle,
+        declination, parallax and equation of time between them.
+        Requires how == 'numpy'. For anchor_freq up to '15min', the
+        maximum error is 3e-7 degrees in zenith and elevation, 3e-7
+        minutes in the equation of time, and 2e-5 degrees in azimuth
+        while the sun is above the horizon with a zenith angle greater
+        than 1 degree. See :py:func:`pvlib.spa.solar_position_interp`.
 
     Returns
     -------
@@ -321,9 +512,21 @@ def spa_python(time, latitude, longitude,
 
     spa = _spa_python_import(how)
 
-    app_zenith, zenith, app_elevation, elevation, azimuth, eot = spa.solar_position(
-        unixtime, lat, lon, elev, pressure, temperature, delta_t,
-        atmos_refract, numthreads)
+    if anchor_freq is None:
+        app_zenith, zenith, app_elevation, elevation, azimuth, eot = \
+            spa.solar_position(unixtime, lat, lon, elev, pressure,
+                               temperature, delta_t, atmos_refract,
+                               numthreads)
+    elif how == 'numpy':
+        # pd.Timedelta requires pandas 0.15
+        anchor_offset = pd.tseries.frequencies.to_offset(anchor_freq)
+        anchor_step = anchor_offset.nanos / 1e9
+        app_zenith, zenith, app_elevation, elevation, azimuth, eot = \
+            spa.solar_position_interp(unixtime, lat, lon, elev, pressure,
+                                      temperature, delta_t, atmos_refract,
+                                      anchor_step)
+    else:
+        raise ValueError("anchor_freq requires how='numpy'")
 
     result = pd.DataFrame({'apparent_zenith': app_zenith, 'zenith': zenith,
                            'apparent_elevation': app_elevation,
@@ -334,6 +537,123 @@ def spa_python(time, latitude, longitude,
     return result
 
 
+def get_solarposition_multi(time, latitudes, longitudes, altitudes=None,
+                            pressures=None, temperature=12, delta_t=None,
+                            atmos_refract=None, long_format=False):
+    """
+    Calculate the solar position for many sites at once using the numpy
+    implementation of the NREL SPA algorithm described in [1].
+
+    The time dependent terms of the algorithm (heliocentric longitude,
+    nutation, obliquity, sidereal time, etc.) are calculated once and
+    only the observer dependent terms are broadcast across the sites.
+    The results are identical to calling :py:func:`spa_python` with
+    ``how='numpy'`` for each site.
+
+    Parameters
+    ----------
+    time : pandas.DatetimeIndex
+        Localized or UTC.
+    latitudes : array-like
+    longitudes : array-like
+    altitudes : None or array-like
+        If None, computed from pressures. Assumed to be 0 m
+        if pressures is also None.
+    pressures : None or array-like
+        avg. yearly air pressure in Pascals. If None, computed from
+        altitudes. Assumed to be 101325 Pa if altitudes is also None.
+    temperature : float or array-like, optional
+        avg. yearly air temperature in degrees C.
+    delta_t : float, optional
+        Difference between terrestrial time and UT1.
+        The USNO has historical and forecasted delta_t [2].
+    atmos_refrac : float, optional
+        The approximate atmospheric refraction (in degrees)
+        at sunrise and sunset.
+    long_format : bool, default False
+        If True, return a single DataFrame indexed by (time, site).
+
+    Returns
+    -------
+    OrderedDict of DataFrames or DataFrame
+        If ``long_format`` is False, an OrderedDict with keys
+        apparent_zenith, zenith, apparent_elevation, elevation,
+        azimuth and equation_of_time. Each value is a DataFrame with
+        index ``time`` and one column per site. Columns are numbered
+        in the order of ``latitudes``.
+
+        If ``long_format`` is True, a DataFrame with a (time, site)
+        MultiIndex and the columns listed above.
+
+    References
+    ----------
+    [1] I. Reda and A. Andreas, Solar position algorithm for solar
+    radiation applications. Solar Energy, vol. 76, no. 5, pp. 577-589, 2004.
+
+    [2] USNO delta T: http://www.usno.navy.mil/USNO/earth-orientation/eo-products/long-term
+
+    See also
+    --------
+    spa_python
+    """
+
+    pvl_logger.debug('Calculating solar position for many sites with '
+                     'spa_python code')
+
+    latitudes = np.atleast_1d(np.asarray(latitudes, dtype=np.float64))
+    longitudes = np.atleast_1d(np.asarray(longitudes, dtype=np.float64))
+    if latitudes.shape != longitudes.shape:
+        raise ValueError('latitudes and longitudes must have the same shape')
+
+    if altitudes is None and pressures is None:
+        altitudes = 0.
+        pressures = 101325.
+    elif altitudes is None:
+        altitudes = atmosphere.pres2alt(np.asarray(pressures))
+    elif pressures is None:
+        pressures = atmosphere.alt2pres(np.asarray(altitudes))
+
+    delta_t = delta_t or 67.0
+    atmos_refract = atmos_refract or 0.5667
+
+    if not isinstance(time, pd.DatetimeIndex):
+        try:
+            time = pd.DatetimeIndex(time)
+        except (TypeError, ValueError):
+            time = pd.DatetimeIndex([time, ])
+
+    unixtime = time.astype(np.int64)/10**9
+
+    spa = _spa_python_import('numpy')
+
+    # pressure must be in millibars for calculation
+    theta, theta0, e, e0, phi, eot = spa.solar_position_multi(
+        unixtime, latitudes, longitudes, altitudes,
+        np.asarray(pressures) / 100, temperature, delta_t, atmos_refract)
+
+    shape = (len(time), len(latitudes))
+    result = OrderedDict()
+    result['apparent_zenith'] = theta
+    result['zenith'] = theta0
+    result['apparent_elevation'] = e
+    result['elevation'] = e0
+    result['azimuth'] = phi
+    result['equation_of_time'] = eot
+
+    if long_format:
+        index = pd.MultiIndex.from_product([time, np.arange(shape[1])],
+                                           names=['time', 'site'])
+        result = pd.DataFrame(
+            OrderedDict((k, (v + np.zeros(shape)).ravel())
+                        for k, v in result.items()),
+            index=index)
+    else:
+        for k, v in result.items():
+            result[k] = pd.DataFrame(v + np.zeros(shape), index=time)
+
+    return result
+
+
 def get_sun_rise_set_transit(time, latitude, longitude, how='numpy',
                              delta_t=None,
                              numthreads=4):
@@ -359,8 +679,9 @@ def get_sun_rise_set_transit(time, latitude, longitude, how='numpy',
         Options are 'numpy' or 'numba'. If numba >= 0.17.0
         is installed, how='numba' will compile the spa functions
         to machine code and run them multithreaded.
-    numthreads : int, optional
-        Number of threads to use if how == 'numba'.
+    numthreads : None or int, optional
+        Number of threads to use if how == 'numba'. If None, use
+        the number of CPUs.
 
     Returns
     -------
@@ -388,9 +709,7 @@ def get_sun_rise_set_transit(time, latitude, longitude, how='numpy',
         except (TypeError, ValueError):
             time = pd.DatetimeIndex([time, ])
 
-    # must convert to midnight UTC on day of interest
-    utcday = pd.DatetimeIndex(time.date).tz_localize('UTC')
-    unixtime = utcday.astype(np.int64)/10**9
+    unixtime, inverse = _unique_utc_days(time)
 
     spa = _spa_python_import(how)
 
@@ -398,12 +717,9 @@ def get_sun_rise_set_transit(time, latitude, longitude, how='numpy',
         unixtime, lat, lon, delta_t, numthreads)
 
     # arrays are in seconds since epoch format, need to conver to timestamps
-    transit = pd.to_datetime(transit*1e9, unit='ns', utc=True).tz_convert(
-        time.tz).tolist()
-    sunrise = pd.to_datetime(sunrise*1e9, unit='ns', utc=True).tz_convert(
-        time.tz).tolist()
-    sunset = pd.to_datetime(sunset*1e9, unit='ns', utc=True).tz_convert(
-        time.tz).tolist()
+    transit = _unixtime_to_timestamps(transit[inverse], time.tz).tolist()
+    sunrise = _unixtime_to_timestamps(sunrise[inverse], time.tz).tolist()
+    sunset = _unixtime_to_timestamps(sunset[inverse], time.tz).tolist()
 
     result = pd.DataFrame({'transit': transit,
                            'sunrise': sunrise,
@@ -412,6 +728,122 @@ def get_sun_rise_set_transit(time, latitude, longitude, how='numpy',
     return result
 
 
+def get_sun_rise_set_transit_multi(time, latitudes, longitudes,
+                                   how='numpy', delta_t=None, numthreads=4,
+                                   long_format=False):
+    """
+    Calculate the sunrise, sunset, and sun transit times for many days
+    and many sites at once using the NREL SPA algorithm described in [1].
+
+    The site independent terms are calculated once for each distinct
+    day in ``time`` and then broadcast across the sites, so the cost
+    grows with the number of days rather than the number of timestamps
+    times the number of sites. The results are identical to calling
+    :py:func:`get_sun_rise_set_transit` for each site.
+
+    Parameters
+    ----------
+    time : pandas.DatetimeIndex
+        Only the date part is used. May contain many timestamps per
+        day, e.g. a 1-minute index.
+    latitudes : array-like
+    longitudes : array-like
+    how : str, optional
+        Options are 'numpy' or 'numba'.
+    delta_t : float, optional
+        Difference between terrestrial time and UT1.
+        By default, use USNO historical data and predictions
+    numthreads : None or int, optional
+        Number of threads to use if how == 'numba'. If None, use
+        the number of CPUs.
+    long_format : bool, default False
+        If True, return a single DataFrame indexed by (time, site).
+
+    Returns
+    -------
+    OrderedDict of DataFrames or DataFrame
+        If ``long_format`` is False, an OrderedDict with keys transit,
+        sunrise and sunset. Each value is a DataFrame with index
+        ``time`` and one column per site. Columns are numbered in the
+        order of ``latitudes``.
+
+        If ``long_format`` is True, a DataFrame with a (time, site)
+        MultiIndex and the columns transit, sunrise and sunset.
+
+    References
+    ----------
+    [1] Reda, I., Andreas, A., 2003. Solar position algorithm for solar
+    radiation applications. Technical report: NREL/TP-560- 34302. Golden,
+    USA, http://www.nrel.gov.
+
+    See also
+    --------
+    get_sun_rise_set_transit
+    """
+
+    pvl_logger.debug('Calculating sunrise, set, transit for many sites '
+                     'with spa_python code')
+
+    latitudes = np.atleast_1d(np.asarray(latitudes, dtype=np.float64))
+    longitudes = np.atleast_1d(np.asarray(longitudes, dtype=np.float64))
+    if latitudes.shape != longitudes.shape:
+        raise ValueError('latitudes and longitudes must have the same shape')
+
+    delta_t = delta_t or 67.0
+
+    if not isinstance(time, pd.DatetimeIndex):
+        try:
+            time = pd.DatetimeIndex(time)
+        except (TypeError, ValueError):
+            time = pd.DatetimeIndex([time, ])
+
+    unixtime, inverse = _unique_utc_days(time)
+
+    spa = _spa_python_import(how)
+
+    transit, sunrise, sunset = spa.transit_sunrise_sunset(
+        unixtime, latitudes, longitudes, delta_t, numthreads)
+
+    nsites = len(latitudes)
+    result = OrderedDict()
+    for name, value in (('transit', transit), ('sunrise', sunrise),
+                        ('sunset', sunset)):
+        # row major, so element i * nsites + j is time i and site j
+        result[name] = _unixtime_to_timestamps(value[inverse].ravel(),
+                                               time.tz)
+
+    if long_format:
+        index = pd.MultiIndex.from_product([time, np.arange(nsites)],
+                                           names=['time', 'site'])
+        result = pd.DataFrame(result, index=index)
+    else:
+        for k, v in result.items():
+            result[k] = pd.DataFrame(
+                OrderedDict((j, v[j::nsites]) for j in range(nsites)),
+                index=time)
+
+    return result
+
+
+def _unique_utc_days(time):
+    """
+    Find the distinct days of ``time`` as unix times of midnight UTC.
+
+    Returns the unix times and the indices that map each element of
+    ``time`` back to its day.
+    """
+    # must convert to midnight UTC on day of interest
+    utcday = pd.DatetimeIndex(time.date).tz_localize('UTC')
+    unixtime = np.asarray(utcday.astype(np.int64)) // 10**9
+    unixtime, inverse = np.unique(unixtime, return_inverse=True)
+    return unixtime.astype(np.float64), inverse
+
+
+def _unixtime_to_timestamps(unixtime, tz):
+    """Convert seconds since epoch to a DatetimeIndex in timezone tz."""
+    return pd.to_datetime(unixtime*1e9, unit='ns', utc=True).tz_convert(tz)
+
+
 def _ephem_setup(latitude, longitude, altitude, pressure, temperature):
     import ephem
     # initialize a PyEphem observer
@@ -428,7 +860,7 @@ def _ephem_setup(latitude, longitude, altitude, pressure, temperature):
 
 
 def pyephem(time, latitude, longitude, altitude=0, pressure=101325,
-            temperature=12):
+            temperature=12, processes=1):
     """
     Calculate the solar position using the PyEphem package.
 
@@ -444,6 +876,10 @@ def pyephem(time, latitude, longitude, altitude=0, pressure=101325,
         air pressure in Pascals.
     temperature : int or float, optional
         air temperature in degrees C.
+    processes : None or int, optional
+        Number of worker processes. The times are split into chunks
+        that are computed in a process pool. If None, use the number of
+        CPUs. The default of 1 computes in the calling process.
 
     Returns
     -------
@@ -464,44 +900,21 @@ def pyephem(time, latitude, longitude, altitude=0, pressure=101325,
     except ImportError:
         raise ImportError('PyEphem must be installed')
 
-    pvl_logger.debug('using PyEphem to calculate solar position')
-
-    # if localized, convert to UTC. otherwise, assume UTC.
-    try:
-        time_utc = time.tz_convert('UTC')
-    except TypeError:
-        time_utc = time
-
-    sun_coords = pd.DataFrame(index=time)
+    pvl_logger.debug('using PyEphem %s to calculate solar position',
+                     ephem.__version__)
 
-    obs, sun = _ephem_setup(latitude, longitude, altitude,
-                            pressure, temperature)
+    djd = _datetime_to_djd_array(time)
 
-    # make and fill lists of the sun's altitude and azimuth
-    # this is the pressure and temperature corrected apparent alt/az.
-    alts = []
-    azis = []
-    for thetime in time_utc:
-        obs.date = ephem.Date(thetime)
-        sun.compute(obs)
-        alts.append(sun.alt)
-        azis.append(sun.az)
-
-    sun_coords['apparent_elevation'] = alts
-    sun_coords['apparent_azimuth'] = azis
-
-    # redo it for p=0 to get no atmosphere alt/az
-    obs.pressure = 0
-    alts = []
-    azis = []
-    for thetime in time_utc:
-        obs.date = ephem.Date(thetime)
-        sun.compute(obs)
-        alts.append(sun.alt)
-        azis.append(sun.az)
+    apparent_elevation, elevation, azimuth = _map_chunks(
+        _pyephem_worker, djd, processes,
+        (latitude, longitude, altitude, pressure, temperature))
 
-    sun_coords['elevation'] = alts
-    sun_coords['azimuth'] = azis
+    sun_coords = pd.DataFrame(index=time)
+    sun_coords['apparent_elevation'] = apparent_elevation
+    # refraction does not change the azimuth
+    sun_coords['apparent_azimuth'] = azimuth
+    sun_coords['elevation'] = elevation
+    sun_coords['azimuth'] = azimuth
 
     # convert to degrees. add zenith
     sun_coords = np.rad2deg(sun_coords)
@@ -724,6 +1137,10 @@ def calc_time(lower_bound, upper_bound, latitude, longitude, attribute, value,
     AttributeError
         If the given attribute is not an attribute of a
         PyEphem.Sun object.
+
+    See also
+    --------
+    calc_times
     """
 
     try:
@@ -748,13 +1165,153 @@ def calc_time(lower_bound, upper_bound, latitude, longitude, attribute, value,
     return djd_to_datetime(djd_root)
 
 
-def pyephem_earthsun_distance(time):
+_CALC_TIMES_ATTRIBUTES = ('apparent_zenith', 'zenith', 'apparent_elevation',
+                          'elevation', 'azimuth')
+
+
+def calc_times(lower_bounds, upper_bounds, latitude, longitude, attribute,
+               value, altitude=0, pressure=101325, temperature=12,
+               delta_t=None, atmos_refract=None, how='numpy', numthreads=4,
+               xtol=1.0e-3, maxiter=100):
+    """
+    Calculate the times between each pair of lower_bounds and
+    upper_bounds where the attribute is equal to value.
+
+    A vectorized version of :py:func:`calc_time`. All windows are
+    solved at once by bisection, evaluating the NREL SPA algorithm [1]
+    on the array of candidate times in each iteration.
+
+    Parameters
+    ----------
+    lower_bounds : pandas.DatetimeIndex or array-like of datetimes
+        Start of each search window. Timezone naive times are assumed
+        to be UTC.
+    upper_bounds : pandas.DatetimeIndex or array-like of datetimes
+        End of each search window. Must have the same length as
+        lower_bounds.
+    latitude : float
+    longitude : float
+    attribute : str
+        The solar position quantity to solve for. One of
+        'apparent_zenith', 'zenith', 'apparent_elevation', 'elevation'
+        or 'azimuth'.
+    value : float or array-like
+        The value of the attribute to solve for, in degrees. An
+        array sets a different value for each window.
+    altitude : float, optional
+        Distance above sea level.
+    pressure : int or float, optional
+        Air pressure in Pascals.
+    temperature : int or float, optional
+        Air temperature in degrees C.
+    delta_t : float, optional
+        Difference between terrestrial time and UT1.
+    atmos_refract : float, optional
+        The approximate atmospheric refraction (in degrees)
+        at sunrise and sunset.
+    how : str, optional
+        Options are 'numpy' or 'numba'.
+    numthreads : None or int, optional
+        Number of threads to use if how == 'numba'.
+    xtol : float, optional
+        The allowed error in the result, in seconds.
+    maxiter : int, optional
+        Maximum number of bisection steps.
+
+    Returns
+    -------
+    pandas.DatetimeIndex
+        The time of each event, in the timezone of lower_bounds. NaT
+        where the value is not contained between the bounds. Azimuth
+        differences are wrapped to [-180, 180), so a window may not
+        contain the azimuth opposite the value as well as the value.
+
+    Raises
+    ------
+    ValueError
+        If attribute is not valid or the bounds have different
+        lengths.
+
+    References
+    ----------
+    [1] I. Reda and A. Andreas, Solar position algorithm for solar
+    radiation applications. Solar Energy, vol. 76, no. 5, pp. 577-589, 2004.
+
+    See also
+    --------
+    calc_time
+    """
+
+    if attribute not in _CALC_TIMES_ATTRIBUTES:
+        raise ValueError('attribute must be one of {}'.format(
+            ', '.join(_CALC_TIMES_ATTRIBUTES)))
+    row = _CALC_TIMES_ATTRIBUTES.index(attribute)
+
+    lower_bounds = pd.DatetimeIndex(lower_bounds)
+    upper_bounds = pd.DatetimeIndex(upper_bounds)
+    if len(lower_bounds) != len(upper_bounds):
+        raise ValueError('lower_bounds and upper_bounds must have the '
+                         'same length')
+
+    delta_t = delta_t or 67.0
+    atmos_refract = atmos_refract or 0.5667
+
+    spa = _spa_python_import(how)
+
+    lo = np.asarray(lower_bounds.astype(np.int64)) / 10**9
+    hi = np.asarray(upper_bounds.astype(np.int64)) / 10**9
+    value = np.asarray(value, dtype=np.float64) + np.zeros(lo.shape)
+
+    def func(unixtime):
+        # pressure must be in millibars for calculation
+        diff = spa.solar_position(unixtime, latitude, longitude, altitude,
+                                  pressure / 100, temperature, delta_t,
+                                  atmos_refract, numthreads)[row] - value
+        if attribute == 'azimuth':
+            # move the jump in azimuth opposite the value being solved for
+            diff = (diff + 180) % 360 - 180
+        return diff
+
+    f_lo = func(lo)
+    f_hi = func(hi)
+    bracketed = np.sign(f_lo) * np.sign(f_hi) <= 0
+
+    # each step halves every window, so the widest sets the count
+    width = np.max(hi - lo) if len(lo) else 0
+    niter = 0
+    if width > xtol:
+        niter = min(int(np.ceil(np.log2(width / xtol))), maxiter)
+
+    for _ in range(niter):
+        mid = (lo + hi) / 2
+        f_mid = func(mid)
+        same = np.sign(f_mid) == np.sign(f_lo)
+        lo = np.where(same, mid, lo)
+        f_lo = np.where(same, f_mid, f_lo)
+        hi = np.where(same, hi, mid)
+        f_hi = np.where(same, f_hi, f_mid)
+
+    root = (lo + hi) / 2
+    # a jump in the attribute also changes sign, but is not a root
+    continuous = np.abs(f_hi - f_lo) < 1
+    root[~(bracketed & continuous)] = np.nan
+
+    return pd.to_datetime(root * 1e9, unit='ns', utc=True).tz_convert(
+        lower_bounds.tz)
+
+
+def pyephem_earthsun_distance(time, processes=1):
     """
     Calculates the distance from the earth to the sun using pyephem.
 
     Parameters
     ----------
     time : pd.DatetimeIndex
+        Localized times are converted to UTC. Naive times are assumed
+        to be UTC.
+    processes : None or int, optional
+        Number of worker processes. If None, use the number of CPUs.
+        The default of 1 computes in the calling process.
 
     Returns
     -------
@@ -762,15 +1319,90 @@ def pyephem_earthsun_distance(time):
     """
     pvl_logger.debug('solarposition.pyephem_earthsun_distance()')
 
+    djd = _datetime_to_djd_array(time)
+
+    earthsun, = _map_chunks(_pyephem_earthsun_worker, djd, processes, ())
+
+    return pd.Series(earthsun, index=time)
+
+
+def _datetime_to_djd_array(time):
+    """
+    Convert a DatetimeIndex to an array of Dublin Julian Days, the
+    float date format used by PyEphem. Naive times are assumed to be UTC.
+    """
+    if not isinstance(time, pd.DatetimeIndex):
+        time = pd.DatetimeIndex(time)
+    # the int64 values are always nanoseconds since the epoch in UTC
+    unixtime = np.asarray(time.astype(np.int64)) / 10**9
+    return unixtime / 86400 + 25567.5
+
+
+def _pyephem_worker(djd, latitude, longitude, altitude, pressure,
+                    temperature):
+    """
+    Calculate the apparent elevation, elevation and azimuth in radians
+    for an array of Dublin Julian Days in one pass.
+    """
+    obs, sun = _ephem_setup(latitude, longitude, altitude,
+                            pressure, temperature)
+    # second observer without atmosphere for the true elevation
+    obs_noatm, sun_noatm = _ephem_setup(latitude, longitude, altitude,
+                                        0, temperature)
+
+    apparent_elevation = np.empty(len(djd))
+    elevation = np.empty(len(djd))
+    azimuth = np.empty(len(djd))
+    for i, thetime in enumerate(djd):
+        obs.date = thetime
+        obs_noatm.date = thetime
+        sun.compute(obs)
+        sun_noatm.compute(obs_noatm)
+        apparent_elevation[i] = sun.alt
+        elevation[i] = sun_noatm.alt
+        azimuth[i] = sun_noatm.az
+
+    return apparent_elevation, elevation, azimuth
+
+
+def _pyephem_earthsun_worker(djd):
+    """Calculate the earth-sun distance for an array of Dublin Julian Days"""
     import ephem
 
     sun = ephem.Sun()
-    earthsun = []
-    for thetime in time:
-        sun.compute(ephem.Date(thetime))
-        earthsun.append(sun.earth_distance)
+    earthsun = np.empty(len(djd))
+    for i, thetime in enumerate(djd):
+        sun.compute(thetime)
+        earthsun[i] = sun.earth_distance
+
+    return (earthsun, )
 
-    return pd.Series(earthsun, index=time)
+
+def _pyephem_worker_star(args):
+    func, djd, extra_args = args
+    return func(djd, *extra_args)
+
+
+def _map_chunks(func, djd, processes, extra_args):
+    """
+    Apply func(djd_chunk, *extra_args) to chunks of djd in a process
+    pool and concatenate each of the arrays it returns.
+    """
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    if processes <= 1 or len(djd) < 2 * processes:
+        return func(djd, *extra_args)
+
+    chunks = np.array_split(djd, processes)
+    pool = multiprocessing.Pool(processes)
+    try:
+        results = pool.map(_pyephem_worker_star,
+                           [(func, chunk, extra_args) for chunk in chunks])
+    finally:
+        pool.close()
+        pool.join()
+
+    return tuple(np.concatenate(arrays) for arrays in zip(*results))
 
 
 def nrel_earthsun_distance(time, how='numpy', delta_t=None, numthreads=4):
@@ -791,8 +1423,9 @@ def nrel_earthsun_distance(time, how='numpy', delta_t=None, numthreads=4):
         Difference between terrestrial time and UT1.
         By default, use USNO historical data and predictions
 
-    numthreads : int, optional
-        Number of threads to use if how == 'numba'.
+    numthreads : None or int, optional
+        Number of threads to use if how == 'numba'. If None, use
+        the number of CPUs.
 
     Returns
     -------
@@ -1,6 +1,12 @@
 """
 Calculate the solar position using the NREL SPA algorithm either using
 numpy arrays or compiling the code to machine language with numba.
+
+The functions are compiled with numba when the module is imported if the
+``PVLIB_USE_NUMBA`` environment variable is set. If the
+``PVLIB_NUMBA_CACHE`` environment variable is also set, the compiled
+functions are cached on disk. Use ``solarposition.spa_python`` to select
+the numpy or numba version of this module per call.
 """
 
 # Contributors:
@@ -9,6 +15,9 @@ numpy arrays or compiling the code to machine language with numba.
 from __future__ import division
 import os
 import threading
+from contextlib import contextmanager
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 import warnings
 import logging
 pvl_logger = logging.getLogger('pvlib')
@@ -23,7 +32,17 @@ def nocompile(*args, **kwargs):
     return lambda func: func
 
 
-if os.getenv('PVLIB_USE_NUMBA', '0') != '0':
+# solarposition loads private copies of this module with _SPA_ENGINE set
+# in the module namespace before it is executed, which takes precedence
+# over the environment variable
+try:
+    _SPA_ENGINE
+except NameError:
+    _SPA_ENGINE = ('numba' if os.getenv('PVLIB_USE_NUMBA', '0') != '0'
+                   else 'numpy')
+
+
+if _SPA_ENGINE == 'numba':
     try:
         from numba import jit, __version__
     except ImportError:
@@ -35,7 +54,14 @@ if os.getenv('PVLIB_USE_NUMBA', '0') != '0':
         major, minor = __version__.split('.')[:2]
         if int(major + minor) >= 17:
             # need at least numba >= 0.17.0
-            jcompile = jit
+            if os.getenv('PVLIB_NUMBA_CACHE', '0') != '0':
+                # cache the compiled functions on disk so that new
+                # processes do not need to recompile them
+                def jcompile(*args, **kwargs):
+                    kwargs.setdefault('cache', True)
+                    return jit(*args, **kwargs)
+            else:
+                jcompile = jit
             USE_NUMBA = True
         else:
             warnings.warn('Numba version must be >= 0.17.0, falling back to ' +
@@ -895,6 +921,118 @@ def equation_of_time(sun_mean_longitude, geocentric_sun_right_ascension,
     return E
 
 
+# The functions below evaluate the periodic terms of the heliocentric
+# and nutation series as matrix operations on blocks of timestamps,
+# rather than looping over the rows of each table. They are much faster
+# than the row by row functions above for long numpy arrays, but cannot
+# be compiled with numba. The solar_position_numpy and
+# solar_position_multi functions use them.
+
+# Number of timestamps evaluated at once. Limits the size of the
+# (terms x timestamps) temporary arrays.
+MATRIX_BLOCKSIZE = 1024
+
+
+def _stack_periodic_table(table):
+    """Stack the nonzero rows of the series in table (series x rows x 3)
+    into a single (terms x 3) array and a (series x terms) matrix that
+    sums the terms of each series."""
+    terms = []
+    series = []
+    for i, rows in enumerate(table):
+        rows = rows[rows[:, 0] != 0]
+        terms.append(rows)
+        series.extend([i] * len(rows))
+    terms = np.concatenate(terms)
+    weights = np.zeros((len(table), len(terms)))
+    weights[series, np.arange(len(terms))] = terms[:, 0]
+    return terms[:, 1], terms[:, 2], weights
+
+
+HELIO_LONG_MATRIX = _stack_periodic_table(HELIO_LONG_TABLE)
+HELIO_LAT_MATRIX = _stack_periodic_table(HELIO_LAT_TABLE)
+HELIO_RADIUS_MATRIX = _stack_periodic_table(HELIO_RADIUS_TABLE)
+
+
+def _blocks(length, blocksize):
+    """Slices that split an array of length into blocks of blocksize"""
+    return [slice(start, start + blocksize)
+            for start in range(0, max(length, 1), blocksize)]
+
+
+def _periodic_sums(matrix, jme, blocksize=MATRIX_BLOCKSIZE):
+    """Evaluate each series of a table stacked by _stack_periodic_table,
+    sum(A * cos(B + C * jme)). Returns an array of shape
+    (series, ) + jme.shape with one cosine broadcast and one reduction
+    per block of timestamps."""
+    phase, frequency, weights = matrix
+    jme = np.asarray(jme, dtype=np.float64)
+    flat = jme.ravel()
+    sums = np.empty((weights.shape[0], flat.shape[0]))
+    for block in _blocks(flat.shape[0], blocksize):
+        sums[:, block] = np.dot(
+            weights, np.cos(phase[:, np.newaxis] +
+                            frequency[:, np.newaxis] * flat[block]))
+    return sums.reshape((weights.shape[0], ) + jme.shape)
+
+
+def _evaluate_polynomial(coefficients, x):
+    """sum(coefficients[i] * x**i) by Horner's method"""
+    result = coefficients[-1]
+    for coefficient in coefficients[-2::-1]:
+        result = result * x + coefficient
+    return result
+
+
+def heliocentric_longitude_matrix(jme, blocksize=MATRIX_BLOCKSIZE):
+    """Matrix evaluation of heliocentric_longitude for numpy arrays"""
+    sums = _periodic_sums(HELIO_LONG_MATRIX, jme, blocksize)
+    l_rad = _evaluate_polynomial(sums, jme)/10**8
+    l = np.rad2deg(l_rad)
+    return l % 360
+
+
+def heliocentric_latitude_matrix(jme, blocksize=MATRIX_BLOCKSIZE):
+    """Matrix evaluation of heliocentric_latitude for numpy arrays"""
+    sums = _periodic_sums(HELIO_LAT_MATRIX, jme, blocksize)
+    b_rad = _evaluate_polynomial(sums, jme)/10**8
+    b = np.rad2deg(b_rad)
+    return b
+
+
+def heliocentric_radius_vector_matrix(jme, blocksize=MATRIX_BLOCKSIZE):
+    """Matrix evaluation of heliocentric_radius_vector for numpy arrays"""
+    sums = _periodic_sums(HELIO_RADIUS_MATRIX, jme, blocksize)
+    r = _evaluate_polynomial(sums, jme)/10**8
+    return r
+
+
+def nutation_matrix(julian_ephemeris_century, x0, x1, x2, x3, x4,
+                    blocksize=MATRIX_BLOCKSIZE):
+    """Matrix evaluation of longitude_nutation and obliquity_nutation for
+    numpy arrays. The argument of the nutation terms is calculated once
+    for both. Returns (delta_psi, delta_epsilon)."""
+    args = np.broadcast_arrays(julian_ephemeris_century, x0, x1, x2, x3, x4)
+    x = np.array(args[1:], dtype=np.float64)
+    shape = x.shape[1:]
+    x = x.reshape(5, -1)
+    jce = np.asarray(args[0], dtype=np.float64).ravel()
+    delta_psi = np.empty(jce.shape)
+    delta_eps = np.empty(jce.shape)
+    a, b, c, d = NUTATION_ABCD_ARRAY.T
+    for block in _blocks(jce.shape[0], blocksize):
+        arg = np.radians(np.dot(NUTATION_YTERM_ARRAY, x[:, block]))
+        sin_arg = np.sin(arg)
+        cos_arg = np.cos(arg)
+        delta_psi[block] = (np.dot(a, sin_arg) +
+                            jce[block] * np.dot(b, sin_arg))
+        delta_eps[block] = (np.dot(c, cos_arg) +
+                            jce[block] * np.dot(d, cos_arg))
+    delta_psi = delta_psi.reshape(shape)*1.0/36000000
+    delta_eps = delta_eps.reshape(shape)*1.0/36000000
+    return delta_psi, delta_eps
+
+
 @jcompile('void(float64[:], float64[:], float64[:,:])', nopython=True,
           nogil=True)
 def solar_position_loop(unixtime, loc_args, out):
@@ -973,14 +1111,91 @@ def solar_position_loop(unixtime, loc_args, out):
         out[5, i] = eot
 
 
+# Timestamps below this number are not worth handing to another thread.
+MIN_CHUNKSIZE = 2**14
+
+_THREAD_POOL = None
+_THREAD_POOL_SIZE = 0
+# number of callers currently using each pool, keyed on the pool
+_THREAD_POOL_USERS = {}
+_THREAD_POOL_LOCK = threading.Lock()
+
+
+def get_chunksize(ulength, numthreads=None, min_chunksize=MIN_CHUNKSIZE):
+    """
+    Determine the number of timestamps that each thread should calculate.
+
+    The time array is split evenly between ``numthreads`` threads, but
+    chunks are never made smaller than ``min_chunksize`` timestamps
+    because the overhead of dispatching small chunks exceeds the
+    calculation time.
+
+    Parameters
+    ----------
+    ulength : int
+        Length of the time array.
+    numthreads : None or int
+        Maximum number of threads. If None, use the number of CPUs.
+    min_chunksize : int
+        Minimum number of timestamps per chunk.
+
+    Returns
+    -------
+    chunksize : int
+    """
+    if numthreads is None:
+        numthreads = multiprocessing.cpu_count()
+    numthreads = max(int(numthreads), 1)
+    chunksize = -(-ulength // numthreads)  # ceil division
+    return int(max(chunksize, min(min_chunksize, ulength), 1))
+
+
+@contextmanager
+def _thread_pool(numthreads):
+    """Borrow a process wide thread pool with at least numthreads threads.
+    Creating the pool once avoids spawning new threads on every call.
+
+    When a larger pool is needed the shared pool is replaced, but a
+    replaced pool is only closed once every caller that borrowed it has
+    returned it, so concurrent calls with different thread counts are
+    safe.
+    """
+    global _THREAD_POOL, _THREAD_POOL_SIZE
+    with _THREAD_POOL_LOCK:
+        if _THREAD_POOL is None or _THREAD_POOL_SIZE < numthreads:
+            old_pool = _THREAD_POOL
+            _THREAD_POOL = ThreadPool(numthreads)
+            _THREAD_POOL_SIZE = numthreads
+            _THREAD_POOL_USERS[_THREAD_POOL] = 0
+            if old_pool is not None and _THREAD_POOL_USERS[old_pool] == 0:
+                del _THREAD_POOL_USERS[old_pool]
+                old_pool.close()
+        pool = _THREAD_POOL
+        _THREAD_POOL_USERS[pool] += 1
+    try:
+        yield pool
+    finally:
+        with _THREAD_POOL_LOCK:
+            _THREAD_POOL_USERS[pool] -= 1
+            if _THREAD_POOL_USERS[pool] == 0 and pool is not _THREAD_POOL:
+                del _THREAD_POOL_USERS[pool]
+                pool.close()
+
+
 def solar_position_numba(unixtime, lat, lon, elev, pressure, temp, delta_t,
                          atmos_refract, numthreads, sst=False, esd=False):
     """Calculate the solar position using the numba compiled functions
     and multiple threads. Very slow if functions are not numba compiled.
+
+    The compiled loop releases the GIL, so the chunks of the time array
+    returned by :py:func:`get_chunksize` run in parallel on a thread pool
+    that is reused across calls. If numthreads is None, use the number
+    of CPUs.
     """
     # these args are the same for each thread
     loc_args = np.array([lat, lon, elev, pressure, temp, delta_t,
                          atmos_refract, sst, esd])
+    unixtime = np.asarray(unixtime, dtype=np.float64)
 
     # construct dims x ulength array to put the results in
     ulength = unixtime.shape[0]
@@ -992,31 +1207,21 @@ def solar_position_numba(unixtime, lat, lon, elev, pressure, temp, delta_t,
         dims = 6
     result = np.empty((dims, ulength), dtype=np.float64)
 
-    if unixtime.dtype != np.float64:
-        unixtime = unixtime.astype(np.float64)
-
-    if ulength < numthreads:
-        pvl_logger.warning('The number of threads is more than the length of' +
-                           ' the time array. Only using %s threads.',
-                            ulength)
-        numthreads = ulength
+    chunksize = get_chunksize(ulength, numthreads)
+    starts = list(range(0, ulength, chunksize))
 
-    if numthreads <= 1:
+    if len(starts) <= 1:
         pvl_logger.debug('Only using one thread for calculation')
         solar_position_loop(unixtime, loc_args, result)
         return result
 
-    # split the input and output arrays into numthreads chunks
-    split0 = np.array_split(unixtime, numthreads)
-    split2 = np.array_split(result, numthreads, axis=1)
-    chunks = [[a0, loc_args, split2[i]] for i, a0 in enumerate(split0)]
-    # Spawn one thread per chunk
-    threads = [threading.Thread(target=solar_position_loop, args=chunk)
-               for chunk in chunks]
-    for thread in threads:
-        thread.start()
-    for thread in threads:
-        thread.join()
+    def run_chunk(start):
+        stop = start + chunksize
+        solar_position_loop(unixtime[start:stop], loc_args,
+                            result[:, start:stop])
+
+    with _thread_pool(len(starts)) as pool:
+        pool.map(run_chunk, starts)
     return result
 
 
@@ -1032,11 +1237,11 @@ def solar_position_numpy(unixtime, lat, lon, elev, pressure, temp, delta_t,
     jc = julian_century(jd)
     jce = julian_ephemeris_century(jde)
     jme = julian_ephemeris_millennium(jce)
-    R = heliocentric_radius_vector(jme)
+    R = heliocentric_radius_vector_matrix(jme)
     if esd:
         return (R, )
-    L = heliocentric_longitude(jme)
-    B = heliocentric_latitude(jme)
+    L = heliocentric_longitude_matrix(jme)
+    B = heliocentric_latitude_matrix(jme)
     Theta = geocentric_longitude(L)
     beta = geocentric_latitude(B)
     x0 = mean_elongation(jce)
@@ -1044,8 +1249,7 @@ def solar_position_numpy(unixtime, lat, lon, elev, pressure, temp, delta_t,
     x2 = mean_anomaly_moon(jce)
     x3 = moon_argument_latitude(jce)
     x4 = moon_ascending_longitude(jce)
-    delta_psi = longitude_nutation(jce, x0, x1, x2, x3, x4)
-    delta_epsilon = obliquity_nutation(jce, x0, x1, x2, x3, x4)
+    delta_psi, delta_epsilon = nutation_matrix(jce, x0, x1, x2, x3, x4)
     epsilon0 = mean_ecliptic_obliquity(jme)
     epsilon = true_ecliptic_obliquity(epsilon0, delta_epsilon)
     delta_tau = aberration_correction(R)
@@ -1079,6 +1283,153 @@ def solar_position_numpy(unixtime, lat, lon, elev, pressure, temp, delta_t,
     return theta, theta0, e, e0, phi, eot
 
 
+def _geocentric_terms(unixtime, delta_t):
+    """Calculate the observer independent terms of the SPA algorithm for
+    numpy arrays. Returns the apparent sidereal time, geocentric sun
+    right ascension and declination, equatorial horizontal parallax and
+    equation of time."""
+    jd = julian_day(unixtime)
+    jde = julian_ephemeris_day(jd, delta_t)
+    jc = julian_century(jd)
+    jce = julian_ephemeris_century(jde)
+    jme = julian_ephemeris_millennium(jce)
+    R = heliocentric_radius_vector_matrix(jme)
+    L = heliocentric_longitude_matrix(jme)
+    B = heliocentric_latitude_matrix(jme)
+    Theta = geocentric_longitude(L)
+    beta = geocentric_latitude(B)
+    x0 = mean_elongation(jce)
+    x1 = mean_anomaly_sun(jce)
+    x2 = mean_anomaly_moon(jce)
+    x3 = moon_argument_latitude(jce)
+    x4 = moon_ascending_longitude(jce)
+    delta_psi, delta_epsilon = nutation_matrix(jce, x0, x1, x2, x3, x4)
+    epsilon0 = mean_ecliptic_obliquity(jme)
+    epsilon = true_ecliptic_obliquity(epsilon0, delta_epsilon)
+    delta_tau = aberration_correction(R)
+    lamd = apparent_sun_longitude(Theta, delta_psi, delta_tau)
+    v0 = mean_sidereal_time(jd, jc)
+    v = apparent_sidereal_time(v0, delta_psi, epsilon)
+    alpha = geocentric_sun_right_ascension(lamd, epsilon, beta)
+    delta = geocentric_sun_declination(lamd, epsilon, beta)
+    m = sun_mean_longitude(jme)
+    eot = equation_of_time(m, alpha, delta_psi, epsilon)
+    xi = equatorial_horizontal_parallax(R)
+    return v, alpha, delta, xi, eot
+
+
+def _topocentric_terms(H, delta, xi, lat, elev, pressure, temp,
+                       atmos_refract):
+    """Calculate the observer dependent terms of the SPA algorithm, from
+    the local hour angle onward, for numpy arrays. Returns the apparent
+    zenith, zenith, apparent elevation, elevation and azimuth."""
+    u = uterm(lat)
+    x = xterm(u, lat, elev)
+    y = yterm(u, lat, elev)
+    delta_alpha = parallax_sun_right_ascension(x, xi, H, delta)
+    delta_prime = topocentric_sun_declination(delta, x, y, xi, delta_alpha, H)
+    H_prime = topocentric_local_hour_angle(H, delta_alpha)
+    e0 = topocentric_elevation_angle_without_atmosphere(lat, delta_prime,
+                                                        H_prime)
+    delta_e = atmospheric_refraction_correction(pressure, temp, e0,
+                                                atmos_refract)
+    e = topocentric_elevation_angle(e0, delta_e)
+    theta = topocentric_zenith_angle(e)
+    theta0 = topocentric_zenith_angle(e0)
+    gamma = topocentric_astronomers_azimuth(H_prime, delta_prime, lat)
+    phi = topocentric_azimuth_angle(gamma)
+    return theta, theta0, e, e0, phi
+
+
+def solar_position_multi(unixtime, lat, lon, elev, pressure, temp, delta_t,
+                         atmos_refract):
+    """Calculate the solar position for many sites at once assuming unixtime
+    and the site arguments are numpy arrays. The time dependent terms are
+    calculated once and only the observer dependent terms, from the local
+    hour angle onward, are broadcast across the sites. Note this function
+    will not work if the solar position functions were compiled with numba.
+
+    Returns arrays of shape (len(unixtime), number of sites) in the same
+    order as :py:func:`solar_position`. The equation of time does not
+    depend on the site and has shape (len(unixtime), 1).
+    """
+
+    unixtime = np.asarray(unixtime, dtype=np.float64)
+
+    # time along axis 0, sites along axis 1
+    lat, lon, elev, pressure, temp = [
+        np.atleast_1d(np.asarray(arg, dtype=np.float64))[np.newaxis, :]
+        for arg in np.broadcast_arrays(lat, lon, elev, pressure, temp)]
+
+    v, alpha, delta, xi, eot = [
+        term[:, np.newaxis] for term in _geocentric_terms(unixtime, delta_t)]
+
+    H = local_hour_angle(v, lon, alpha)
+    theta, theta0, e, e0, phi = _topocentric_terms(
+        H, delta, xi, lat, elev, pressure, temp, atmos_refract)
+    return theta, theta0, e, e0, phi, eot
+
+
+def solar_position_interp(unixtime, lat, lon, elev, pressure, temp, delta_t,
+                          atmos_refract, anchor_step=300):
+    """Calculate the solar position assuming unixtime is a numpy array by
+    interpolating between exact calculations at anchor times.
+
+    The observer independent terms are calculated exactly every
+    ``anchor_step`` seconds. The local hour angle, geocentric sun
+    declination, equatorial horizontal parallax and equation of time are
+    smooth on these time scales and are linearly interpolated to
+    unixtime before the nonlinear topocentric terms are calculated
+    exactly. Note this function will not work if the solar position
+    functions were compiled with numba.
+
+    Compared to :py:func:`solar_position` over a year at latitudes from
+    -89.5 to 89.5 degrees, the maximum error for anchor_step up to 900
+    seconds is 3e-7 degrees in zenith and elevation and 3e-7 minutes in
+    the equation of time. For anchor_step=1800 seconds it is 6e-7
+    degrees and 1e-6 minutes, and for anchor_step=3600 seconds 2e-6
+    degrees and 4e-6 minutes. The azimuth is ill-conditioned near the
+    zenith and the nadir, so it is the azimuth error times the sine of
+    the zenith angle that obeys the zenith bound. For anchor_step up to
+    900 seconds the azimuth error is below 2e-5 degrees while the sun is
+    above the horizon with a zenith angle greater than 1 degree.
+
+    Returns the same arrays as :py:func:`solar_position`.
+    """
+
+    unixtime = np.asarray(unixtime, dtype=np.float64)
+
+    if unixtime.size == 0:
+        return solar_position_numpy(unixtime, lat, lon, elev, pressure, temp,
+                                    delta_t, atmos_refract, 1)
+
+    start = np.floor(unixtime.min() / anchor_step) * anchor_step
+    stop = np.ceil(unixtime.max() / anchor_step) * anchor_step
+    num_anchors = int(round((stop - start) / anchor_step)) + 1
+
+    if num_anchors >= unixtime.size:
+        # nothing to gain from interpolation
+        return solar_position_numpy(unixtime, lat, lon, elev, pressure, temp,
+                                    delta_t, atmos_refract, 1)
+
+    anchors = start + anchor_step * np.arange(num_anchors)
+
+    v, alpha, delta, xi, eot = _geocentric_terms(anchors, delta_t)
+
+    # unwrap the hour angle so that it increases continuously
+    H = local_hour_angle(v, lon, alpha)
+    H = np.degrees(np.unwrap(np.radians(H)))
+
+    H = np.interp(unixtime, anchors, H) % 360
+    delta = np.interp(unixtime, anchors, delta)
+    xi = np.interp(unixtime, anchors, xi)
+    eot = np.interp(unixtime, anchors, eot)
+
+    theta, theta0, e, e0, phi = _topocentric_terms(
+        H, delta, xi, lat, elev, pressure, temp, atmos_refract)
+    return theta, theta0, e, e0, phi, eot
+
+
 def solar_position(unixtime, lat, lon, elev, pressure, temp, delta_t,
                    atmos_refract, numthreads=8, sst=False, esd=False):
 
@@ -1114,9 +1465,10 @@ def solar_position(unixtime, lat, lon, elev, pressure, temp, delta_t,
     atmos_refrac : float, optional
         The approximate atmospheric refraction (in degrees)
         at sunrise and sunset.
-    numthreads: int, optional
+    numthreads: None or int, optional
         Number of threads to use for computation if numba>=0.17
-        is installed.
+        is installed. If None, use the number of CPUs. See
+        :py:func:`get_chunksize`.
     sst : bool
         If True, return only data needed for sunrise, sunset, and transit
         calculations.
@@ -1162,7 +1514,11 @@ def solar_position(unixtime, lat, lon, elev, pressure, temp, delta_t,
 def transit_sunrise_sunset(dates, lat, lon, delta_t, numthreads):
     """
     Calculate the sun transit, sunrise, and sunset
-    for a set of dates at a given location.
+    for a set of dates at a given location or set of locations.
+
+    The site independent terms of the algorithm are calculated once for
+    all dates in a single call to :py:func:`solar_position`, and then
+    broadcast across the sites.
 
     Parameters
     ----------
@@ -1170,10 +1526,10 @@ def transit_sunrise_sunset(dates, lat, lon, delta_t, numthreads):
         Numpy array of ints/floats corresponding to the Unix time
         for the dates of interest, must be midnight UTC (00:00+00:00)
         on the day of interest.
-    lat : float
-        Latitude of location to perform calculation for
-    lon : float
-        Longitude of location
+    lat : float or array
+        Latitude of location(s) to perform calculation for
+    lon : float or array
+        Longitude of location(s). Must have the same shape as lat.
     delta_t : float
         Difference between terrestrial time and UT. USNO has tables.
     numthreads : int
@@ -1182,28 +1538,37 @@ def transit_sunrise_sunset(dates, lat, lon, delta_t, numthreads):
     Returns
     -------
     tuple : (transit, sunrise, sunset) localized to UTC
-
+        Arrays of shape (len(dates), ) if lat and lon are scalars, or
+        (len(dates), number of sites) if lat and lon are 1d arrays.
     """
 
+    dates = np.asarray(dates, dtype=np.float64)
     if ((dates % 86400) != 0.0).any():
         raise ValueError('Input dates must be at 00:00 UTC')
 
+    scalar_site = np.ndim(lat) == 0 and np.ndim(lon) == 0
+    # dates along axis 0, sites along axis 1
+    lat = np.atleast_1d(np.asarray(lat, dtype=np.float64))[np.newaxis, :]
+    lon = np.atleast_1d(np.asarray(lon, dtype=np.float64))[np.newaxis, :]
+    if lat.shape != lon.shape:
+        raise ValueError('lat and lon must have the same shape')
+
     utday = (dates // 86400) * 86400
     ttday0 = utday - delta_t
     ttdayn1 = ttday0 - 86400
     ttdayp1 = ttday0 + 86400
 
     # index 0 is v, 1 is alpha, 2 is delta
-    utday_res = solar_position(utday, 0, 0, 0, 0, 0, delta_t,
-                               0, numthreads, sst=True)
+    # one call for all four sets of times
+    ndays = len(utday)
+    sst_res = solar_position(np.concatenate([utday, ttday0, ttdayn1,
+                                             ttdayp1]),
+                             0, 0, 0, 0, 0, delta_t, 0, numthreads, sst=True)
+    sst_res = [sst_res[:, i * ndays:(i + 1) * ndays, np.newaxis]
+               for i in range(4)]
+    utday_res, ttday0_res, ttdayn1_res, ttdayp1_res = sst_res
     v = utday_res[0]
 
-    ttday0_res = solar_position(ttday0, 0, 0, 0, 0, 0, delta_t,
-                                0, numthreads, sst=True)
-    ttdayn1_res = solar_position(ttdayn1, 0, 0, 0, 0, 0, delta_t,
-                                 0, numthreads, sst=True)
-    ttdayp1_res = solar_position(ttdayp1, 0, 0, 0, 0, 0, delta_t,
-                                 0, numthreads, sst=True)
     m0 = (ttday0_res[1] - lon - v) / 360
     cos_arg = ((np.sin(np.radians(-0.8333)) - np.sin(np.radians(lat))
                * np.sin(np.radians(ttday0_res[2]))) /
@@ -1211,7 +1576,7 @@ def transit_sunrise_sunset(dates, lat, lon, delta_t, numthreads):
     cos_arg[abs(cos_arg) > 1] = np.nan
     H0 = np.degrees(np.arccos(cos_arg)) % 180
 
-    m = np.empty((3, len(utday)))
+    m = np.empty((3, ) + H0.shape)
     m[0] = m0 % 1
     m[1] = (m[0] - H0 / 360)
     m[2] = (m[0] + H0 / 360)
@@ -1258,10 +1623,16 @@ def transit_sunrise_sunset(dates, lat, lon, delta_t, numthreads):
     S[add_a_day] += 86400
     R[sub_a_day] -= 86400
 
+    utday = utday[:, np.newaxis]
     transit = T + utday
     sunrise = R + utday
     sunset = S + utday
 
+    if scalar_site:
+        transit = transit[:, 0]
+        sunrise = sunrise[:, 0]
+        sunset = sunset[:, 0]
+
     return transit, sunrise, sunset
 
 
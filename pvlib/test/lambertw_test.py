@@ -1,5 +1,8 @@
-from pvlib.lambertw import lambertw
+from pvlib.lambertw import lambertw, lambertw_real, lambertw_log
 import numpy as np
+import pytest
+
+from conftest import requires_scipy, requires_numba
 
 
 def test_answer():
@@ -44,3 +47,59 @@ def test_answer4():
                                              .3517, .5671, .8526,
                                              np.complex(-.0328, 1.5496),
                                              1.0499]), atol=.0001)
+
+
+def test_lambertw_real():
+    z = np.array([0, np.e, -np.exp(-1), 1, 1e300, np.inf, -1, np.nan])
+    w = lambertw_real(z)
+    expected = np.array([0, 1, -1, 0.5671432904097838, 684.2472086297608,
+                         np.inf, np.nan, np.nan])
+    np.testing.assert_allclose(w, expected, rtol=1e-13)
+    assert isinstance(lambertw_real(1.), float)
+
+
+@requires_scipy
+def test_lambertw_real_scipy():
+    from scipy.special import lambertw as scipy_lambertw
+    z = np.concatenate([np.linspace(-np.exp(-1), 3, 1001),
+                        np.logspace(0, 300, 1001)])
+    np.testing.assert_allclose(lambertw_real(z), scipy_lambertw(z).real,
+                               rtol=1e-12, atol=1e-12)
+
+
+def test_lambertw_log():
+    log_z = np.array([-np.inf, -1000, 0, 1, 1000, 1e5, np.inf, np.nan])
+    w = lambertw_log(log_z)
+    np.testing.assert_allclose(w[:4], lambertw_real(np.exp(log_z[:4])),
+                               rtol=1e-13)
+    # w + log(w) = log_z for arguments too large for exp
+    np.testing.assert_allclose(w[4:6] + np.log(w[4:6]), log_z[4:6],
+                               rtol=1e-14)
+    assert w[6] == np.inf
+    assert np.isnan(w[7])
+
+
+@requires_numba
+def test_lambertw_real_numba(monkeypatch):
+    pytest.importorskip('numba')
+    import pvlib.lambertw
+    z = np.linspace(-np.exp(-1), 1e3, 10001)
+    log_z = np.linspace(-50, 1000, 10001)
+    expected = lambertw_real(z), lambertw_log(log_z)
+    monkeypatch.setenv('PVLIB_USE_NUMBA', '1')
+    monkeypatch.setattr(pvlib.lambertw, '_NUMBA_KERNELS', [])
+    assert pvlib.lambertw._get_numba_kernels() is not None
+    np.testing.assert_allclose(lambertw_real(z), expected[0], rtol=1e-13)
+    np.testing.assert_allclose(lambertw_log(log_z), expected[1], rtol=1e-13)
+
+
+@requires_scipy
+def test_lambertw_negative_vectorized():
+    from scipy.special import lambertw as scipy_lambertw
+    z = np.concatenate([np.linspace(-10, 10, 2001),
+                        [-np.exp(-1), np.nan, np.inf]])
+    w = lambertw(z)
+    # every element is returned, including those that converge slowly
+    assert w.shape == z.shape
+    np.testing.assert_allclose(w[:-2], scipy_lambertw(z[:-2]), rtol=1e-7)
+    assert np.isnan(w[-2:]).all()
@@ -1,3 +1,4 @@
+import os
 from collections import OrderedDict
 
 import numpy as np
@@ -203,6 +204,105 @@ def test_lookup_linke_turbidity_nointerp_months():
     assert_series_equal(expected, out)
 
 
+@requires_scipy
+def test_lookup_linke_turbidities():
+    times = pd.date_range(start='2014-04-01', end='2014-07-01',
+                          freq='1M', tz='America/Phoenix')
+    latitudes = [32.2, 40., -33.9]
+    longitudes = [-111, -105.2, 18.4]
+    out = clearsky.lookup_linke_turbidities(times, latitudes, longitudes)
+    assert out.shape == (len(times), len(latitudes))
+    for i, (lat, lon) in enumerate(zip(latitudes, longitudes)):
+        expected = clearsky.lookup_linke_turbidity(times, lat, lon)
+        assert_allclose(expected.values, out[i].values)
+
+
+@requires_scipy
+def test_lookup_linke_turbidities_nointerp():
+    times = pd.date_range(start='2014-04-10', end='2014-07-10',
+                          freq='1M', tz='America/Phoenix')
+    expected = pd.DataFrame(np.array([[2.85, 2.95, 3.]]).T, index=times)
+    out = clearsky.lookup_linke_turbidities(times, [32.2], [-111],
+                                            interp_turbidity=False)
+    assert_frame_equal(expected, out)
+
+
+def test_lookup_linke_turbidities_shape_mismatch():
+    times = pd.date_range(start='2014-04-10', periods=3, freq='1D')
+    with pytest.raises(ValueError):
+        clearsky.lookup_linke_turbidities(times, [32.2, 40.], [-111])
+
+
+@requires_scipy
+def test_load_linke_turbidity_table_cached():
+    table = clearsky.load_linke_turbidity_table()
+    assert table.shape == (2160, 4320, 12)
+    assert clearsky.load_linke_turbidity_table() is table
+
+
+@pytest.fixture
+def linke_mat(tmpdir):
+    import scipy.io
+    table = np.arange(24, dtype=np.uint8).reshape(2, 1, 12)
+    filepath = str(tmpdir.join('LinkeTurbidities.mat'))
+    scipy.io.savemat(filepath, {'LinkeTurbidity': table})
+    return filepath, table
+
+
+@requires_scipy
+def test_load_linke_turbidity_table_no_cache(linke_mat, monkeypatch):
+    filepath, expected = linke_mat
+    monkeypatch.delenv('PVLIB_LINKE_TURBIDITY_CACHE', raising=False)
+    monkeypatch.setattr(clearsky, '_LINKE_TURBIDITY_TABLES', {})
+    table = clearsky.load_linke_turbidity_table(filepath)
+    assert_allclose(table, expected)
+    # nothing is written next to the .mat file
+    assert os.listdir(os.path.dirname(filepath)) == ['LinkeTurbidities.mat']
+
+
+@requires_scipy
+def test_load_linke_turbidity_table_disk_cache(linke_mat, tmpdir,
+                                               monkeypatch):
+    filepath, expected = linke_mat
+    cache_dir = tmpdir.join('cache')
+    monkeypatch.setenv('PVLIB_LINKE_TURBIDITY_CACHE', str(cache_dir))
+    monkeypatch.setattr(clearsky, '_LINKE_TURBIDITY_TABLES', {})
+    table = clearsky.load_linke_turbidity_table(filepath)
+    assert isinstance(table, np.memmap)
+    assert_allclose(table, expected)
+    npy_files = cache_dir.listdir()
+    assert len(npy_files) == 1
+
+    # later loads read the .npy file only
+    monkeypatch.setattr(clearsky, '_LINKE_TURBIDITY_TABLES', {})
+    monkeypatch.setattr(clearsky, '_read_linke_turbidity_mat', None)
+    assert_allclose(clearsky.load_linke_turbidity_table(filepath), expected)
+
+    # a truncated cache file is replaced
+    monkeypatch.undo()
+    monkeypatch.setenv('PVLIB_LINKE_TURBIDITY_CACHE', str(cache_dir))
+    monkeypatch.setattr(clearsky, '_LINKE_TURBIDITY_TABLES', {})
+    npy_files[0].write_binary(npy_files[0].read_binary()[:20])
+    assert_allclose(clearsky.load_linke_turbidity_table(filepath), expected)
+    assert_allclose(np.load(str(npy_files[0])), expected)
+    assert cache_dir.listdir() == npy_files
+
+
+@requires_scipy
+def test_load_linke_turbidity_table_read_only_cache(linke_mat, tmpdir,
+                                                    monkeypatch):
+    filepath, expected = linke_mat
+    # a file where the cache directory should be cannot be written to
+    not_a_dir = tmpdir.join('not_a_dir')
+    not_a_dir.write('')
+    monkeypatch.setenv('PVLIB_LINKE_TURBIDITY_CACHE',
+                       str(not_a_dir.join('cache')))
+    monkeypatch.setattr(clearsky, '_LINKE_TURBIDITY_TABLES', {})
+    with pytest.warns(UserWarning):
+        table = clearsky.load_linke_turbidity_table(filepath)
+    assert_allclose(table, expected)
+
+
 def test_haurwitz():
     tus = Location(32.2, -111, 'US/Arizona', 700)
     times = pd.date_range(start='2014-06-24', end='2014-06-25', freq='3h')
@@ -14,6 +14,7 @@ from pvlib import clearsky
 from pvlib import solarposition
 from pvlib import irradiance
 from pvlib import atmosphere
+from pvlib import tools
 
 from conftest import requires_ephem, requires_numba, needs_numpy_1_10
 
@@ -75,6 +76,21 @@ def test_extraradiation_invalid():
         irradiance.extraradiation(300, method='invalid')
 
 
+def test_extraradiation_cache():
+    times = pd.date_range('20160101', periods=48, freq='1h', tz='US/Arizona')
+    expected = irradiance.extraradiation(times, method='nrel')
+    assert (irradiance._extraradiation_cache.get(tools._hash_key(
+        (times, 1366.1, 'nrel', {}))) is not None)
+    # modifying the result does not modify the cached values
+    expected_values = expected.values.copy()
+    expected[:] = 0
+    out = irradiance.extraradiation(times.copy(), method='nrel')
+    assert_allclose(out, expected_values)
+    assert_allclose(irradiance.extraradiation(times, solar_constant=1367.,
+                                              method='nrel'),
+                    expected_values * 1367. / 1366.1)
+
+
 def test_grounddiffuse_simple_float():
     irradiance.grounddiffuse(40, 900)
 
@@ -162,6 +178,16 @@ def test_perez_arrays():
 
 
 
+def test_perez_coefficients_padded():
+    coeffs = irradiance._get_perez_coefficients_padded('phoenix1988')
+    assert coeffs is irradiance._get_perez_coefficients_padded('phoenix1988')
+    assert not coeffs.flags.writeable
+    F1c, F2c = irradiance._get_perez_coefficients('phoenix1988')
+    assert_allclose(coeffs[:3, :8], F1c.T)
+    assert_allclose(coeffs[3:, :8], F2c.T)
+    assert np.isnan(coeffs[:, 8]).all()
+
+
 def test_liujordan():
     expected = pd.DataFrame(np.
         array([[863.859736967, 653.123094076, 220.65905025]]),
@@ -213,6 +239,55 @@ def test_total_irrad_scalars(model):
     assert np.isnan(np.array(list(total.values()))).sum() == 0
 
 
+@pytest.mark.parametrize('model', ['isotropic', 'klucher',
+                                   'haydavies', 'reindl', 'king', 'perez'])
+def test_total_irrad_grid(model):
+    apparent_zenith = ephem_data['apparent_zenith'].copy()
+    apparent_zenith.iloc[2] = np.nan
+    AM = atmosphere.relativeairmass(apparent_zenith)
+    surface_tilts = np.array([0, 32, 90])
+    surface_azimuths = np.array([180, 135, 270])
+
+    grid = irradiance.total_irrad_grid(
+        surface_tilts, surface_azimuths,
+        apparent_zenith, ephem_data['azimuth'],
+        dni=irrad_data['dni'], ghi=irrad_data['ghi'],
+        dhi=irrad_data['dhi'],
+        dni_extra=dni_et, airmass=AM,
+        model=model,
+        surface_type='urban')
+
+    for k in range(len(surface_tilts)):
+        total = irradiance.total_irrad(
+            surface_tilts[k], surface_azimuths[k],
+            apparent_zenith, ephem_data['azimuth'],
+            dni=irrad_data['dni'], ghi=irrad_data['ghi'],
+            dhi=irrad_data['dhi'],
+            dni_extra=dni_et, airmass=AM,
+            model=model,
+            surface_type='urban')
+        for key in total:
+            assert_allclose(grid[key].iloc[:, k], total[key])
+
+    energy = irradiance.total_irrad_grid(
+        surface_tilts, surface_azimuths,
+        apparent_zenith, ephem_data['azimuth'],
+        dni=irrad_data['dni'], ghi=irrad_data['ghi'],
+        dhi=irrad_data['dhi'],
+        dni_extra=dni_et, airmass=AM,
+        model=model,
+        surface_type='urban', energy=True)
+    # times are 6 hours apart
+    assert_allclose(energy['poa_global'], 6 * grid['poa_global'].sum())
+    assert energy.index.names == ['surface_tilt', 'surface_azimuth']
+
+
+def test_total_irrad_grid_invalid_model():
+    with pytest.raises(ValueError):
+        irradiance.total_irrad_grid(32, 180, 10, 180, dni=1000, ghi=1100,
+                                    dhi=100, model='invalid')
+
+
 def test_globalinplane():
     aoi = irradiance.aoi(40, 180, ephem_data['apparent_zenith'],
                          ephem_data['azimuth'])
@@ -302,6 +377,21 @@ def test_dirint_coeffs():
     assert coeffs[3,2,6,3] == 1.032260
 
 
+def test_dirint_bins():
+    x = np.array([-0.1, 0, 0.239, 0.24, 0.8, 1, 1.1, np.nan])
+    bins = irradiance._dirint_bins(x, irradiance._DIRINT_KT_PRIME_EDGES, 1)
+    assert_allclose(bins, [0, 1, 1, 2, 6, 6, 0, 0])
+
+
+def test_dirint_coeffs_padded():
+    coeffs = irradiance._get_dirint_coeffs_padded()
+    assert coeffs is irradiance._get_dirint_coeffs_padded()
+    assert not coeffs.flags.writeable
+    assert_allclose(coeffs[1:, 1:, 1:, 1:], irradiance._get_dirint_coeffs())
+    assert np.isnan(coeffs[0]).all()
+    assert np.isnan(coeffs[:, :, :, 0]).all()
+
+
 def test_erbs():
     ghi = pd.Series([0, 50, 1000, 1000])
     zenith = pd.Series([120, 85, 10, 10])
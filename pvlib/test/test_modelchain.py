@@ -2,12 +2,14 @@ import numpy as np
 import pandas as pd
 from numpy import nan
 
+import pvlib.irradiance
 from pvlib import modelchain, pvsystem
 from pvlib.modelchain import ModelChain
 from pvlib.pvsystem import PVSystem
 from pvlib.tracking import SingleAxisTracker
 from pvlib.location import Location
 
+from numpy.testing import assert_allclose
 from pandas.util.testing import assert_series_equal, assert_frame_equal
 import pytest
 
@@ -174,6 +176,7 @@ def poadc(mc):
 @pytest.mark.parametrize('dc_model,expected', [
     ('sapm', [180.13735116, -2.00000000e-02]),
     ('singlediode', [179.7178188, -2.00000000e-02]),
+    ('singlediode_table', [179.7178188, -2.00000000e-02]),
     ('pvwatts', [188.400994862, 0]),
     (poadc, [187.361841505, 0])  # user supplied function
 ])
@@ -181,6 +184,7 @@ def test_dc_models(system, cec_dc_snl_ac_system, pvwatts_dc_pvwatts_ac_system,
                    location, dc_model, expected):
 
     dc_systems = {'sapm': system, 'singlediode': cec_dc_snl_ac_system,
+                  'singlediode_table': cec_dc_snl_ac_system,
                   'pvwatts': pvwatts_dc_pvwatts_ac_system,
                   poadc: pvwatts_dc_pvwatts_ac_system}
 
@@ -195,6 +199,21 @@ def test_dc_models(system, cec_dc_snl_ac_system, pvwatts_dc_pvwatts_ac_system,
     assert_series_equal(ac, expected, check_less_precise=2)
 
 
+@requires_scipy
+def test_singlediode_table_kwargs(cec_dc_snl_ac_system, location):
+    table_kwargs = {'rtol': 1e-2, 'temp_range': (-20., 80.)}
+    mc = ModelChain(cec_dc_snl_ac_system, location,
+                    dc_model='singlediode_table', aoi_model='no_loss',
+                    spectral_model='no_loss',
+                    singlediode_table_kwargs=table_kwargs)
+    times = pd.date_range('20160101 1200-0700', periods=2, freq='6H')
+    mc.run_model(times)
+    assert mc.dc_table is cec_dc_snl_ac_system.singlediode_table(
+        **table_kwargs)
+    assert_allclose(mc.dc_table['temp_cell'][[0, -1]], [-20, 80])
+    assert max(mc.dc_table['error'].values()) <= 1e-2
+
+
 def acdc(mc):
     mc.ac = mc.dc
 
@@ -306,6 +325,40 @@ def test_bad_get_orientation():
         modelchain.get_orientation('bad value')
 
 
+def test_optimize_orientation(location):
+    times = pd.date_range('20160101', '20170101', freq='1h', closed='left',
+                          tz='US/Arizona')
+    solar_position = location.get_solarposition(times)
+    weather = location.get_clearsky(times, solar_position=solar_position,
+                                    linke_turbidity=3)
+
+    orientation = modelchain.optimize_orientation(
+        location, weather, solar_position=solar_position)
+    assert list(orientation.keys()) == ['surface_tilt', 'surface_azimuth',
+                                        'poa_global']
+
+    # the optimum is at least as good as the best of a 1 degree grid
+    surface_tilts, surface_azimuths = np.meshgrid(np.arange(25, 41.),
+                                                  np.arange(170, 191.))
+    energy = pvlib.irradiance.total_irrad_grid(
+        surface_tilts.ravel(), surface_azimuths.ravel(),
+        solar_position['apparent_zenith'], solar_position['azimuth'],
+        weather['dni'], weather['ghi'], weather['dhi'],
+        dni_extra=pvlib.irradiance.extraradiation(times),
+        airmass=location.get_airmass(
+            solar_position=solar_position)['airmass_relative'],
+        model='perez', energy=True)['poa_global']
+    best_tilt, best_azimuth = energy.idxmax()
+    assert abs(orientation['surface_tilt'] - best_tilt) < 1
+    assert abs(orientation['surface_azimuth'] - best_azimuth) < 1
+    assert orientation['poa_global'] >= energy.max()
+
+    orientation = modelchain.optimize_orientation(
+        location, weather, solar_position=solar_position,
+        azimuth_range=(90, 150))
+    assert orientation['surface_azimuth'] == 150
+
+
 @requires_scipy
 def test_basic_chain_required(sam_data):
     times = pd.DatetimeIndex(start='20160101 1200-0700',
@@ -2,6 +2,7 @@ import inspect
 import os
 import datetime
 from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 from numpy import nan, array
@@ -16,10 +17,11 @@ from pvlib import pvsystem
 from pvlib import clearsky
 from pvlib import irradiance
 from pvlib import atmosphere
+from pvlib import tools
 from pvlib import solarposition
 from pvlib.location import Location
 
-from conftest import needs_numpy_1_10, requires_scipy
+from conftest import needs_numpy_1_10, requires_scipy, requires_numba
 
 latitude = 32.2
 longitude = -111
@@ -142,6 +144,52 @@ def sam_data():
     return data
 
 
+def test_retrieve_sam_cached(sam_data):
+    modules = pvsystem.retrieve_sam('CECMod')
+    assert_frame_equal(modules, sam_data['cecmod'])
+    # the cached table is not modified through the returned copy
+    modules['Example_Module'] = 0
+    assert_frame_equal(pvsystem.retrieve_sam('cecmod'), sam_data['cecmod'])
+
+
+def test_retrieve_sam_disk_cache(tmpdir, monkeypatch):
+    monkeypatch.setenv('PVLIB_SAM_CACHE', str(tmpdir))
+    monkeypatch.setattr(pvsystem, '_SAM_TABLES', {})
+    expected = pvsystem.retrieve_sam('sandiamod')
+    assert len(tmpdir.listdir()) == 1
+
+    monkeypatch.setattr(pvsystem, '_SAM_TABLES', {})
+    monkeypatch.setattr(pvsystem, '_parse_raw_sam_df', None)
+    assert_frame_equal(pvsystem.retrieve_sam('sandiamod'), expected)
+
+
+def test_retrieve_sam_entry(sam_data):
+    module = pvsystem.retrieve_sam_entry('Example_Module', 'cecmod')
+    assert_series_equal(module, sam_data['cecmod']['Example_Module'])
+
+    inverters = sam_data['cecinverter']
+    inverter = inverters.columns[inverters.columns.duplicated()][0]
+    assert_frame_equal(
+        pvsystem.retrieve_sam_entry(inverter, 'cecinverter'),
+        inverters[inverter])
+
+    with pytest.raises(KeyError):
+        pvsystem.retrieve_sam_entry('not_a_module', 'cecmod')
+    with pytest.raises(ValueError):
+        pvsystem.retrieve_sam_entry('Example_Module')
+
+
+def test_retrieve_sam_entry_copy(sam_data):
+    inverter = 'ABB__MICRO_0_25_I_OUTD_US_208_208V__CEC_2014_'
+    expected = sam_data['cecinverter'][inverter]
+    entry = pvsystem.retrieve_sam_entry(inverter, 'cecinverter')
+    entry['Paco'] = 1.0
+    assert_series_equal(
+        pvsystem.retrieve_sam_entry(inverter, 'cecinverter'), expected)
+    assert_series_equal(pvsystem.retrieve_sam('cecinverter')[inverter],
+                        expected)
+
+
 @pytest.fixture(scope="session")
 def sapm_module_params(sam_data):
     modules = sam_data['sandiamod']
@@ -386,6 +434,54 @@ def test_PVSystem_i_from_v():
 
 
 @requires_scipy
+def _check_singlediode_desoto(cec_module_params, how):
+    # negative irradiance only has a short circuit current
+    poa = pd.Series([-5, 0, 200, 800, 1000],
+                    index=pd.date_range('2015-06-01', periods=5, freq='H'))
+    temp_cell = np.array([25, 20, 25, 40, 65])
+    args = (cec_module_params['alpha_sc'], cec_module_params, 1.121,
+            -0.0002677)
+    out = pvsystem.singlediode_desoto(poa, temp_cell, *args, how=how)
+    expected = pvsystem.singlediode(
+        *pvsystem.calcparams_desoto(poa, temp_cell, *args), method='newton')
+    assert isinstance(out, pd.DataFrame)
+    assert list(out.columns) == ['i_sc', 'v_oc', 'i_mp', 'v_mp', 'p_mp',
+                                 'i_x', 'i_xx']
+    for k in out:
+        assert_allclose(out[k].values, expected[k].values, rtol=1e-10)
+
+    out = pvsystem.singlediode_desoto(800, 40, *args, how=how)
+    assert_allclose(out['p_mp'], expected['p_mp'].iloc[3], rtol=1e-10)
+
+
+def test_singlediode_desoto(cec_module_params):
+    _check_singlediode_desoto(cec_module_params, 'numpy')
+
+
+@requires_numba
+def test_singlediode_desoto_numba(cec_module_params):
+    _check_singlediode_desoto(cec_module_params, 'numba')
+
+
+def test_singlediode_desoto_invalid_how(cec_module_params):
+    with pytest.raises(ValueError):
+        pvsystem.singlediode_desoto(800, 25, cec_module_params['alpha_sc'],
+                                    cec_module_params, 1.121, -0.0002677,
+                                    how='invalid')
+
+
+def test_PVSystem_singlediode_desoto(cec_module_params):
+    module_parameters = cec_module_params.copy()
+    module_parameters['EgRef'] = 1.121
+    module_parameters['dEgdT'] = -0.0002677
+    system = pvsystem.PVSystem(module_parameters=module_parameters)
+    out = system.singlediode_desoto(800, 25)
+    expected = pvsystem.singlediode_desoto(
+        800, 25, module_parameters['alpha_sc'], module_parameters, 1.121,
+        -0.0002677)
+    assert out == expected
+
+
 def test_singlediode_series(cec_module_params):
     times = pd.DatetimeIndex(start='2015-01-01', periods=2, freq='12H')
     poa_data = pd.Series([0, 800], index=times)
@@ -493,6 +589,231 @@ def test_singlediode_series_ivcurve(cec_module_params):
         assert_allclose(expected[k], v, atol=1e-2)
 
 
+@requires_scipy
+@pytest.mark.parametrize('photocurrent', [7, np.linspace(0, 10, 11)])
+def test_singlediode_newton(photocurrent):
+    args = (photocurrent, 6e-7, .1, 20, .5)
+    golden = pvsystem.singlediode(*args)
+    newton = pvsystem.singlediode(*args, method='newton')
+    for k in ['i_sc', 'v_oc', 'i_x']:
+        assert_allclose(golden[k], newton[k])
+    for k in ['i_mp', 'v_mp', 'i_xx']:
+        assert_allclose(golden[k], newton[k], atol=0.02)
+    # golden section stops within 0.01 V, newton is at the maximum
+    assert np.all(newton['p_mp'] >= golden['p_mp'] - 1e-10)
+    assert_allclose(golden['p_mp'], newton['p_mp'], rtol=1e-4, atol=1e-10)
+    assert_allclose(newton['p_mp'], newton['i_mp'] * newton['v_mp'])
+
+
+@requires_scipy
+def test_singlediode_newton_series(cec_module_params):
+    times = pd.date_range(start='2015-06-01', periods=3, freq='6H')
+    poa_data = pd.Series([0, 400, 800], index=times)
+    IL, I0, Rs, Rsh, nNsVth = pvsystem.calcparams_desoto(
+                                         poa_data,
+                                         temp_cell=25,
+                                         alpha_isc=cec_module_params['alpha_sc'],
+                                         module_parameters=cec_module_params,
+                                         EgRef=1.121,
+                                         dEgdT=-0.0002677)
+    out = pvsystem.singlediode(IL, I0, Rs, Rsh, nNsVth, method='newton')
+    assert isinstance(out, pd.DataFrame)
+    assert_allclose(out['p_mp'].values, [np.nan, 22.10090078, 44.48637274],
+                    atol=1e-2)
+
+
+def test_singlediode_invalid_method():
+    with pytest.raises(ValueError):
+        pvsystem.singlediode(7, 6e-7, .1, 20, .5, method='invalid')
+
+
+@requires_scipy
+@pytest.mark.parametrize('chunksize,n_jobs,backend', [
+    (4, 1, 'thread'), (None, 2, 'thread'), (3, 2, 'thread'),
+    (4, 2, 'process')])
+def test_singlediode_chunked(chunksize, n_jobs, backend):
+    index = pd.date_range('2015-06-01', periods=11, freq='H')
+    photocurrent = pd.Series(np.linspace(0, 10, 11), index=index)
+    expected = pvsystem.singlediode(photocurrent, 6e-7, .1, 20, .5)
+    out = pvsystem.singlediode(photocurrent, 6e-7, .1, 20, .5,
+                               chunksize=chunksize, n_jobs=n_jobs,
+                               backend=backend)
+    assert_frame_equal(out, expected)
+
+
+@requires_scipy
+def test_singlediode_chunked_ivcurve():
+    expected = pvsystem.singlediode(np.linspace(0, 10, 11), 6e-7, .1, 20, .5,
+                                    ivcurve_pnts=4, method='newton')
+    out = pvsystem.singlediode(np.linspace(0, 10, 11), 6e-7, .1, 20, .5,
+                               ivcurve_pnts=4, method='newton', chunksize=3)
+    assert list(out.keys()) == list(expected.keys())
+    for k, v in expected.items():
+        assert_allclose(out[k], v)
+
+    out = pvsystem.singlediode(7, 6e-7, .1, 20, .5, chunksize=3)
+    assert_allclose(out['p_mp'], pvsystem.singlediode(7, 6e-7, .1, 20,
+                                                      .5)['p_mp'])
+
+
+@requires_scipy
+def test_singlediode_chunked_in_flight(monkeypatch):
+    in_flight = []
+
+    class CountedResult(object):
+        def __init__(self, result):
+            self.result = result
+
+        def get(self):
+            in_flight.append(in_flight[-1] - 1)
+            return self.result.get()
+
+    class CountingPool(ThreadPool):
+        def apply_async(self, func, args=()):
+            in_flight.append(in_flight[-1] + 1 if in_flight else 1)
+            return CountedResult(ThreadPool.apply_async(self, func, args))
+
+    monkeypatch.setattr(pvsystem, 'ThreadPool', CountingPool)
+    photocurrent = np.linspace(0, 10, 40)
+    expected = pvsystem.singlediode(photocurrent, 6e-7, .1, 20, .5,
+                                    method='newton')
+    out = pvsystem.singlediode(photocurrent, 6e-7, .1, 20, .5,
+                               method='newton', chunksize=2, n_jobs=2)
+    for k, v in expected.items():
+        assert_allclose(out[k], v)
+    # 20 blocks, but at most two per job submitted ahead of the results
+    assert len(in_flight) == 40
+    assert max(in_flight) == 4
+    assert in_flight[-1] == 0
+
+
+def test_singlediode_chunked_invalid_backend():
+    with pytest.raises(ValueError):
+        pvsystem.singlediode(7, 6e-7, .1, 20, .5, chunksize=3,
+                             backend='invalid')
+
+
+@requires_scipy
+def test_singlediode_ivcurves():
+    photocurrent = np.linspace(0, 10, 11)
+    expected = pvsystem.singlediode(photocurrent, 6e-7, .1, 20, .5,
+                                    ivcurve_pnts=5)
+    blocks = list(pvsystem.singlediode_ivcurves(photocurrent, 6e-7, .1, 20,
+                                                .5, ivcurve_pnts=5,
+                                                chunksize=4))
+    assert [len(v) for v, i in blocks] == [4, 4, 3]
+    assert_allclose(np.concatenate([v for v, i in blocks]), expected['v'])
+    assert_allclose(np.concatenate([i for v, i in blocks]), expected['i'])
+
+
+@requires_scipy
+def test_singlediode_ivcurves_knee():
+    (v, i), = pvsystem.singlediode_ivcurves(7, 6e-7, .1, 20, .5,
+                                            ivcurve_pnts=20, spacing='knee')
+    sd = pvsystem.singlediode(7, 6e-7, .1, 20, .5)
+    assert v.shape == (1, 20)
+    assert np.all(np.diff(v) > 0)
+    assert_allclose(v[0, [0, -1]], [0, sd['v_oc']], atol=1e-10)
+    # all points lie on the curve
+    assert_allclose(i, pvsystem.i_from_v(20, .1, .5, v, 6e-7, 7),
+                    atol=1e-10)
+    # the knee spacing interpolates the curve better than even spacing
+    (v_lin, i_lin), = pvsystem.singlediode_ivcurves(7, 6e-7, .1, 20, .5,
+                                                    ivcurve_pnts=20)
+    v_fine = np.linspace(0, sd['v_oc'], 1000)
+    i_fine = pvsystem.i_from_v(20, .1, .5, v_fine, 6e-7, 7)
+    err_knee = np.abs(np.interp(v_fine, v[0], i[0]) - i_fine).max()
+    err_lin = np.abs(np.interp(v_fine, v_lin[0], i_lin[0]) - i_fine).max()
+    assert err_knee < err_lin
+
+
+@requires_scipy
+@pytest.mark.parametrize('ivcurve_pnts', [2, 3, 4, 5])
+def test_singlediode_ivcurves_knee_few_points(ivcurve_pnts):
+    (v, i), = pvsystem.singlediode_ivcurves(7, 6e-7, .1, 20, .5,
+                                            ivcurve_pnts=ivcurve_pnts,
+                                            spacing='knee')
+    sd = pvsystem.singlediode(7, 6e-7, .1, 20, .5)
+    assert v.shape == (1, ivcurve_pnts)
+    assert np.all(np.diff(v) > 0)
+    assert_allclose(v[0, [0, -1]], [0, sd['v_oc']], atol=1e-10)
+    assert_allclose(i, pvsystem.i_from_v(20, .1, .5, v, 6e-7, 7),
+                    atol=1e-10)
+
+    with pytest.raises(ValueError):
+        next(pvsystem.singlediode_ivcurves(7, 6e-7, .1, 20, .5, 1,
+                                           spacing='knee'))
+
+
+def test_singlediode_ivcurves_invalid_spacing():
+    with pytest.raises(ValueError):
+        next(pvsystem.singlediode_ivcurves(7, 6e-7, .1, 20, .5, 10,
+                                           spacing='invalid'))
+
+
+@pytest.fixture()
+def cec_module_table_params(cec_module_params):
+    module_parameters = cec_module_params.copy()
+    module_parameters['EgRef'] = 1.121
+    module_parameters['dEgdT'] = -0.0002677
+    return module_parameters
+
+
+def test_singlediode_table(cec_module_table_params):
+    table = pvsystem.singlediode_table(cec_module_table_params, rtol=1e-3)
+    shape = (len(table['irradiance']), len(table['temp_cell']))
+    assert table['p_mp'].shape == shape
+    assert_allclose(table['irradiance'][[0, -1]], [1, 2000])
+    assert_allclose(table['temp_cell'][[0, -1]], [-50, 120])
+    assert max(table['error'].values()) <= 1e-3
+    assert not table['p_mp'].flags.writeable
+    assert pvsystem.singlediode_table(cec_module_table_params,
+                                      rtol=1e-3) is table
+
+    irrad = np.array([1, 10.5, 200, 999, 2000])
+    temp_cell = np.array([-50, 0, 25, 61.3, 120])
+    out = pvsystem.singlediode_from_table(table, irrad, temp_cell)
+    expected = pvsystem.singlediode(*pvsystem.calcparams_desoto(
+        irrad, temp_cell, cec_module_table_params['alpha_sc'],
+        cec_module_table_params, 1.121, -0.0002677), method='newton')
+    for k in ['i_sc', 'v_oc', 'i_mp', 'v_mp', 'p_mp', 'i_x', 'i_xx']:
+        assert_allclose(out[k], expected[k], rtol=0,
+                        atol=table['error'][k] * np.max(table[k]))
+
+
+def test_singlediode_from_table_outside(cec_module_table_params):
+    table = pvsystem.singlediode_table(cec_module_table_params)
+    times = pd.date_range('2015-06-01', periods=4, freq='6H')
+    irrad = pd.Series([0, 500, 2500, 500], index=times)
+    temp_cell = pd.Series([25, 25, 25, 150], index=times)
+    with pytest.warns(UserWarning):
+        out = pvsystem.singlediode_from_table(table, irrad, temp_cell)
+    assert isinstance(out, pd.DataFrame)
+    assert_allclose(out['p_mp'].isnull().values, [True, False, True, True])
+
+
+def test_singlediode_table_cache_bounded(cec_module_table_params,
+                                        monkeypatch):
+    cache = tools.LRUCache(2**20)
+    monkeypatch.setattr(pvsystem, '_SINGLEDIODE_TABLES', cache)
+    table = pvsystem.singlediode_table(cec_module_table_params, rtol=1e-2)
+    assert pvsystem.singlediode_table(cec_module_table_params,
+                                      rtol=1e-2) is table
+    # room for one table, the least recently used table is dropped
+    cache.max_bytes = cache.nbytes
+    pvsystem.singlediode_table(cec_module_table_params, rtol=1e-2,
+                               temp_range=(-20., 80.))
+    assert len(cache) == 1
+    assert pvsystem.singlediode_table(cec_module_table_params,
+                                      rtol=1e-2) is not table
+
+
+def test_PVSystem_singlediode_table(cec_module_table_params):
+    system = pvsystem.PVSystem(module_parameters=cec_module_table_params)
+    table = system.singlediode_table()
+    assert table is pvsystem.singlediode_table(cec_module_table_params)
+
+
 def test_scale_voltage_current_power(sam_data):
     data = pd.DataFrame(
         np.array([[2, 1.5, 10, 8, 12, 0.5, 1.5]]),
@@ -613,6 +934,120 @@ def test_snlinverter_Pnt_micro(sam_data):
     assert_series_equal(pacs, pd.Series([-0.043000, 132.545914746, 240.000000]))
 
 
+def test_snlinverter_out(sam_data):
+    inverters = sam_data['cecinverter']
+    testinv = 'ABB__MICRO_0_25_I_OUTD_US_208_208V__CEC_2014_'
+    vdcs = pd.Series(np.linspace(0,50,3))
+    idcs = pd.Series(np.linspace(0,11,3))
+    pdcs = idcs * vdcs
+    out = np.zeros(3)
+    pacs = pvsystem.snlinverter(vdcs, pdcs, inverters[testinv], out=out)
+    assert pacs is out
+    assert_allclose(out, [-0.020000, 132.004308, 250.000000], rtol=1e-6)
+    # the input buffers may be reused for the result
+    for name in ('v_dc', 'p_dc'):
+        inputs = {'v_dc': vdcs.values.copy(), 'p_dc': pdcs.values.copy()}
+        out = inputs[name]
+        pacs = pvsystem.snlinverter(inverter=inverters[testinv], out=out,
+                                    **inputs)
+        assert pacs is out
+        assert_allclose(out, [-0.020000, 132.004308, 250.000000], rtol=1e-6)
+
+
+def test_snlinverter_batch_2d(sam_data):
+    inverters = sam_data['cecinverter']
+    names = ['ABB__MICRO_0_25_I_OUTD_US_208_208V__CEC_2014_',
+             'Enphase_Energy__M250_60_2LL_S2x___ZC____NA__208V_208V__CEC_2013_']
+    vdcs = np.linspace(0, 50, 3)[:, np.newaxis]
+    pdcs = vdcs * np.linspace(0, 11, 3)[:, np.newaxis]
+    pacs = pvsystem.snlinverter(vdcs, pdcs, inverters[names].T)
+    expected = np.array([[-0.020000, -0.043000],
+                         [132.004308, 132.545914746],
+                         [250.000000, 240.000000]])
+    assert_allclose(pacs, expected, rtol=1e-6)
+
+
+def test_snlinverter_batch(sam_data):
+    inverters = sam_data['cecinverter']
+    names = ['ABB__MICRO_0_25_I_OUTD_US_208_208V__CEC_2014_',
+             'Enphase_Energy__M250_60_2LL_S2x___ZC____NA__208V_208V__CEC_2013_']
+    times = pd.date_range('2016-06-01', periods=3, freq='30min')
+    vdcs = pd.Series(np.linspace(0, 50, 3), index=times)
+    pdcs = pd.Series(np.linspace(0, 11, 3), index=times) * vdcs
+    pacs = pvsystem.snlinverter_batch(vdcs, pdcs, inverters[names])
+    expected = pd.DataFrame([[-0.020000, -0.043000],
+                             [132.004308, 132.545914746],
+                             [250.000000, 240.000000]],
+                            index=times, columns=names)
+    assert_frame_equal(pacs, expected, check_less_precise=5)
+    # one row per inverter is also accepted
+    pacs = pvsystem.snlinverter_batch(vdcs, pdcs, inverters[names].T)
+    assert_frame_equal(pacs, expected, check_less_precise=5)
+
+    energy = pvsystem.snlinverter_batch(vdcs, pdcs, inverters[names],
+                                        energy=True)
+    assert_series_equal(energy, expected.sum() * 0.5)
+    energy = pvsystem.snlinverter_batch(vdcs.values, pdcs.values,
+                                        inverters[names], energy=True)
+    assert_series_equal(energy, expected.sum())
+
+
+def test_snlinverter_batch_mixed_ndim(sam_data):
+    inverters = sam_data['cecinverter']
+    names = ['ABB__MICRO_0_25_I_OUTD_US_208_208V__CEC_2014_',
+             'Enphase_Energy__M250_60_2LL_S2x___ZC____NA__208V_208V__CEC_2013_']
+    vdcs = np.linspace(0, 50, 3)
+    pdcs = vdcs * np.linspace(0, 11, 3)
+    expected = pvsystem.snlinverter_batch(vdcs, pdcs, inverters[names])
+    # a (time, inverter) voltage with a single power profile
+    pacs = pvsystem.snlinverter_batch(np.column_stack((vdcs, vdcs)), pdcs,
+                                      inverters[names])
+    assert_frame_equal(pacs, expected)
+    pacs = pvsystem.snlinverter_batch(vdcs, np.column_stack((pdcs, pdcs)),
+                                      inverters[names])
+    assert_frame_equal(pacs, expected)
+
+    with pytest.raises(ValueError):
+        pvsystem.snlinverter_batch(vdcs[:2], pdcs, inverters[names])
+    with pytest.raises(ValueError):
+        pvsystem.snlinverter_batch(np.column_stack((vdcs, vdcs, vdcs)), pdcs,
+                                   inverters[names])
+
+
+def test_snlinverter_numba(sam_data, monkeypatch):
+    pytest.importorskip('numba')
+    inverters = sam_data['cecinverter']
+    names = ['ABB__MICRO_0_25_I_OUTD_US_208_208V__CEC_2014_',
+             'Enphase_Energy__M250_60_2LL_S2x___ZC____NA__208V_208V__CEC_2013_']
+    vdcs = np.linspace(0, 50, 11)[:, np.newaxis]
+    pdcs = vdcs * np.linspace(0, 11, 11)[:, np.newaxis]
+    pdcs[3] = np.nan
+    expected = pvsystem.snlinverter(vdcs, pdcs, inverters[names].T)
+    pdc = np.array([np.nan, 0, 50, 100, 120])
+    expected_pvwatts = (pvsystem.pvwatts_dc(pdc, 25, 100, -0.003),
+                        pvsystem.pvwatts_ac(pdc, 100, 0.95))
+
+    monkeypatch.setenv('PVLIB_USE_NUMBA', '1')
+    monkeypatch.setattr(pvsystem, '_POWER_UFUNCS', [])
+    assert pvsystem._get_power_ufuncs() is not None
+    out = np.empty(expected.shape)
+    pacs = pvsystem.snlinverter(vdcs, pdcs, inverters[names].T, out=out)
+    assert pacs is out
+    assert_allclose(pacs, expected, equal_nan=True)
+    assert_allclose(pvsystem.pvwatts_dc(pdc, 25, 100, -0.003),
+                    expected_pvwatts[0], equal_nan=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        assert_allclose(pvsystem.pvwatts_ac(pdc, 100, 0.95),
+                        expected_pvwatts[1], equal_nan=True)
+    pacs = pvsystem.snlinverter(pd.Series(vdcs[:, 0]), pd.Series(pdcs[:, 0]),
+                                inverters[names[0]])
+    assert_series_equal(pacs, pd.Series(expected[:, 0]))
+    g_poa_effective = pd.DataFrame([[0., 500.], [1000., 800.]])
+    pdc = pvsystem.pvwatts_dc(g_poa_effective, 25, 100, -0.003)
+    assert isinstance(pdc, pd.DataFrame)
+    assert_allclose(pdc, g_poa_effective * 0.1)
+
+
 def test_PVSystem_creation():
     pv_system = pvsystem.PVSystem(module='blah', inverter='blarg')
 
@@ -732,6 +1167,12 @@ def test_pvwatts_dc_arrays():
     assert_allclose(expected, out, equal_nan=True)
 
 
+def test_pvwatts_dc_dataframe():
+    g_poa_effective = pd.DataFrame([[0., 500.], [1000., 800.]])
+    pdc = pvsystem.pvwatts_dc(g_poa_effective, 25, 100, -0.003)
+    assert_frame_equal(pdc, g_poa_effective * 0.1)
+
+
 def test_pvwatts_dc_series():
     irrad_trans = pd.Series([np.nan, 900, 900])
     temp_cell = pd.Series([30, np.nan, 30])
@@ -765,6 +1206,35 @@ def test_pvwatts_ac_series():
     assert_series_equal(expected, out)
 
 
+def test_pvwatts_dc_ac_out():
+    g_poa_effective = pd.Series([0, 500, 1000])
+    temp_cell = pd.Series([20, 30, 40])
+    expected = pvsystem.pvwatts_dc(g_poa_effective, temp_cell, 100, -0.003)
+    out = np.empty(3)
+    pdc = pvsystem.pvwatts_dc(g_poa_effective, temp_cell, 100, -0.003,
+                              out=out)
+    assert pdc is out
+    assert_allclose(out, expected)
+    # the input buffers may be reused for the result
+    for name in ('g_poa_effective', 'temp_cell'):
+        inputs = {'g_poa_effective': g_poa_effective.values.astype(float),
+                  'temp_cell': temp_cell.values.astype(float)}
+        out = inputs[name]
+        pdc = pvsystem.pvwatts_dc(pdc0=100, gamma_pdc=-0.003, out=out,
+                                  **inputs)
+        assert pdc is out
+        assert_allclose(out, [0, 49.25, 95.5])
+
+    pdc = np.array([[np.nan], [50], [100]])
+    out = np.empty((3, 1))
+    pac = pvsystem.pvwatts_ac(pdc, 100, 0.95, out=out)
+    assert pac is out
+    assert_allclose(out, [[np.nan], [47.60843624], [95.]], equal_nan=True)
+    pac = pvsystem.pvwatts_ac(pdc, 100, 0.95, out=pdc)
+    assert pac is pdc
+    assert_allclose(pdc, [[np.nan], [47.60843624], [95.]], equal_nan=True)
+
+
 def test_pvwatts_losses_default():
     expected = 14.075660688264469
     out = pvsystem.pvwatts_losses()
@@ -1,3 +1,4 @@
+import os
 import datetime
 
 import numpy as np
@@ -25,6 +26,7 @@ golden_mst = Location(39.742476, -105.1786, 'MST', 1830.14) # no DST issues poss
 golden = Location(39.742476, -105.1786, 'America/Denver', 1830.14) # DST issues possible
 
 times_localized = times.tz_localize(tus.tz)
+tus_pressure = 93000
 
 tol = 5
 
@@ -194,6 +196,23 @@ def test_pyephem_physical_dst(expected_solpos):
     assert_frame_equal(expected_solpos.round(2),
                        ephem_data[expected_solpos.columns].round(2))
 
+@requires_ephem
+def test_pyephem_processes():
+    times = pd.date_range('2003-10-17', periods=48, freq='H',
+                          tz=golden.tz)
+    serial = solarposition.pyephem(times, golden.latitude, golden.longitude,
+                                   pressure=82000, temperature=11)
+    pooled = solarposition.pyephem(times, golden.latitude, golden.longitude,
+                                   pressure=82000, temperature=11,
+                                   processes=2)
+    assert_frame_equal(serial, pooled)
+    # refraction only changes the elevation
+    assert_series_equal(serial['azimuth'], serial['apparent_azimuth'],
+                        check_names=False)
+    day = serial['elevation'] > 0
+    assert (serial['apparent_elevation'][day] >
+            serial['elevation'][day]).all()
+
 @requires_ephem
 def test_calc_time():
     import pytz
@@ -220,6 +239,56 @@ def test_calc_time():
     assert_allclose((az.replace(second=0, microsecond=0) -
                           epoch_dt).total_seconds(), actual_timestamp)
 
+def test_calc_times():
+    # validation from USNO solar position calculator online, as in
+    # test_calc_time, plus a year of windows checked against spa_python
+    lb = pd.DatetimeIndex([datetime.datetime(2014, 10, 10, 7)]
+                          ).tz_localize(tus.tz)
+    ub = lb + pd.Timedelta('3h')
+    alt = solarposition.calc_times(lb, ub, tus.latitude, tus.longitude,
+                                   'elevation', 24.7)
+    az = solarposition.calc_times(lb, ub, tus.latitude, tus.longitude,
+                                  'azimuth', 116.3)
+    expected = pd.Timestamp('2014-10-10 08:30', tz=tus.tz)
+    assert abs(alt[0] - expected) < pd.Timedelta('1min')
+    assert abs(az[0] - expected) < pd.Timedelta('1min')
+
+    days = pd.date_range('2016-01-01', '2016-12-31', freq='D', tz=tus.tz)
+    noon = days + pd.Timedelta('12h')
+    result = solarposition.calc_times(days, noon, tus.latitude,
+                                      tus.longitude, 'apparent_elevation',
+                                      10)
+    assert result.tz == days.tz
+    solpos = solarposition.spa_python(result, tus.latitude, tus.longitude)
+    assert_allclose(solpos['apparent_elevation'], 10, atol=1e-4)
+
+    result = solarposition.calc_times(
+        noon - pd.Timedelta('11h'), noon + pd.Timedelta('11h'),
+        tus.latitude, tus.longitude, 'azimuth', 180)
+    solpos = solarposition.spa_python(result, tus.latitude, tus.longitude)
+    assert_allclose(solpos['azimuth'], 180, atol=1e-4)
+
+
+def test_calc_times_not_bracketed():
+    lb = pd.DatetimeIndex(['2014-10-10 07:00', '2014-10-10 07:00'],
+                          tz=tus.tz)
+    ub = lb + pd.Timedelta('3h')
+    result = solarposition.calc_times(lb, ub, tus.latitude, tus.longitude,
+                                      'elevation', [24.7, 80])
+    assert not pd.isnull(result[0])
+    assert pd.isnull(result[1])
+
+
+def test_calc_times_errors():
+    lb = pd.DatetimeIndex(['2014-10-10 07:00'], tz=tus.tz)
+    with pytest.raises(ValueError):
+        solarposition.calc_times(lb, lb, tus.latitude, tus.longitude,
+                                 'alt', 10)
+    with pytest.raises(ValueError):
+        solarposition.calc_times(lb, lb.append(lb), tus.latitude,
+                                 tus.longitude, 'elevation', 10)
+
+
 @requires_ephem
 def test_earthsun_distance():
     times = pd.date_range(datetime.datetime(2003,10,17,13,30,30),
@@ -228,6 +297,33 @@ def test_earthsun_distance():
     assert_allclose(1, distance, atol=0.1)
 
 
+@requires_ephem
+def test_earthsun_distance_processes():
+    times = pd.date_range('2003-01-01', periods=365, freq='D')
+    serial = solarposition.pyephem_earthsun_distance(times)
+    pooled = solarposition.pyephem_earthsun_distance(times, processes=2)
+    assert_series_equal(serial, pooled)
+    assert_allclose(serial.values,
+                    solarposition.nrel_earthsun_distance(times).values,
+                    rtol=1e-5)
+
+
+@requires_ephem
+def test_earthsun_distance_localized():
+    times = pd.date_range('2003-01-01 12:00', periods=3, freq='6H',
+                          tz='Etc/GMT+7')
+    expected = solarposition.pyephem_earthsun_distance(
+        times.tz_convert('UTC').tz_localize(None))
+    distance = solarposition.pyephem_earthsun_distance(times)
+    assert_allclose(distance.values, expected.values)
+    assert (distance.index == times).all()
+    # the wall clock time would be 7 hours off
+    wall_clock = solarposition.pyephem_earthsun_distance(
+        times.tz_localize(None))
+    assert not np.allclose(distance.values, wall_clock.values, rtol=1e-7,
+                           atol=0)
+
+
 def test_ephemeris_physical(expected_solpos):
     times = pd.date_range(datetime.datetime(2003,10,17,12,30,30),
                           periods=1, freq='D', tz=golden_mst.tz)
@@ -337,3 +433,248 @@ def test_nrel_earthsun_distance():
     expected = pd.Series(np.array([0.983289204601]),
                          index=pd.DatetimeIndex([times, ]))
     assert_series_equal(expected, result)
+
+
+def test_get_solarposition_multi(expected_solpos):
+    times = pd.date_range(datetime.datetime(2003,10,17,12,30,30),
+                          periods=1, freq='D', tz=golden_mst.tz)
+    result = solarposition.get_solarposition_multi(
+        times, [tus.latitude, golden_mst.latitude],
+        [tus.longitude, golden_mst.longitude],
+        pressures=[tus_pressure, 82000], temperature=11, delta_t=67,
+        atmos_refract=0.5667)
+    expected_solpos.index = times
+    for col in expected_solpos.columns:
+        assert_series_equal(expected_solpos[col], result[col][1],
+                            check_names=False)
+
+    expected_tus = solarposition.spa_python(times, tus.latitude,
+                                            tus.longitude,
+                                            pressure=tus_pressure,
+                                            temperature=11, delta_t=67,
+                                            atmos_refract=0.5667)
+    for col in expected_tus.columns:
+        assert_series_equal(expected_tus[col], result[col][0],
+                            check_names=False)
+
+
+def test_get_solarposition_multi_long_format():
+    result = solarposition.get_solarposition_multi(
+        times_localized, [tus.latitude, golden.latitude],
+        [tus.longitude, golden.longitude],
+        altitudes=[tus.altitude, golden.altitude], long_format=True)
+    assert result.index.names == ['time', 'site']
+    assert len(result) == 2 * len(times_localized)
+    wide = solarposition.get_solarposition_multi(
+        times_localized, [tus.latitude, golden.latitude],
+        [tus.longitude, golden.longitude],
+        altitudes=[tus.altitude, golden.altitude])
+    assert_allclose(wide['azimuth'].values.ravel(),
+                    result['azimuth'].values)
+
+
+def test_get_solarposition_multi_shape_mismatch():
+    with pytest.raises(ValueError):
+        solarposition.get_solarposition_multi(times_localized, [32.2, 40],
+                                              [-111])
+
+
+def test_get_sun_rise_set_transit_multi():
+    # several timestamps per day in a timezone offset from UTC
+    times = pd.date_range('2015-06-01', '2015-06-03', freq='6H',
+                          tz=golden_mst.tz)
+    latitudes = [tus.latitude, golden_mst.latitude, -35.0]
+    longitudes = [tus.longitude, golden_mst.longitude, 0.0]
+    result = solarposition.get_sun_rise_set_transit_multi(
+        times, latitudes, longitudes, delta_t=64.0)
+    assert list(result.keys()) == ['transit', 'sunrise', 'sunset']
+    for j in range(len(latitudes)):
+        expected = solarposition.get_sun_rise_set_transit(
+            times, latitudes[j], longitudes[j], delta_t=64.0)
+        for col in expected.columns:
+            assert_series_equal(expected[col], result[col][j],
+                                check_names=False)
+
+    long_result = solarposition.get_sun_rise_set_transit_multi(
+        times, latitudes, longitudes, delta_t=64.0, long_format=True)
+    assert long_result.index.names == ['time', 'site']
+    assert_series_equal(long_result['sunset'].xs(1, level='site'),
+                        result['sunset'][1], check_names=False)
+
+
+def test_get_sun_rise_set_transit_multi_shape_mismatch():
+    with pytest.raises(ValueError):
+        solarposition.get_sun_rise_set_transit_multi(times_localized,
+                                                     [32.2, 40], [-111])
+
+
+def test__spa_python_import_cached():
+    spa_numpy = solarposition._spa_python_import('numpy')
+    assert solarposition._spa_python_import('numpy') is spa_numpy
+    assert not spa_numpy.USE_NUMBA
+    with pytest.raises(ValueError):
+        solarposition._spa_python_import('error this')
+
+
+def test__spa_python_import_environ(monkeypatch):
+    writes = []
+
+    class RecordingEnviron(dict):
+        def __setitem__(self, key, value):
+            if key == 'PVLIB_USE_NUMBA':
+                writes.append(value)
+            dict.__setitem__(self, key, value)
+
+        def __delitem__(self, key):
+            if key == 'PVLIB_USE_NUMBA':
+                writes.append(None)
+            dict.__delitem__(self, key)
+
+    # the engine is chosen without writing to the env variable
+    environ = RecordingEnviron(os.environ, PVLIB_USE_NUMBA='1')
+    monkeypatch.setattr(os, 'environ', environ)
+    monkeypatch.setattr(solarposition, '_SPA_ENGINES', {})
+    spa_numpy = solarposition._spa_python_import('numpy')
+    assert not spa_numpy.USE_NUMBA
+    spa_numba = solarposition._spa_python_import('numba')
+    assert spa_numba._SPA_ENGINE == 'numba'
+    assert writes == []
+
+
+@requires_numba
+def test__spa_python_import_side_by_side(expected_solpos):
+    spa_numpy = solarposition._spa_python_import('numpy')
+    spa_numba = solarposition._spa_python_import('numba')
+    assert spa_numba is not spa_numpy
+    assert solarposition._spa_python_import('numpy') is spa_numpy
+    times = pd.date_range(datetime.datetime(2003,10,17,12,30,30),
+                          periods=1, freq='D', tz=golden_mst.tz)
+    expected_solpos.index = times
+    for how in ['numba', 'numpy', 'numba']:
+        ephem_data = solarposition.spa_python(times, golden_mst.latitude,
+                                              golden_mst.longitude,
+                                              pressure=82000,
+                                              temperature=11, delta_t=67,
+                                              atmos_refract=0.5667,
+                                              how=how, numthreads=1)
+        assert_frame_equal(expected_solpos,
+                           ephem_data[expected_solpos.columns])
+
+
+def test_get_solarposition_nrel_numpy_interp():
+    times = pd.date_range(start='2014-06-24', end='2014-06-26', freq='1min',
+                          tz=tus.tz)
+    expected = solarposition.get_solarposition(times, tus.latitude,
+                                               tus.longitude, tus.altitude)
+    for anchor_freq in ['5min', '15min']:
+        result = solarposition.get_solarposition(
+            times, tus.latitude, tus.longitude, tus.altitude,
+            method='nrel_numpy_interp', anchor_freq=anchor_freq)
+        assert_frame_equal(expected, result[expected.columns],
+                           check_less_precise=5)
+
+
+def test_spa_python_anchor_freq_short(expected_solpos):
+    # fewer times than anchors falls back to the exact calculation
+    times = pd.date_range(datetime.datetime(2003,10,17,12,30,30),
+                          periods=1, freq='D', tz=golden_mst.tz)
+    ephem_data = solarposition.spa_python(times, golden_mst.latitude,
+                                          golden_mst.longitude,
+                                          pressure=82000,
+                                          temperature=11, delta_t=67,
+                                          atmos_refract=0.5667,
+                                          anchor_freq='5min')
+    expected_solpos.index = times
+    assert_frame_equal(expected_solpos, ephem_data[expected_solpos.columns])
+
+
+def test_spa_python_anchor_freq_offset():
+    times = pd.date_range(datetime.datetime(2003, 10, 17, 6),
+                          periods=100, freq='1min', tz='MST')
+    expected = solarposition.spa_python(times, tus.latitude, tus.longitude,
+                                        anchor_freq='5min')
+    offset = pd.tseries.frequencies.to_offset('5min')
+    result = solarposition.spa_python(times, tus.latitude, tus.longitude,
+                                      anchor_freq=offset)
+    assert_frame_equal(expected, result)
+
+
+def test_spa_python_anchor_freq_numba_error():
+    with pytest.raises(ValueError):
+        solarposition.spa_python(times_localized, tus.latitude,
+                                 tus.longitude, how='numba',
+                                 anchor_freq='5min')
+
+
+def test_get_solarposition_cache(tmpdir):
+    cache = solarposition.enable_cache(path=str(tmpdir))
+    try:
+        expected = solarposition.get_solarposition(times_localized,
+                                                   tus.latitude,
+                                                   tus.longitude)
+        assert len(cache._memory) == 1
+        result = solarposition.get_solarposition(times_localized,
+                                                 tus.latitude,
+                                                 tus.longitude)
+        assert_frame_equal(expected, result)
+        # results are copies
+        result['azimuth'] = 0
+        result = solarposition.get_solarposition(times_localized,
+                                                 tus.latitude,
+                                                 tus.longitude)
+        assert_frame_equal(expected, result)
+        # reload from disk
+        cache.clear()
+        result = solarposition.get_solarposition(times_localized,
+                                                 tus.latitude,
+                                                 tus.longitude)
+        assert_frame_equal(expected, result)
+        # different arguments are different entries
+        solarposition.get_solarposition(times_localized, tus.latitude,
+                                        tus.longitude, temperature=20)
+        assert len(cache._memory) == 2
+    finally:
+        solarposition.disable_cache()
+    assert solarposition._solar_position_cache is None
+
+
+def test_get_solarposition_cache_bad_files(tmpdir):
+    cache = solarposition.enable_cache(path=str(tmpdir))
+    try:
+        expected = solarposition.get_solarposition(times_localized,
+                                                   tus.latitude,
+                                                   tus.longitude)
+        filename, = tmpdir.listdir()
+        # a truncated file is calculated again and replaced
+        filename.write_binary(filename.read_binary()[:100])
+        cache.clear()
+        with pytest.warns(UserWarning):
+            result = solarposition.get_solarposition(times_localized,
+                                                     tus.latitude,
+                                                     tus.longitude)
+        assert_frame_equal(expected, result)
+        cache.clear()
+        result = solarposition.get_solarposition(times_localized,
+                                                 tus.latitude,
+                                                 tus.longitude)
+        assert_frame_equal(expected, result)
+        # a directory that cannot be written to only warns
+        not_a_dir = tmpdir.join('not_a_dir')
+        not_a_dir.write('')
+        cache.path = str(not_a_dir)
+        with pytest.warns(UserWarning):
+            result = solarposition.get_solarposition(times_localized,
+                                                     tus.latitude,
+                                                     tus.longitude,
+                                                     temperature=20)
+        assert len(result) == len(times_localized)
+    finally:
+        solarposition.disable_cache()
+
+
+def test_solarposition_cache_filename_version(monkeypatch):
+    cache = solarposition.SolarPositionCache(path=None)
+    cache.path = ''
+    filename = cache._filename(('key',))
+    monkeypatch.setattr(solarposition, '__version__', 'other')
+    assert cache._filename(('key',)) != filename
@@ -1,5 +1,6 @@
 import os
 import datetime as dt
+import threading
 
 try:
     from importlib import reload
@@ -309,6 +310,21 @@ class SpaBase(object):
         assert_almost_equal(sunrise/1e3, result[1]/1e3, 1)
         assert_almost_equal(sunset/1e3, result[2]/1e3, 1)
 
+    def test_transit_sunrise_sunset_multi(self):
+        times = pd.DatetimeIndex([dt.datetime(1996, 7, 5, 0),
+                                  dt.datetime(2004, 12, 4, 0),
+                                  dt.datetime(2015, 8, 2, 0)]
+                                 ).tz_localize('UTC').astype(np.int64)*1.0/10**9
+        lats = np.array([-35.0, 39.0, 39.917, 80.0])
+        lons = np.array([0.0, -105.0, 116.383, 20.0])
+        result = self.spa.transit_sunrise_sunset(times, lats, lons, 64.0, 1)
+        for j in range(len(lats)):
+            expected = self.spa.transit_sunrise_sunset(times, lats[j],
+                                                       lons[j], 64.0, 1)
+            for res, exp in zip(result, expected):
+                assert res.shape == (len(times), len(lats))
+                assert_almost_equal(exp, res[:, j], 6)
+
     def test_earthsun_distance(self):
         times = (pd.date_range('2003-10-17 12:30:30', periods=1, freq='D')
            .tz_localize('MST'))
@@ -316,6 +332,61 @@ class SpaBase(object):
         result = self.spa.earthsun_distance(unixtimes, 64.0, 1)
         assert_almost_equal(R, result, 6)
 
+    def test_heliocentric_longitude_matrix(self):
+        assert_almost_equal(L, self.spa.heliocentric_longitude_matrix(JME), 6)
+
+    def test_heliocentric_latitude_matrix(self):
+        assert_almost_equal(B, self.spa.heliocentric_latitude_matrix(JME), 6)
+
+    def test_heliocentric_radius_vector_matrix(self):
+        assert_almost_equal(R, self.spa.heliocentric_radius_vector_matrix(JME),
+                            6)
+
+    def test_nutation_matrix(self):
+        delta_psi, delta_epsilon = self.spa.nutation_matrix(
+            JCE, X0, X1, X2, X3, X4)
+        assert_almost_equal(dPsi, delta_psi, 6)
+        assert_almost_equal(dEpsilon, delta_epsilon, 6)
+
+    def test_get_chunksize(self):
+        assert self.spa.get_chunksize(100, 4) == 100
+        assert self.spa.get_chunksize(10, 4, min_chunksize=1) == 3
+        assert self.spa.get_chunksize(10**6, 4) == 250000
+        assert self.spa.get_chunksize(0, 4) == 1
+        assert self.spa.get_chunksize(10**6) >= 1
+
+    def test_thread_pool_replaced_while_in_use(self):
+        size = self.spa._THREAD_POOL_SIZE
+        with self.spa._thread_pool(size + 1) as small_pool:
+            with self.spa._thread_pool(size + 2) as large_pool:
+                assert large_pool is not small_pool
+                # the replaced pool is still usable by its borrower
+                assert small_pool.map(abs, [-1, -2]) == [1, 2]
+                assert large_pool.map(abs, [-3]) == [3]
+        with self.spa._thread_pool(1) as pool:
+            assert pool is large_pool
+        assert list(self.spa._THREAD_POOL_USERS) == [large_pool]
+
+    def test_thread_pool_concurrent(self):
+        errors = []
+
+        def borrow(numthreads):
+            try:
+                for _ in range(20):
+                    with self.spa._thread_pool(numthreads) as pool:
+                        assert pool.map(abs, [-1, -2, -3]) == [1, 2, 3]
+            except Exception as err:
+                errors.append(err)
+
+        size = self.spa._THREAD_POOL_SIZE
+        threads = [threading.Thread(target=borrow, args=(size + n, ))
+                   for n in range(1, 9)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+
 class NumpySpaTest(unittest.TestCase, SpaBase):
     """Import spa without compiling to numba then run tests"""
     @classmethod
@@ -332,6 +403,58 @@ class NumpySpaTest(unittest.TestCase, SpaBase):
     def test_julian_day(self):
         assert_almost_equal(JD, self.spa.julian_day(unixtimes)[0], 6)
 
+    def test_periodic_terms_matrix_blocks(self):
+        jme = np.linspace(-0.1, 0.1, 1001).reshape(7, 143)
+        for blocksize in (1, 100, 10000):
+            assert_almost_equal(
+                self.spa.heliocentric_longitude(jme),
+                self.spa.heliocentric_longitude_matrix(jme, blocksize), 8)
+            assert_almost_equal(
+                self.spa.heliocentric_latitude(jme),
+                self.spa.heliocentric_latitude_matrix(jme, blocksize), 12)
+            assert_almost_equal(
+                self.spa.heliocentric_radius_vector(jme),
+                self.spa.heliocentric_radius_vector_matrix(jme, blocksize),
+                12)
+        jce = jme * 10
+        x = (self.spa.mean_elongation(jce), self.spa.mean_anomaly_sun(jce),
+             self.spa.mean_anomaly_moon(jce),
+             self.spa.moon_argument_latitude(jce),
+             self.spa.moon_ascending_longitude(jce))
+        delta_psi, delta_epsilon = self.spa.nutation_matrix(jce, *x,
+                                                            blocksize=100)
+        assert_almost_equal(self.spa.longitude_nutation(jce, *x),
+                            delta_psi, 12)
+        assert_almost_equal(self.spa.obliquity_nutation(jce, *x),
+                            delta_epsilon, 12)
+
+
+    def test_solar_position_interp_error_bounds(self):
+        # the bounds documented in solar_position_interp, checked at 5
+        # second resolution over days around the solstices, including
+        # the tropics where the sun passes through the zenith
+        days = np.array([0, 171, 172, 354, 355])
+        for lat in (-89.5, -66.5, -23.4, 0, 23.44, 45):
+            for day in days:
+                unixtime = (1041379200. + day * 86400 +
+                            np.arange(0, 86400, 5.))
+                exact = np.array(self.spa.solar_position_numpy(
+                    unixtime, lat, lon, elev, pressure, temp, delta_t,
+                    atmos_refract, 1))
+                interp = np.array(self.spa.solar_position_interp(
+                    unixtime, lat, lon, elev, pressure, temp, delta_t,
+                    atmos_refract, 900))
+                error = np.abs(exact - interp)
+                assert error[:4].max() < 3e-7
+                assert error[5].max() < 3e-7
+                azimuth_error = (error[4] + 180) % 360 - 180
+                zenith = exact[1]
+                assert (np.abs(azimuth_error) *
+                        np.sin(np.radians(zenith))).max() < 3e-7
+                up = (zenith > 1) & (zenith < 90)
+                if up.any():
+                    assert np.abs(azimuth_error[up]).max() < 2e-5
+
 
 @pytest.mark.skipif(numba_version_int < 17,
                     reason='Numba not installed or version not >= 0.17.0')
@@ -379,3 +502,36 @@ class NumbaSpaTest(unittest.TestCase, SpaBase):
                 times, lat, lon, elev, pressure, temp, delta_t,
                 atmos_refract, numthreads=8, sst=True)[:3], 5)
 
+    def test_solar_position_chunked(self):
+        result = np.array([theta, theta0, e, e0, Phi])
+        times = np.repeat(unixtimes[0], 3 * self.spa.MIN_CHUNKSIZE + 1)
+        nresult = np.tile(result, (len(times), 1)).T
+        for numthreads in (4, None):
+            assert_almost_equal(
+                nresult
+                , self.spa.solar_position(
+                    times, lat, lon, elev, pressure, temp, delta_t,
+                    atmos_refract, numthreads=numthreads)[:-1], 5)
+
+    def test_solar_position_concurrent_numthreads(self):
+        result = np.array([theta, theta0, e, e0, Phi])
+        times = np.repeat(unixtimes[0], 4 * self.spa.MIN_CHUNKSIZE)
+        nresult = np.tile(result, (len(times), 1)).T
+        results = {}
+
+        def run(numthreads):
+            try:
+                results[numthreads] = self.spa.solar_position(
+                    times, lat, lon, elev, pressure, temp, delta_t,
+                    atmos_refract, numthreads=numthreads)[:-1]
+            except Exception as err:
+                results[numthreads] = err
+
+        threads = [threading.Thread(target=run, args=(n, ))
+                   for n in (2, 3, 4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for numthreads in (2, 3, 4):
+            assert_almost_equal(nresult, results[numthreads], 5)
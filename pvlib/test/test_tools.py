@@ -11,3 +11,84 @@ from pvlib import tools
 def test_build_kwargs(keys, input_dict, expected):
     kwargs = tools._build_kwargs(keys, input_dict)
     assert kwargs == expected
+
+
+def test_LRUCache():
+    cache = tools.LRUCache(max_bytes=10)
+    cache.set('a', 1, 4)
+    cache.set('b', 2, 4)
+    assert cache.get('a') == 1
+    # b is least recently used and is evicted
+    cache.set('c', 3, 4)
+    assert 'b' not in cache
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.nbytes == 8
+    # too large to store
+    cache.set('d', 4, 11)
+    assert 'd' not in cache
+    assert cache.get('d', 'missing') == 'missing'
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test__hash_key():
+    import numpy as np
+    import pandas as pd
+    times = pd.date_range('2016-01-01', periods=3, freq='H')
+    key = tools._hash_key((times, 1.0, np.array([1., 2.]), {'b': 1}))
+    assert key == tools._hash_key((times.copy(), 1.0, np.array([1., 2.]),
+                                   {'b': 1}))
+    assert key != tools._hash_key((times.tz_localize('UTC'), 1.0,
+                                   np.array([1., 2.]), {'b': 1}))
+    hash(key)
+
+
+def test__pandas_to_doy_cache():
+    import numpy as np
+    import pandas as pd
+    times = pd.date_range('2016-12-31 22:00', periods=4, freq='H',
+                          tz='US/Arizona')
+    doy = tools._pandas_to_doy(times)
+    assert list(doy) == [366, 366, 1, 1]
+    key = tools._hash_key(times)
+    assert tools._doy_cache.get(key) is not None
+    # the cached values are not modified through the returned copy
+    assert tools._pandas_to_doy(times.copy()) is not doy
+    if isinstance(doy, np.ndarray):
+        doy[:] = 0
+    assert list(tools._pandas_to_doy(times.copy())) == [366, 366, 1, 1]
+    # the day of year depends on the time zone
+    assert list(tools._pandas_to_doy(times.tz_convert('UTC'))) == [1] * 4
+    assert tools._pandas_to_doy(times[0]) == 366
+
+
+def test__atomic_write(tmpdir):
+    path = str(tmpdir.join('a.txt'))
+
+    def writer(text):
+        def write(tmp_path):
+            assert tmp_path != path
+            assert tmp_path.endswith('.txt')
+            with open(tmp_path, 'w') as f:
+                f.write(text)
+        return write
+
+    tools._atomic_write(path, writer('first'))
+    # replaces an existing file
+    tools._atomic_write(path, writer('second'))
+    with open(path) as f:
+        assert f.read() == 'second'
+
+    def failing(tmp_path):
+        with open(tmp_path, 'w') as f:
+            f.write('partial')
+        raise IOError('disk full')
+
+    with pytest.raises(IOError):
+        tools._atomic_write(path, failing)
+    # the temporary file is removed and the old file is kept
+    assert tmpdir.listdir() == [tmpdir.join('a.txt')]
+    with open(path) as f:
+        assert f.read() == 'second'
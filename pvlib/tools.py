@@ -6,6 +6,10 @@ import logging
 pvl_logger = logging.getLogger('pvlib')
 
 import datetime as dt
+import hashlib
+import os
+import threading
+from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
@@ -182,8 +186,20 @@ def _pandas_to_doy(pd_object):
     Returns
     -------
     dayofyear
+
+    The day of year of DatetimeIndexes is cached in _doy_cache, so
+    functions that are called repeatedly with the same times share it.
     """
-    return pd_object.dayofyear
+    if not isinstance(pd_object, pd.DatetimeIndex):
+        return pd_object.dayofyear
+
+    key = _hash_key(pd_object)
+    doy = _doy_cache.get(key)
+    if doy is None:
+        doy = pd_object.dayofyear
+        _doy_cache.set(key, doy, doy.nbytes)
+    # hand out a copy so that callers cannot modify the cached values
+    return doy.copy()
 
 
 def _doy_to_datetimeindex(doy, epoch_year=2014):
@@ -256,3 +272,113 @@ def _build_kwargs(keys, input_dict):
             pass
 
     return kwargs
+
+
+def _hash_key(value):
+    """
+    Convert value to a hashable, reproducible representation for use in
+    cache keys. Arrays, Series and DatetimeIndexes are reduced to a
+    digest of their contents.
+    """
+    if isinstance(value, pd.DatetimeIndex):
+        return ('DatetimeIndex', str(value.tz),
+                hashlib.sha1(value.asi8.tobytes()).hexdigest())
+    elif isinstance(value, (np.ndarray, pd.Series, pd.Index)):
+        value = np.ascontiguousarray(value)
+        return ('array', str(value.dtype), value.shape,
+                hashlib.sha1(value.tobytes()).hexdigest())
+    elif isinstance(value, dict):
+        return tuple((k, _hash_key(v)) for k, v in sorted(value.items()))
+    elif isinstance(value, (list, tuple)):
+        return tuple(_hash_key(v) for v in value)
+    elif isinstance(value, np.generic):
+        return value.item()
+    else:
+        return value
+
+
+def _atomic_write(path, writer):
+    """
+    Write a file by calling ``writer(tmp_path)`` and renaming the
+    temporary file to path, so that concurrent readers never see a
+    partially written file. The temporary file is removed if writing or
+    renaming fails, and the error is raised.
+    """
+    root, ext = os.path.splitext(path)
+    # keep the extension, np.save and np.savez append one if it is missing
+    tmp_path = '{}.{}-{}.tmp{}'.format(
+        root, os.getpid(), threading.current_thread().ident, ext)
+    try:
+        writer(tmp_path)
+        try:
+            os.replace(tmp_path, path)
+        except AttributeError:
+            # python 2, os.rename does not overwrite on Windows
+            if os.path.exists(path):
+                os.remove(path)
+            os.rename(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        raise
+
+
+class LRUCache(object):
+    """
+    A thread safe least recently used cache with a memory budget.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Entries are evicted, least recently used first, when the total
+        size of the entries exceeds ``max_bytes``. Entries larger than
+        ``max_bytes`` are not stored.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """Get the value for key, marking it as most recently used."""
+        with self._lock:
+            try:
+                value, nbytes = self._entries.pop(key)
+            except KeyError:
+                return default
+            self._entries[key] = (value, nbytes)
+            return value
+
+    def set(self, key, value, nbytes):
+        """Store value, which uses nbytes of memory, under key."""
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+# day of year of recently used DatetimeIndexes, see _pandas_to_doy
+_doy_cache = LRUCache(16 * 2**20)